@@ -0,0 +1,100 @@
+"""Benchmark: server startup with and without a catalogue snapshot.
+
+Registers 1,000 tools and 200 prompts, the way a large generated server would
+at startup, first generating every parameter schema and then using schemas
+saved with `save_catalogue_snapshot`. Also reports the time to list the tools
+and to make the first call to each tool, which builds the validators the
+snapshot skipped at startup.
+
+Usage:
+    uv run python benchmarks/catalogue_snapshot.py
+"""
+
+import asyncio
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Annotated, Any
+
+from pydantic import Field
+
+from FlashMCP import FlashMCP
+
+N_TOOLS = 1_000
+N_PROMPTS = 200
+
+
+def make_tool(i: int) -> Callable[..., Any]:
+    def search(
+        query: Annotated[str, Field(description="Text to search for")],
+        tags: list[str] | None = None,
+        limit: int = 10,
+    ) -> dict[str, Any]:
+        return {"service": i, "query": query, "tags": tags, "limit": limit}
+
+    search.__name__ = f"search_{i}"
+    return search
+
+
+def make_prompt(i: int) -> Callable[..., Any]:
+    def summarize(topic: str, words: int = 100) -> str:
+        return f"Summarize {topic} for service {i} in {words} words"
+
+    summarize.__name__ = f"summarize_{i}"
+    return summarize
+
+
+def build(snapshot: Path | None) -> tuple[FlashMCP, float]:
+    # new functions every time, so nothing is reused from the schema caches
+    tools = [make_tool(i) for i in range(N_TOOLS)]
+    prompts = [make_prompt(i) for i in range(N_PROMPTS)]
+
+    start = time.perf_counter()
+    mcp = FlashMCP(catalogue_snapshot=snapshot)
+    for fn in tools:
+        mcp.tool()(fn)
+    for fn in prompts:
+        mcp.prompt()(fn)
+    return mcp, time.perf_counter() - start
+
+
+async def list_and_call(mcp: FlashMCP) -> tuple[float, float]:
+    start = time.perf_counter()
+    tools = await mcp._mcp_list_tools()
+    listed = time.perf_counter() - start
+    assert len(tools) == N_TOOLS
+
+    start = time.perf_counter()
+    for i in range(N_TOOLS):
+        await mcp._mcp_call_tool(f"search_{i}", {"query": "x"})
+    called = time.perf_counter() - start
+    return listed, called
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "catalogue.json"
+
+        mcp, generated = build(None)
+        generated_list, generated_call = asyncio.run(list_and_call(mcp))
+        mcp.save_catalogue_snapshot(path)
+        size = path.stat().st_size
+
+        mcp, loaded = build(path)
+        loaded_list, loaded_call = asyncio.run(list_and_call(mcp))
+
+    print(f"{N_TOOLS} tools, {N_PROMPTS} prompts ({size / 1024:.0f} KiB snapshot)")
+    print(f"{'':24}{'generated':>12}{'snapshot':>12}")
+    print(f"{'register':24}{generated * 1e3:>9.1f} ms{loaded * 1e3:>9.1f} ms")
+    print(
+        f"{'list tools':24}{generated_list * 1e3:>9.1f} ms{loaded_list * 1e3:>9.1f} ms"
+    )
+    print(
+        f"{'first call of each tool':24}{generated_call * 1e3:>9.1f} ms"
+        f"{loaded_call * 1e3:>9.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
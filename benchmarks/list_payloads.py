@@ -0,0 +1,73 @@
+"""Benchmark: repeated list requests on a server with many tools.
+
+Registers 1,000 tools and compares answering `tools/list` the way every
+request used to be answered (converting each tool to an MCP tool and dumping
+the result) with the cached page, which is only checked against the current
+tools. Also reports the first request after a tool is added, which rebuilds
+the page.
+
+Usage:
+    uv run python benchmarks/list_payloads.py
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+from mcp.types import ListToolsResult, ServerResult
+
+from FlashMCP import FlashMCP
+
+N = 1_000
+REPEATS = 100
+DUMP_KWARGS: dict[str, Any] = {"by_alias": True, "mode": "json", "exclude_none": True}
+
+
+def make_function(i: int) -> Callable[..., Any]:
+    def get_item(item_id: int, verbose: bool = False) -> dict[str, Any]:
+        """Get an item."""
+        return {"service": i, "id": item_id, "verbose": verbose}
+
+    get_item.__name__ = f"get_item_{i}"
+    return get_item
+
+
+async def main() -> None:
+    mcp = FlashMCP()
+    for i in range(N):
+        mcp.tool()(make_function(i))
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        tools = await mcp.get_tools()
+        result = ListToolsResult(
+            tools=[
+                tool.model_copy().to_mcp_tool(name=key) for key, tool in tools.items()
+            ]
+        )
+        ServerResult(result).model_dump(**DUMP_KWARGS)
+    uncached = (time.perf_counter() - start) / REPEATS
+
+    await mcp._mcp_list_tools_page(None)
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        (await mcp._mcp_list_tools_page(None)).model_dump(**DUMP_KWARGS)
+    cached = (time.perf_counter() - start) / REPEATS
+
+    rebuild = 0.0
+    for i in range(REPEATS):
+        mcp.add_tool(lambda: i, name=f"added_{i}")
+        start = time.perf_counter()
+        (await mcp._mcp_list_tools_page(None)).model_dump(**DUMP_KWARGS)
+        rebuild += time.perf_counter() - start
+    rebuild /= REPEATS
+
+    print(f"tools/list with {N} tools, mean of {REPEATS} requests")
+    print(f"  convert and dump every request  {uncached * 1e3:>9.2f} ms")
+    print(f"  cached page                     {cached * 1e3:>9.2f} ms")
+    print(f"  after adding a tool             {rebuild * 1e3:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+"""Benchmark: routing requests to one of many mounted servers.
+
+Mounts 100 servers and resolves the tool name and resource URI of the last
+one, comparing a check of every mounted server in turn, as requests used to
+be routed, with a lookup in the server's mount index.
+
+Usage:
+    uv run python benchmarks/mount_dispatch.py
+"""
+
+import time
+
+from FlashMCP import FlashMCP
+
+MOUNTS = 100
+REPEATS = 10_000
+
+
+def main() -> None:
+    main_app = FlashMCP("MainApp", resource_prefix_format="path")
+    for i in range(MOUNTS):
+        main_app.mount(f"service_{i}", FlashMCP(f"Service{i}"))
+    mounted_servers = list(main_app._mounted_servers.values())
+    index = main_app._mount_index
+
+    name = f"service_{MOUNTS - 1}_get_item_details"
+    uri = f"data://service_{MOUNTS - 1}/items/42"
+
+    def scan_name() -> None:
+        for server in mounted_servers:
+            if server.match_tool(name):
+                server.strip_tool_prefix(name)
+                break
+
+    def scan_uri() -> None:
+        for server in mounted_servers:
+            if server.match_resource(uri):
+                server.strip_resource_prefix(uri)
+                break
+
+    timings = {}
+    for label, resolve in [
+        ("tool name, scan", scan_name),
+        ("tool name, index", lambda: index.resolve_name(name)),
+        ("resource URI, scan", scan_uri),
+        ("resource URI, index", lambda: index.resolve_uri(uri)),
+    ]:
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            resolve()
+        timings[label] = (time.perf_counter() - start) / REPEATS
+
+    print(f"resolving the last of {MOUNTS} mounted servers")
+    for label, elapsed in timings.items():
+        print(f"  {label:<22}{elapsed * 1e6:>9.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark: listing the tools of a server composed from many mounted servers.
+
+Mounts 50 servers with 20 tools each and measures `get_tools()` when nothing
+changed, which returns the cached catalogue, and after one mounted server
+gains a tool, which collects that server's tools again and reuses the prefixed
+tools of the others. The first, uncached listing is the cost every request
+paid before the catalogue was cached.
+
+Usage:
+    uv run python benchmarks/mounted_catalogue.py
+"""
+
+import asyncio
+import time
+
+from FlashMCP import FlashMCP
+
+SERVERS = 50
+TOOLS = 20
+REPEATS = 100
+
+
+async def main() -> None:
+    main_app = FlashMCP("MainApp")
+    servers = []
+    for i in range(SERVERS):
+        server = FlashMCP(f"Server{i}")
+        for j in range(TOOLS):
+            server.add_tool(lambda: None, name=f"tool_{j}")
+        main_app.mount(f"server{i}", server)
+        servers.append(server)
+
+    start = time.perf_counter()
+    await main_app.get_tools()
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        await main_app.get_tools()
+    unchanged = (time.perf_counter() - start) / REPEATS
+
+    changed = 0.0
+    for i in range(REPEATS):
+        servers[i % SERVERS].add_tool(lambda: None, name=f"added_{i}")
+        start = time.perf_counter()
+        await main_app.get_tools()
+        changed += time.perf_counter() - start
+    changed /= REPEATS
+
+    print(f"get_tools() with {SERVERS} mounted servers of {TOOLS} tools")
+    print(f"  first listing             {first * 1e6:>9.1f} us")
+    print(f"  nothing changed           {unchanged * 1e6:>9.1f} us")
+    print(f"  one server changed        {changed * 1e6:>9.1f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
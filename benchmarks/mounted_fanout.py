@@ -0,0 +1,49 @@
+"""Benchmark: listing tools of servers mounted behind slow backends.
+
+Mounts 8 servers whose tool lists take 50 ms each, like proxies of remote
+servers, and compares listing them one after another, as they used to be,
+with the concurrent listing done by `get_tools()`.
+
+Usage:
+    uv run python benchmarks/mounted_fanout.py
+"""
+
+import asyncio
+import time
+
+from FlashMCP import FlashMCP
+
+SERVERS = 8
+DELAY = 0.05
+
+
+class RemoteServer(FlashMCP):
+    async def get_tools(self):
+        # stands in for the round trip to a remote server
+        await asyncio.sleep(DELAY)
+        return await super().get_tools()
+
+
+async def main() -> None:
+    main_app = FlashMCP("MainApp")
+    for i in range(SERVERS):
+        server = RemoteServer(f"Remote{i}")
+        server.add_tool(lambda: None, name="tool")
+        main_app.mount(f"remote{i}", server)
+
+    start = time.perf_counter()
+    for mounted in main_app._mounted_servers.values():
+        await mounted.server.get_tools()
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await main_app.get_tools()
+    concurrent = time.perf_counter() - start
+
+    print(f"get_tools() with {SERVERS} mounted servers taking {DELAY * 1e3:.0f} ms")
+    print(f"  one after another   {sequential * 1e3:>9.1f} ms")
+    print(f"  concurrently        {concurrent * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
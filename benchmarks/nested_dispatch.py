@@ -0,0 +1,43 @@
+"""Benchmark: calling tools through nested mounts.
+
+Builds chains of directly mounted servers up to 8 levels deep and measures
+the time to call a trivial tool on the deepest server through the top one.
+
+Usage:
+    uv run python benchmarks/nested_dispatch.py
+"""
+
+import asyncio
+import time
+
+from FlashMCP import FlashMCP
+
+DEPTHS = [0, 1, 2, 4, 8]
+REPEATS = 2_000
+
+
+def build(depth: int) -> tuple[FlashMCP, str]:
+    leaf = FlashMCP("Leaf")
+    leaf.add_tool(lambda: "ok", name="ping")
+    server, name = leaf, "ping"
+    for level in range(depth):
+        parent = FlashMCP(f"Level{level}")
+        parent.mount(f"l{level}", server)
+        server, name = parent, f"l{level}_{name}"
+    return server, name
+
+
+async def main() -> None:
+    print(f"tool call through nested mounts, mean of {REPEATS} calls")
+    for depth in DEPTHS:
+        server, name = build(depth)
+        await server._mcp_call_tool(name, {})
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            await server._mcp_call_tool(name, {})
+        elapsed = (time.perf_counter() - start) / REPEATS
+        print(f"  depth {depth}  {elapsed * 1e6:>9.1f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
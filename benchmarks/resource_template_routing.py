@@ -0,0 +1,65 @@
+"""Microbenchmark: matching resource URIs against many templates.
+
+Registers 1,000 resource templates shaped like a generated REST API and
+compares trying each template in turn (how URIs were matched before the
+router) with the compiled `TemplateRouter`. Reports the time to build the
+router and the time per lookup for URIs that match the first template, the
+last template, a wildcard template and no template at all.
+
+Usage:
+    uv run python benchmarks/resource_template_routing.py
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from FlashMCP.resources.template import TemplateRouter, match_uri_template
+
+N = 2_000
+
+TEMPLATES = [
+    f"api://service{i // 10}/resource{i % 10}/{{id}}/detail{i % 3}" for i in range(999)
+] + ["files://{path*}"]
+
+URIS = {
+    "first template": "api://service0/resource0/42/detail0",
+    "last api template": "api://service99/resource8/42/detail0",
+    "wildcard template": "files://a/b/c.txt",
+    "no match": "other://nothing/here",
+}
+
+
+def linear_match(uri: str) -> tuple[str, dict[str, str]] | None:
+    for uri_template in TEMPLATES:
+        if params := match_uri_template(uri, uri_template):
+            return uri_template, params
+    return None
+
+
+def timeit(fn: Callable[[], Any], n: int = N) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n
+
+
+def main() -> None:
+    build = timeit(lambda: TemplateRouter(TEMPLATES), n=20)
+    print(f"{len(TEMPLATES)} templates, router built in {build * 1e3:.2f} ms\n")
+
+    router = TemplateRouter(TEMPLATES)
+    print(f"{'uri':<20} {'linear scan':>14} {'router':>14} {'speedup':>9}")
+    for label, uri in URIS.items():
+        assert router.match(uri) == linear_match(uri)
+        linear = timeit(lambda: linear_match(uri), n=N // 20)
+        routed = timeit(lambda: router.match(uri))
+        print(
+            f"{label:<20} {linear * 1e6:>11.1f} us {routed * 1e6:>11.1f} us "
+            f"{linear / routed:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark: server startup with many resource templates.
+
+Registers 1,000 function resource templates, the way a server generated from
+a large API would at startup, and compares the time taken with the work
+`ResourceTemplate.from_function` used to do for every template: building an
+uncached TypeAdapter, generating and compressing its JSON schema and wrapping
+the function with `validate_call`. The schema is still generated at
+registration; the validator is built when a template is first read. Also reports the time to list the templates
+and to read the first resource from each template.
+
+Usage:
+    uv run python benchmarks/resource_template_startup.py
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import TypeAdapter, validate_call
+
+from FlashMCP import FlashMCP
+from FlashMCP.utilities.json_schema import compress_schema
+
+N = 1_000
+
+
+def make_function(i: int) -> Callable[..., Any]:
+    def get_item(item_id: int, verbose: bool = False) -> dict[str, Any]:
+        return {"service": i, "id": item_id, "verbose": verbose}
+
+    get_item.__name__ = f"get_item_{i}"
+    return get_item
+
+
+def eager_registration(fn: Callable[..., Any]) -> None:
+    """The per-template schema and validator work done before they were cached."""
+    compress_schema(TypeAdapter(fn).json_schema())
+    validate_call(fn)
+
+
+def main() -> None:
+    functions = [make_function(i) for i in range(N)]
+
+    start = time.perf_counter()
+    for fn in functions:
+        eager_registration(fn)
+    eager = time.perf_counter() - start
+
+    mcp = FlashMCP()
+    start = time.perf_counter()
+    for i, fn in enumerate(functions):
+        mcp.resource(f"api://service{i}/items/{{item_id}}")(fn)
+    registration = time.perf_counter() - start
+
+    async def list_and_read() -> tuple[float, float]:
+        start = time.perf_counter()
+        templates = await mcp._mcp_list_resource_templates()
+        listed = time.perf_counter() - start
+        assert len(templates) == N
+
+        start = time.perf_counter()
+        for i in range(N):
+            await mcp._mcp_read_resource(f"api://service{i}/items/42")
+        read = time.perf_counter() - start
+        return listed, read
+
+    listed, read = asyncio.run(list_and_read())
+
+    print(f"{N} templates")
+    print(f"  eager schema + validate_call  {eager * 1e3:>9.1f} ms")
+    print(f"  register                      {registration * 1e3:>9.1f} ms")
+    print(f"  list templates                {listed * 1e3:>9.1f} ms")
+    print(f"  first read of each template   {read * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Microbenchmark: serializing large tool results.
+
+Compares the "pretty" and "compact" serialization profiles (and orjson as a
+custom encoder, if it is installed) on a large tabular result, plus returning
+pre-serialized JSON with `RawJSON`. Reports time per conversion and payload
+size.
+
+Usage:
+    uv run python benchmarks/serialization.py
+"""
+
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from FlashMCP.tools.tool import _convert_to_content
+from FlashMCP.utilities.serialization import RawJSON, get_serializer
+
+N = 50
+
+ROWS = [
+    {
+        "id": i,
+        "name": f"item-{i}",
+        "price": i * 1.25,
+        "tags": ["alpha", "beta", "gamma"],
+        "attributes": {"color": "blue", "size": i % 7, "active": i % 2 == 0},
+    }
+    for i in range(10_000)
+]
+
+
+def timeit(label: str, fn: Callable[[], Any]) -> None:
+    fn()
+    start = time.perf_counter()
+    for _ in range(N):
+        content = fn()
+    elapsed = time.perf_counter() - start
+    size = len(content[0].text.encode())
+    print(f"{label:<24} {elapsed / N * 1e3:8.2f} ms/result {size / 1024:10.1f} KiB")
+
+
+def main() -> None:
+    serializers: dict[str, Callable[[Any], str]] = {
+        "pretty": get_serializer("pretty"),
+        "compact": get_serializer("compact"),
+    }
+    try:
+        import orjson  # type: ignore[import-not-found]
+
+        serializers["orjson"] = get_serializer(orjson.dumps)
+    except ImportError:
+        pass
+
+    for label, serializer in serializers.items():
+        timeit(label, lambda s=serializer: _convert_to_content(ROWS, serializer=s))
+
+    payload = json.dumps(ROWS, separators=(",", ":")).encode()
+    timeit("RawJSON passthrough", lambda: _convert_to_content(RawJSON(payload)))
+
+
+if __name__ == "__main__":
+    main()
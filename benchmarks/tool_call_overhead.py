@@ -0,0 +1,72 @@
+"""Microbenchmark: per-call overhead of `Tool.run`.
+
+Compares the precompiled call plan against the reflective path that used to
+run on every invocation (signature inspection, context lookup and TypeAdapter
+cache lookup).
+
+Usage:
+    uv run python benchmarks/tool_call_overhead.py
+"""
+
+import asyncio
+import inspect
+import json
+import time
+
+from FlashMCP.server.context import Context
+from FlashMCP.tools.tool import Tool, _convert_to_content
+from FlashMCP.utilities.tests import temporary_settings
+from FlashMCP.utilities.types import find_kwarg_by_type, get_cached_typeadapter
+
+N = 20_000
+
+
+def add(a: int, b: int, items: list[int] | None = None) -> int:
+    return a + b + sum(items or [])
+
+
+async def reflective_run(tool: Tool, arguments: dict) -> list:
+    """The per-call work `Tool.run` did before call plans existed."""
+    arguments = arguments.copy()
+    find_kwarg_by_type(tool.fn, kwarg_type=Context)
+    signature = inspect.signature(tool.fn)
+    for param_name in tool.parameters["properties"]:
+        arg = arguments.get(param_name, None)
+        if param_name not in signature.parameters:
+            continue
+        if not isinstance(arg, str):
+            continue
+        if signature.parameters[param_name].annotation in (int, float, bool):
+            continue
+        try:
+            arguments[param_name] = json.loads(arg)
+        except json.JSONDecodeError:
+            pass
+    result = get_cached_typeadapter(tool.fn).validate_python(arguments)
+    return _convert_to_content(result)
+
+
+async def timeit(label: str, fn, tool: Tool, arguments: dict) -> None:
+    for _ in range(1000):
+        await fn(tool, arguments)
+    start = time.perf_counter()
+    for _ in range(N):
+        await fn(tool, arguments)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<20} {elapsed / N * 1e6:8.2f} us/call")
+
+
+async def main() -> None:
+    tool = Tool.from_function(add)
+    arguments = {"a": 1, "b": 2, "items": [1, 2, 3]}
+
+    async def planned_run(tool: Tool, arguments: dict) -> list:
+        return await tool.run(arguments)
+
+    with temporary_settings(tool_attempt_parse_json_args=True):
+        await timeit("reflective (before)", reflective_run, tool, arguments)
+        await timeit("call plan (after)", planned_run, tool, arguments)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
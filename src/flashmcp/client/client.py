@@ -1,7 +1,8 @@
 import datetime
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import AsyncExitStack, asynccontextmanager
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
 import anyio
 import mcp.types
@@ -29,6 +30,8 @@ from FlashMCP.utilities.mcp_config import MCPConfig
 
 from .transports import ClientTransport, SessionKwargs, infer_transport
 
+ListResultT = TypeVar("ListResultT", bound=mcp.types.PaginatedResult)
+
 __all__ = [
     "Client",
     "RootsHandler",
@@ -40,6 +43,27 @@ __all__ = [
 ]
 
 
+class _PaginatedRequestParams(mcp.types.RequestParams):
+    cursor: str | None = None
+
+
+class _ListRequest(mcp.types.Request[_PaginatedRequestParams | None, str]):
+    """A list request with its cursor in the params, where the spec puts it.
+
+    The SDK's list requests send the cursor next to the params, where servers
+    following the spec never see it.
+    """
+
+
+def _check_cursor(cursor: str, seen: set[str], kind: str) -> None:
+    # a server that ignores the cursor would return its first page forever
+    if cursor in seen:
+        raise RuntimeError(
+            f"Server returned the cursor {cursor!r} twice while listing {kind}"
+        )
+    seen.add(cursor)
+
+
 class Client:
     """
     MCP client that delegates connection management to a Transport instance.
@@ -107,6 +131,9 @@ class Client:
             progress_handler = default_progress_handler
 
         self._progress_handler = progress_handler
+        self._message_handlers: list[MessageHandler] = []
+        if message_handler is not None:
+            self._message_handlers.append(message_handler)
 
         if isinstance(timeout, int | float):
             timeout = datetime.timedelta(seconds=timeout)
@@ -115,7 +142,7 @@ class Client:
             "sampling_callback": None,
             "list_roots_callback": None,
             "logging_callback": create_log_callback(log_handler),
-            "message_handler": message_handler,
+            "message_handler": self._handle_message,
             "read_timeout_seconds": timeout,
         }
 
@@ -159,6 +186,19 @@ class Client:
         """Check if the client is currently connected."""
         return self._session is not None
 
+    def add_message_handler(self, handler: MessageHandler) -> None:
+        """Add a handler for protocol messages from the server.
+
+        Every message is passed to each handler in turn, starting with the
+        client's `message_handler`. Handlers added while the client is
+        connected receive messages from then on.
+        """
+        self._message_handlers.append(handler)
+
+    async def _handle_message(self, message: Any) -> None:
+        for handler in self._message_handlers:
+            await handler(message)
+
     @asynccontextmanager
     async def _context_manager(self):
         with catch(get_catch_handlers()):
@@ -230,61 +270,146 @@ class Client:
         """Send a roots/list_changed notification."""
         await self.session.send_roots_list_changed()
 
+    async def _iter_pages(
+        self,
+        list_page: Callable[..., Awaitable[mcp.types.PaginatedResult]],
+        result_attr: str,
+        kind: str,
+    ) -> AsyncIterator[Any]:
+        """Iterate over the items of a list, requesting each page with
+        `list_page` as the iteration reaches it."""
+        cursor = None
+        seen: set[str] = set()
+        while True:
+            result = await list_page(cursor=cursor)
+            for item in getattr(result, result_attr):
+                yield item
+            if not (cursor := result.nextCursor):
+                break
+            _check_cursor(cursor, seen, kind)
+
+    async def _list_page(
+        self, method: str, cursor: str | None, result_type: type[ListResultT]
+    ) -> ListResultT:
+        """Send a list request for the page after `cursor`."""
+        params = _PaginatedRequestParams(cursor=cursor) if cursor is not None else None
+        request = _ListRequest(method=method, params=params)
+        # the session only dumps the request, so it need not be a ClientRequest
+        return await self.session.send_request(
+            cast(mcp.types.ClientRequest, request), result_type
+        )
+
     # --- Resources ---
 
-    async def list_resources_mcp(self) -> mcp.types.ListResourcesResult:
+    async def list_resources_mcp(
+        self, cursor: str | None = None
+    ) -> mcp.types.ListResourcesResult:
         """Send a resources/list request and return the complete MCP protocol result.
 
+        Servers may split long lists into pages; this returns a single page.
+
+        Args:
+            cursor (str | None, optional): The `nextCursor` of the previous page, to
+                request the page after it. Defaults to None, for the first page.
+
         Returns:
             mcp.types.ListResourcesResult: The complete response object from the protocol,
-                containing the list of resources and any additional metadata.
+                containing the page of resources, the cursor for the next page (if any)
+                and any additional metadata.
 
         Raises:
             RuntimeError: If called while the client is not connected.
         """
-        result = await self.session.list_resources()
+        result = await self._list_page(
+            "resources/list", cursor, mcp.types.ListResourcesResult
+        )
         return result
 
+    async def iter_resources(self) -> AsyncIterator[mcp.types.Resource]:
+        """Iterate over the resources available on the server.
+
+        Pages are requested as the iteration reaches them, so stopping early
+        avoids fetching the rest of a long list.
+
+        Yields:
+            mcp.types.Resource: The resources, one at a time.
+
+        Raises:
+            RuntimeError: If called while the client is not connected, or if the
+                server returns a cursor it has already returned.
+        """
+        async for resource in self._iter_pages(
+            self.list_resources_mcp, "resources", "resources"
+        ):
+            yield resource
+
     async def list_resources(self) -> list[mcp.types.Resource]:
-        """Retrieve a list of resources available on the server.
+        """Retrieve a list of resources available on the server, requesting every page.
 
         Returns:
             list[mcp.types.Resource]: A list of Resource objects.
 
         Raises:
-            RuntimeError: If called while the client is not connected.
+            RuntimeError: If called while the client is not connected, or if the
+                server returns a cursor it has already returned.
         """
-        result = await self.list_resources_mcp()
-        return result.resources
+        return [resource async for resource in self.iter_resources()]
 
     async def list_resource_templates_mcp(
-        self,
+        self, cursor: str | None = None
     ) -> mcp.types.ListResourceTemplatesResult:
         """Send a resources/listResourceTemplates request and return the complete MCP protocol result.
 
+        Servers may split long lists into pages; this returns a single page.
+
+        Args:
+            cursor (str | None, optional): The `nextCursor` of the previous page, to
+                request the page after it. Defaults to None, for the first page.
+
         Returns:
             mcp.types.ListResourceTemplatesResult: The complete response object from the protocol,
-                containing the list of resource templates and any additional metadata.
+                containing the page of resource templates, the cursor for the next page (if any)
+                and any additional metadata.
 
         Raises:
             RuntimeError: If called while the client is not connected.
         """
-        result = await self.session.list_resource_templates()
+        result = await self._list_page(
+            "resources/templates/list", cursor, mcp.types.ListResourceTemplatesResult
+        )
         return result
 
-    async def list_resource_templates(
+    async def iter_resource_templates(
         self,
-    ) -> list[mcp.types.ResourceTemplate]:
-        """Retrieve a list of resource templates available on the server.
+    ) -> AsyncIterator[mcp.types.ResourceTemplate]:
+        """Iterate over the resource templates available on the server.
+
+        Pages are requested as the iteration reaches them, so stopping early
+        avoids fetching the rest of a long list.
+
+        Yields:
+            mcp.types.ResourceTemplate: The resource templates, one at a time.
+
+        Raises:
+            RuntimeError: If called while the client is not connected, or if the
+                server returns a cursor it has already returned.
+        """
+        async for template in self._iter_pages(
+            self.list_resource_templates_mcp, "resourceTemplates", "resource templates"
+        ):
+            yield template
+
+    async def list_resource_templates(self) -> list[mcp.types.ResourceTemplate]:
+        """Retrieve a list of resource templates available on the server, requesting every page.
 
         Returns:
             list[mcp.types.ResourceTemplate]: A list of ResourceTemplate objects.
 
         Raises:
-            RuntimeError: If called while the client is not connected.
+            RuntimeError: If called while the client is not connected, or if the
+                server returns a cursor it has already returned.
         """
-        result = await self.list_resource_templates_mcp()
-        return result.resourceTemplates
+        return [template async for template in self.iter_resource_templates()]
 
     async def read_resource_mcp(
         self, uri: AnyUrl | str
@@ -326,44 +451,91 @@ class Client:
         result = await self.read_resource_mcp(uri)
         return result.contents
 
-    # async def subscribe_resource(self, uri: AnyUrl | str) -> None:
-    #     """Send a resources/subscribe request."""
-    #     if isinstance(uri, str):
-    #         uri = AnyUrl(uri)
-    #     await self.session.subscribe_resource(uri)
+    async def subscribe_resource(self, uri: AnyUrl | str) -> None:
+        """Send a resources/subscribe request.
+
+        The server sends a `notifications/resources/updated` notification
+        whenever the resource changes, which is passed to the client's
+        `message_handler`.
+
+        Args:
+            uri (AnyUrl | str): The URI of the resource to subscribe to.
+
+        Raises:
+            RuntimeError: If called while the client is not connected.
+        """
+        if isinstance(uri, str):
+            uri = AnyUrl(uri)  # Ensure AnyUrl
+        await self.session.subscribe_resource(uri)
+
+    async def unsubscribe_resource(self, uri: AnyUrl | str) -> None:
+        """Send a resources/unsubscribe request.
+
+        Args:
+            uri (AnyUrl | str): The URI of the resource to unsubscribe from.
 
-    # async def unsubscribe_resource(self, uri: AnyUrl | str) -> None:
-    #     """Send a resources/unsubscribe request."""
-    #     if isinstance(uri, str):
-    #         uri = AnyUrl(uri)
-    #     await self.session.unsubscribe_resource(uri)
+        Raises:
+            RuntimeError: If called while the client is not connected.
+        """
+        if isinstance(uri, str):
+            uri = AnyUrl(uri)  # Ensure AnyUrl
+        await self.session.unsubscribe_resource(uri)
 
     # --- Prompts ---
 
-    async def list_prompts_mcp(self) -> mcp.types.ListPromptsResult:
+    async def list_prompts_mcp(
+        self, cursor: str | None = None
+    ) -> mcp.types.ListPromptsResult:
         """Send a prompts/list request and return the complete MCP protocol result.
 
+        Servers may split long lists into pages; this returns a single page.
+
+        Args:
+            cursor (str | None, optional): The `nextCursor` of the previous page, to
+                request the page after it. Defaults to None, for the first page.
+
         Returns:
             mcp.types.ListPromptsResult: The complete response object from the protocol,
-                containing the list of prompts and any additional metadata.
+                containing the page of prompts, the cursor for the next page (if any)
+                and any additional metadata.
 
         Raises:
             RuntimeError: If called while the client is not connected.
         """
-        result = await self.session.list_prompts()
+        result = await self._list_page(
+            "prompts/list", cursor, mcp.types.ListPromptsResult
+        )
         return result
 
+    async def iter_prompts(self) -> AsyncIterator[mcp.types.Prompt]:
+        """Iterate over the prompts available on the server.
+
+        Pages are requested as the iteration reaches them, so stopping early
+        avoids fetching the rest of a long list.
+
+        Yields:
+            mcp.types.Prompt: The prompts, one at a time.
+
+        Raises:
+            RuntimeError: If called while the client is not connected, or if the
+                server returns a cursor it has already returned.
+        """
+        async for prompt in self._iter_pages(
+            self.list_prompts_mcp, "prompts", "prompts"
+        ):
+            yield prompt
+
     async def list_prompts(self) -> list[mcp.types.Prompt]:
-        """Retrieve a list of prompts available on the server.
+        """Retrieve a list of prompts available on the server, requesting every page.
 
         Returns:
             list[mcp.types.Prompt]: A list of Prompt objects.
 
         Raises:
-            RuntimeError: If called while the client is not connected.
+            RuntimeError: If called while the client is not connected, or if the
+                server returns a cursor it has already returned.
         """
-        result = await self.list_prompts_mcp()
-        return result.prompts
+        return [prompt async for prompt in self.iter_prompts()]
 
     # --- Prompt ---
     async def get_prompt_mcp(
@@ -449,30 +621,55 @@ class Client:
 
     # --- Tools ---
 
-    async def list_tools_mcp(self) -> mcp.types.ListToolsResult:
+    async def list_tools_mcp(
+        self, cursor: str | None = None
+    ) -> mcp.types.ListToolsResult:
         """Send a tools/list request and return the complete MCP protocol result.
 
+        Servers may split long lists into pages; this returns a single page.
+
+        Args:
+            cursor (str | None, optional): The `nextCursor` of the previous page, to
+                request the page after it. Defaults to None, for the first page.
+
         Returns:
             mcp.types.ListToolsResult: The complete response object from the protocol,
-                containing the list of tools and any additional metadata.
+                containing the page of tools, the cursor for the next page (if any)
+                and any additional metadata.
 
         Raises:
             RuntimeError: If called while the client is not connected.
         """
-        result = await self.session.list_tools()
+        result = await self._list_page("tools/list", cursor, mcp.types.ListToolsResult)
         return result
 
+    async def iter_tools(self) -> AsyncIterator[mcp.types.Tool]:
+        """Iterate over the tools available on the server.
+
+        Pages are requested as the iteration reaches them, so stopping early
+        avoids fetching the rest of a long list.
+
+        Yields:
+            mcp.types.Tool: The tools, one at a time.
+
+        Raises:
+            RuntimeError: If called while the client is not connected, or if the
+                server returns a cursor it has already returned.
+        """
+        async for tool in self._iter_pages(self.list_tools_mcp, "tools", "tools"):
+            yield tool
+
     async def list_tools(self) -> list[mcp.types.Tool]:
-        """Retrieve a list of tools available on the server.
+        """Retrieve a list of tools available on the server, requesting every page.
 
         Returns:
             list[mcp.types.Tool]: A list of Tool objects.
 
         Raises:
-            RuntimeError: If called while the client is not connected.
+            RuntimeError: If called while the client is not connected, or if the
+                server returns a cursor it has already returned.
         """
-        result = await self.list_tools_mcp()
-        return result.tools
+        return [tool async for tool in self.iter_tools()]
 
     # --- Call Tool ---
 
@@ -19,6 +19,14 @@ class ToolError(FlashMCPError):
     """Error in tool operations."""
 
 
+class ToolRejectedError(ToolError):
+    """Tool call rejected because the tool is at its concurrency limit."""
+
+
+class ToolTimeoutError(ToolError):
+    """Tool call did not finish within its timeout."""
+
+
 class PromptError(FlashMCPError):
     """Error in prompt operations."""
 
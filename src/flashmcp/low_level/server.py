@@ -0,0 +1,137 @@
+"""A patched low-level MCP server."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any, cast
+
+import mcp.types
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from mcp.server.lowlevel.server import LifespanResultT, NotificationOptions, Server
+from mcp.server.models import InitializationOptions
+from mcp.shared.message import SessionMessage
+from pydantic import PrivateAttr
+from typing_extensions import Self
+
+# how the SDK's sessions dump results before sending them
+_SEND_DUMP_KWARGS = {"by_alias": True, "mode": "json", "exclude_none": True}
+
+
+class SerializedResult(mcp.types.ServerResult):
+    """A server result that is dumped once and reused every time it is sent.
+
+    The dump is shared between responses, so the result must not be modified
+    after it is first sent.
+    """
+
+    _dump: dict[str, Any] | None = PrivateAttr(default=None)
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:  # type: ignore[override]
+        if kwargs != _SEND_DUMP_KWARGS:
+            return super().model_dump(**kwargs)
+        if self._dump is None:
+            self._dump = super().model_dump(**kwargs)
+        return self._dump
+
+
+class _CursorInParams:
+    """Wraps a server's read stream, copying the cursor of list requests from
+    their params, where the spec puts it, to next to the params, where the
+    SDK's request types read it (they drop it from the params)."""
+
+    def __init__(self, stream: MemoryObjectReceiveStream[SessionMessage | Exception]):
+        self._stream = stream
+
+    async def __aenter__(self) -> Self:
+        await self._stream.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> bool | None:
+        return await self._stream.__aexit__(*exc_info)
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> SessionMessage | Exception:
+        message = await self._stream.__anext__()
+        if isinstance(message, SessionMessage):
+            request = message.message.root
+            if (
+                isinstance(request, mcp.types.JSONRPCRequest)
+                and request.params
+                and "cursor" in request.params
+            ):
+                request = request.model_copy(
+                    update={"cursor": request.params["cursor"]}
+                )
+                message = SessionMessage(
+                    message=mcp.types.JSONRPCMessage(request),
+                    metadata=message.metadata,
+                )
+        return message
+
+
+class LowLevelServer(Server[LifespanResultT]):
+    """The SDK's low-level server, advertising resource subscriptions and
+    supporting paginated list requests.
+
+    The SDK always reports `subscribe=False` in the server's resource
+    capabilities, even when a subscribe handler is registered, its list
+    handlers are not given the request's cursor, and its request types drop a
+    cursor sent in the params, as the spec has it.
+    """
+
+    async def run(
+        self,
+        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
+        write_stream: MemoryObjectSendStream[SessionMessage],
+        initialization_options: InitializationOptions,
+        raise_exceptions: bool = False,
+        stateless: bool = False,
+    ):
+        await super().run(
+            cast(
+                MemoryObjectReceiveStream[SessionMessage | Exception],
+                _CursorInParams(read_stream),
+            ),
+            write_stream,
+            initialization_options,
+            raise_exceptions=raise_exceptions,
+            stateless=stateless,
+        )
+
+    def get_capabilities(
+        self,
+        notification_options: NotificationOptions,
+        experimental_capabilities: dict[str, dict[str, Any]],
+    ) -> mcp.types.ServerCapabilities:
+        capabilities = super().get_capabilities(
+            notification_options, experimental_capabilities
+        )
+        if (
+            capabilities.resources is not None
+            and mcp.types.SubscribeRequest in self.request_handlers
+        ):
+            capabilities.resources.subscribe = True
+        return capabilities
+
+    def paginated_list(self, request_type: type[mcp.types.PaginatedRequest]):
+        """Register a handler for a list request, which is called with the
+        request's cursor and returns a page of results."""
+
+        def decorator(
+            func: Callable[
+                [str | None],
+                Awaitable[mcp.types.PaginatedResult | mcp.types.ServerResult],
+            ],
+        ):
+            async def handler(req: mcp.types.PaginatedRequest):
+                # `run` moves a cursor sent in the params next to them
+                cursor = req.cursor or getattr(req.params, "cursor", None)
+                result = await func(cursor)
+                if isinstance(result, mcp.types.ServerResult):
+                    return result
+                return mcp.types.ServerResult(result)  # type: ignore[arg-type]
+
+            self.request_handlers[request_type] = handler
+            return func
+
+        return decorator
@@ -6,19 +6,19 @@ import inspect
 from collections.abc import Awaitable, Callable, Sequence
 from typing import TYPE_CHECKING, Annotated, Any
 
-import pydantic_core
 from mcp.types import EmbeddedResource, ImageContent, PromptMessage, Role, TextContent
 from mcp.types import Prompt as MCPPrompt
 from mcp.types import PromptArgument as MCPPromptArgument
 from pydantic import BaseModel, BeforeValidator, Field, TypeAdapter, validate_call
 
 from FlashMCP.server.dependencies import get_context
-from FlashMCP.utilities.json_schema import compress_schema
+from FlashMCP.utilities.components import FlashMCPComponent
 from FlashMCP.utilities.logging import get_logger
+from FlashMCP.utilities.serialization import RawJSON, get_serializer
 from FlashMCP.utilities.types import (
     _convert_set_defaults,
     find_kwarg_by_type,
-    get_cached_typeadapter,
+    get_cached_parameters_schema,
 )
 
 if TYPE_CHECKING:
@@ -63,7 +63,7 @@ class PromptArgument(BaseModel):
     )
 
 
-class Prompt(BaseModel):
+class Prompt(FlashMCPComponent):
     """A prompt template that can be rendered with parameters."""
 
     name: str = Field(description="Name of the prompt")
@@ -77,6 +77,9 @@ class Prompt(BaseModel):
         None, description="Arguments that can be passed to the prompt"
     )
     fn: Callable[..., PromptResult | Awaitable[PromptResult]]
+    serializer: Callable[[Any], str] | None = Field(
+        None, description="Optional custom serializer for prompt results"
+    )
 
     @classmethod
     def from_function(
@@ -85,6 +88,8 @@ class Prompt(BaseModel):
         name: str | None = None,
         description: str | None = None,
         tags: set[str] | None = None,
+        serializer: Callable[[Any], str] | None = None,
+        parameters: dict[str, Any] | None = None,
     ) -> Prompt:
         """Create a Prompt from a function.
 
@@ -93,6 +98,9 @@ class Prompt(BaseModel):
         - A Message object
         - A dict (converted to a message)
         - A sequence of any of the above
+
+        The prompt's arguments are taken from `parameters`, the JSON schema of
+        the function's parameters, if it is given.
         """
         from FlashMCP.server.context import Context
 
@@ -108,18 +116,11 @@ class Prompt(BaseModel):
             if param.kind == inspect.Parameter.VAR_KEYWORD:
                 raise ValueError("Functions with **kwargs are not supported as prompts")
 
-        type_adapter = get_cached_typeadapter(fn)
-        parameters = type_adapter.json_schema()
-
         # Auto-detect context parameter if not provided
 
-        context_kwarg = find_kwarg_by_type(fn, kwarg_type=Context)
-        if context_kwarg:
-            prune_params = [context_kwarg]
-        else:
-            prune_params = None
-
-        parameters = compress_schema(parameters, prune_params=prune_params)
+        if parameters is None:
+            context_kwarg = find_kwarg_by_type(fn, kwarg_type=Context)
+            parameters = get_cached_parameters_schema(fn, context_kwarg)
 
         # Convert parameters to PromptArguments
         arguments: list[PromptArgument] = []
@@ -142,6 +143,7 @@ class Prompt(BaseModel):
             arguments=arguments,
             fn=fn,
             tags=tags or set(),
+            serializer=serializer,
         )
 
     async def render(
@@ -176,9 +178,12 @@ class Prompt(BaseModel):
                 result = [result]
 
             # Convert result to messages
+            serializer = self.serializer or get_serializer()
             messages: list[PromptMessage] = []
             for msg in result:
                 try:
+                    if isinstance(msg, RawJSON):
+                        msg = msg.text
                     if isinstance(msg, PromptMessage):
                         messages.append(msg)
                     elif isinstance(msg, str):
@@ -189,9 +194,7 @@ class Prompt(BaseModel):
                             )
                         )
                     else:
-                        content = pydantic_core.to_json(
-                            msg, fallback=str, indent=2
-                        ).decode()
+                        content = serializer(msg)
                         messages.append(
                             PromptMessage(
                                 role="user",
@@ -213,6 +216,11 @@ class Prompt(BaseModel):
 
     def to_mcp_prompt(self, **overrides: Any) -> MCPPrompt:
         """Convert the prompt to an MCP prompt."""
+        return self._memoize_mcp_object(
+            overrides, lambda: self._build_mcp_prompt(overrides)
+        )
+
+    def _build_mcp_prompt(self, overrides: dict[str, Any]) -> MCPPrompt:
         arguments = [
             MCPPromptArgument(
                 name=arg.name,
@@ -21,8 +21,13 @@ logger = get_logger(__name__)
 class PromptManager:
     """Manages FlashMCP prompts."""
 
-    def __init__(self, duplicate_behavior: DuplicateBehavior | None = None):
+    def __init__(
+        self,
+        duplicate_behavior: DuplicateBehavior | None = None,
+        serializer: Callable[[Any], str] | None = None,
+    ):
         self._prompts: dict[str, Prompt] = {}
+        self._serializer = serializer
 
         # Default to "warn" if None is provided
         if duplicate_behavior is None:
@@ -50,9 +55,17 @@ class PromptManager:
         name: str | None = None,
         description: str | None = None,
         tags: set[str] | None = None,
+        parameters: dict[str, Any] | None = None,
     ) -> Prompt:
         """Create a prompt from a function."""
-        prompt = Prompt.from_function(fn, name=name, description=description, tags=tags)
+        prompt = Prompt.from_function(
+            fn,
+            name=name,
+            description=description,
+            tags=tags,
+            serializer=self._serializer,
+            parameters=parameters,
+        )
         return self.add_prompt(prompt)
 
     def add_prompt(self, prompt: Prompt, key: str | None = None) -> Prompt:
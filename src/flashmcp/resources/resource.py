@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import abc
-from typing import TYPE_CHECKING, Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar
 
 from mcp.types import Resource as MCPResource
 from pydantic import (
     AnyUrl,
-    BaseModel,
     BeforeValidator,
     ConfigDict,
     Field,
@@ -17,17 +16,22 @@ from pydantic import (
     field_validator,
 )
 
+from FlashMCP.utilities.components import FlashMCPComponent
 from FlashMCP.utilities.types import _convert_set_defaults
 
 if TYPE_CHECKING:
     pass
 
 
-class Resource(BaseModel, abc.ABC):
+class Resource(FlashMCPComponent, abc.ABC):
     """Base class for all resources."""
 
     model_config = ConfigDict(validate_default=True)
 
+    # fields that can be set by a query on the resource's URI when it is read,
+    # e.g. file:///app.log?offset=0&length=1024
+    query_params: ClassVar[frozenset[str]] = frozenset()
+
     uri: Annotated[AnyUrl, UrlConstraints(host_required=False)] = Field(
         default=..., description="URI of the resource"
     )
@@ -43,6 +47,11 @@ class Resource(BaseModel, abc.ABC):
         description="MIME type of the resource content",
         pattern=r"^[a-zA-Z0-9]+/[a-zA-Z0-9\-+.]+$",
     )
+    cache_ttl: float | None = Field(
+        None,
+        description="Seconds to cache the resource's contents for; contents are "
+        "not cached by default",
+    )
 
     @field_validator("mime_type", mode="before")
     @classmethod
@@ -67,6 +76,14 @@ class Resource(BaseModel, abc.ABC):
         """Read the resource content."""
         pass
 
+    async def get_cache_validator(self) -> Any:
+        """Get a value that changes whenever the resource content changes.
+
+        Cached contents are only served while the validator is unchanged. The
+        default of None means cached contents stay valid until they expire.
+        """
+        return None
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Resource):
             return False
@@ -80,4 +97,6 @@ class Resource(BaseModel, abc.ABC):
             "description": self.description,
             "mimeType": self.mime_type,
         }
-        return MCPResource(**kwargs | overrides)
+        return self._memoize_mcp_object(
+            overrides, lambda: MCPResource(**kwargs | overrides)
+        )
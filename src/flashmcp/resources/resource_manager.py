@@ -3,28 +3,48 @@
 import inspect
 from collections.abc import Callable
 from typing import Any
+from urllib.parse import parse_qs
 
-from pydantic import AnyUrl
+import httpx
+from mcp import McpError
+from pydantic import AnyUrl, ValidationError
 
 from FlashMCP.exceptions import NotFoundError, ResourceError
 from FlashMCP.resources import FunctionResource
 from FlashMCP.resources.resource import Resource
 from FlashMCP.resources.template import (
     ResourceTemplate,
-    match_uri_template,
+    TemplateRouter,
 )
 from FlashMCP.settings import DuplicateBehavior
+from FlashMCP.utilities.cache import CacheStats, LRUCache
+from FlashMCP.utilities.http import HttpPool, use_http_pool
 from FlashMCP.utilities.logging import get_logger
+from FlashMCP.utilities.types import find_kwarg_by_type
 
 logger = get_logger(__name__)
 
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 
 class ResourceManager:
     """Manages FlashMCP resources."""
 
-    def __init__(self, duplicate_behavior: DuplicateBehavior | None = None):
+    def __init__(
+        self,
+        duplicate_behavior: DuplicateBehavior | None = None,
+        serializer: Callable[[Any], str] | None = None,
+        cache_max_bytes: int | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         self._resources: dict[str, Resource] = {}
         self._templates: dict[str, ResourceTemplate] = {}
+        self._template_router: TemplateRouter | None = None
+        self._serializer = serializer
+        # (validator, contents) of resources that set `cache_ttl`, keyed by uri
+        self._cache = LRUCache(max_bytes=cache_max_bytes or DEFAULT_CACHE_MAX_BYTES)
+        # connections and revalidatable responses of HTTP resources
+        self.http = HttpPool(http_client)
 
         # Default to "warn" if None is provided
         if duplicate_behavior is None:
@@ -46,6 +66,8 @@ class ResourceManager:
         description: str | None = None,
         mime_type: str | None = None,
         tags: set[str] | None = None,
+        cache_ttl: float | None = None,
+        parameters: dict[str, Any] | None = None,
     ) -> Resource | ResourceTemplate:
         """Add a resource or template to the manager from a function.
 
@@ -56,6 +78,9 @@ class ResourceManager:
             description: Optional description of the resource or template
             mime_type: Optional MIME type for the resource or template
             tags: Optional set of tags for categorizing the resource or template
+            cache_ttl: Optional number of seconds to cache the contents for
+            parameters: Optional JSON schema of the function's parameters, used
+                instead of generating it if a template is added
 
         Returns:
             The added resource or template. If a resource or template with the same URI already exists,
@@ -74,11 +99,11 @@ class ResourceManager:
 
         if has_uri_params or has_func_params:
             return self.add_template_from_fn(
-                fn, uri, name, description, mime_type, tags
+                fn, uri, name, description, mime_type, tags, cache_ttl, parameters
             )
         elif not has_uri_params and not has_func_params:
             return self.add_resource_from_fn(
-                fn, uri, name, description, mime_type, tags
+                fn, uri, name, description, mime_type, tags, cache_ttl
             )
         else:
             raise ValueError(
@@ -94,6 +119,7 @@ class ResourceManager:
         description: str | None = None,
         mime_type: str | None = None,
         tags: set[str] | None = None,
+        cache_ttl: float | None = None,
     ) -> Resource:
         """Add a resource to the manager from a function.
 
@@ -104,6 +130,7 @@ class ResourceManager:
             description: Optional description of the resource
             mime_type: Optional MIME type for the resource
             tags: Optional set of tags for categorizing the resource
+            cache_ttl: Optional number of seconds to cache the contents for
 
         Returns:
             The added resource. If a resource with the same URI already exists,
@@ -116,6 +143,8 @@ class ResourceManager:
             description=description,
             mime_type=mime_type or "text/plain",
             tags=tags or set(),
+            serializer=self._serializer,
+            cache_ttl=cache_ttl,
         )
         return self.add_resource(resource)
 
@@ -136,6 +165,8 @@ class ResourceManager:
                 "resource_name": resource.name,
             },
         )
+        if resource.cache_ttl and isinstance(resource, FunctionResource):
+            self._check_cacheable(resource.fn, resource.name)
         existing = self._resources.get(storage_key)
         if existing:
             if self.duplicate_behavior == "warn":
@@ -148,6 +179,8 @@ class ResourceManager:
             elif self.duplicate_behavior == "ignore":
                 return existing
         self._resources[storage_key] = resource
+        # a new resource may also shadow contents cached from a template
+        self.invalidate_cache(storage_key)
         return resource
 
     def add_template_from_fn(
@@ -158,6 +191,8 @@ class ResourceManager:
         description: str | None = None,
         mime_type: str | None = None,
         tags: set[str] | None = None,
+        cache_ttl: float | None = None,
+        parameters: dict[str, Any] | None = None,
     ) -> ResourceTemplate:
         """Create a template from a function."""
 
@@ -168,6 +203,9 @@ class ResourceManager:
             description=description,
             mime_type=mime_type,
             tags=tags,
+            serializer=self._serializer,
+            cache_ttl=cache_ttl,
+            parameters=parameters,
         )
         return self.add_template(template)
 
@@ -195,6 +233,8 @@ class ResourceManager:
                 "template_name": template.name,
             },
         )
+        if template.cache_ttl:
+            self._check_cacheable(template.fn, template.name)
         existing = self._templates.get(storage_key)
         if existing:
             if self.duplicate_behavior == "warn":
@@ -207,17 +247,49 @@ class ResourceManager:
             elif self.duplicate_behavior == "ignore":
                 return existing
         self._templates[storage_key] = template
+        if existing is None:
+            if self._template_router is not None:
+                self._template_router.add(storage_key)
+        else:
+            # cached contents can not be traced back to the template that
+            # created them, so drop them all
+            self.invalidate_cache()
         return template
 
+    def remove_template(self, key: str) -> None:
+        """Remove a template from the manager.
+
+        Args:
+            key: The key of the template to remove
+
+        Raises:
+            NotFoundError: If the template is not found
+        """
+        if key in self._templates:
+            del self._templates[key]
+            self._template_router = None
+            self.invalidate_cache()
+        else:
+            raise NotFoundError(f"Unknown resource template: {key}")
+
+    def _match_template(
+        self, uri: str
+    ) -> tuple[ResourceTemplate, dict[str, str]] | None:
+        """Find the first-registered template matching a URI, and its params."""
+        router = self._template_router
+        if router is None:
+            router = self._template_router = TemplateRouter(self._templates)
+        if match := router.match(uri):
+            storage_key, params = match
+            return self._templates[storage_key], params
+        return None
+
     def has_resource(self, uri: AnyUrl | str) -> bool:
         """Check if a resource exists."""
         uri_str = str(uri)
-        if uri_str in self._resources:
+        if uri_str in self._resources or self._find_query(uri_str) is not None:
             return True
-        for template_key in self._templates.keys():
-            if match_uri_template(uri_str, template_key):
-                return True
-        return False
+        return self._match_template(uri_str) is not None
 
     async def get_resource(self, uri: AnyUrl | str) -> Resource:
         """Get resource by URI, checking concrete resources first, then templates.
@@ -231,45 +303,154 @@ class ResourceManager:
         uri_str = str(uri)
         logger.debug("Getting resource", extra={"uri": uri_str})
 
-        # First check concrete resources
-        if resource := self._resources.get(uri_str):
-            return resource
-
-        # Then check templates - use the utility function to match against storage keys
-        for storage_key, template in self._templates.items():
-            # Try to match against the storage key (which might be a custom key)
-            if params := match_uri_template(uri_str, storage_key):
-                try:
-                    return await template.create_resource(
-                        uri_str,
-                        params=params,
-                    )
-                except ResourceError as e:
-                    logger.error(f"Error creating resource from template: {e}")
-                    raise e
-                except Exception as e:
-                    logger.error(f"Error creating resource from template: {e}")
-                    raise ValueError(f"Error creating resource from template: {e}")
-
-        raise NotFoundError(f"Unknown resource: {uri_str}")
+        if (resource := await self._resolve_resource(uri_str)) is None:
+            raise NotFoundError(f"Unknown resource: {uri_str}")
+        return resource
 
     async def read_resource(self, uri: AnyUrl | str) -> str | bytes:
         """Read a resource contents."""
         resource = await self.get_resource(uri)
+        return await self._read(resource, uri)
+
+    async def resolve_and_read(
+        self, uri: AnyUrl | str
+    ) -> tuple[str | bytes, str] | None:
+        """Resolve a URI and read the resource it refers to.
+
+        The URI is matched and any template resource is created only once, so
+        this is cheaper than calling `has_resource`, `get_resource` and
+        `read_resource` in turn.
+
+        Args:
+            uri: The URI of the resource to read
+
+        Returns:
+            The resource contents and its mime type, or None if no resource or
+            template matches the URI.
+        """
+        uri_str = str(uri)
+        logger.debug("Reading resource", extra={"uri": uri_str})
 
+        if (resource := await self._resolve_resource(uri_str)) is None:
+            return None
+        return await self._read(resource, uri), resource.mime_type
+
+    async def _resolve_resource(self, uri: str) -> Resource | None:
+        """Find the concrete resource for a URI, or create it from a template."""
+        # First check concrete resources
+        if resource := self._resources.get(uri):
+            return resource
+
+        # Then concrete resources with a query, like file:///app.log?offset=0
+        if resource := self._resolve_query(uri):
+            return resource
+
+        # Then check templates, matching against storage keys (which might be
+        # custom keys)
+        if match := self._match_template(uri):
+            template, params = match
+            try:
+                return await template.create_resource(
+                    uri,
+                    params=params,
+                )
+            except ResourceError as e:
+                logger.error(f"Error creating resource from template: {e}")
+                raise e
+            except Exception as e:
+                logger.error(f"Error creating resource from template: {e}")
+                raise ValueError(f"Error creating resource from template: {e}")
+
+        return None
+
+    def _find_query(self, uri: str) -> tuple[Resource, dict[str, str]] | None:
+        """Find the resource and field values requested by a query on its URI."""
+        base_uri, _, query = uri.partition("?")
+        resource = self._resources.get(base_uri)
+        if resource is None or not resource.query_params:
+            return None
+        params = parse_qs(query)
+        if not params or not params.keys() <= resource.query_params:
+            return None
+        return resource, {name: values[-1] for name, values in params.items()}
+
+    def _resolve_query(self, uri: str) -> Resource | None:
+        """Resolve a URI with a query to a copy of the resource it refers to."""
+        if (found := self._find_query(uri)) is None:
+            return None
+        resource, params = found
         try:
-            return await resource.read()
+            return resource.model_validate(dict(resource) | params | {"uri": uri})
+        except ValidationError as e:
+            raise ResourceError(f"Invalid query for resource {uri!r}") from e
+
+    async def _read(self, resource: Resource, uri: AnyUrl | str) -> str | bytes:
+        try:
+            with use_http_pool(self.http):
+                if resource.cache_ttl:
+                    return await self._read_cached(resource, str(uri))
+                return await resource.read()
 
         # raise ResourceErrors as-is
         except ResourceError as e:
             logger.error(f"Error reading resource {uri!r}: {e}")
             raise e
 
+        # protocol errors, such as an invalid cursor, are sent to the client as-is
+        except McpError:
+            raise
+
         # raise other exceptions as ResourceErrors without revealing internal details
         except Exception as e:
             logger.error(f"Error reading resource {uri!r}: {e}")
             raise ResourceError(f"Error reading resource {uri!r}") from e
 
+    async def _read_cached(self, resource: Resource, uri: str) -> str | bytes:
+        """Read a resource through the content cache.
+
+        Cached contents are returned as-is rather than copied, so every reader
+        shares the same (immutable) str or bytes object.
+        """
+        validator = await resource.get_cache_validator()
+        # contents cached for an earlier version of the resource are dropped
+        entry = self._cache.get(uri, valid=lambda entry: entry[0] == validator)
+        if entry is not LRUCache.NOT_FOUND:
+            return entry[1]
+
+        content = await resource.read()
+        size = len(content) if isinstance(content, bytes) else len(content.encode())
+        # validators are kept with the contents, so large ones (such as
+        # directory listings) count towards the size limit too
+        if validator is not None:
+            size += len(repr(validator))
+        self._cache.set(uri, (validator, content), size=size, ttl=resource.cache_ttl)
+        return content
+
+    def _check_cacheable(self, fn: Callable[..., Any], name: str | None) -> None:
+        from FlashMCP.server.context import Context
+
+        if find_kwarg_by_type(fn, kwarg_type=Context) is not None:
+            raise ValueError(
+                f"Resource {name!r} can not cache its contents because it "
+                "requests a Context"
+            )
+
+    def cache_stats(self) -> CacheStats:
+        """Get resource content cache statistics."""
+        return self._cache.stats
+
+    def invalidate_cache(self, uri: AnyUrl | str | None = None) -> None:
+        """Drop cached resource contents.
+
+        Args:
+            uri: The URI whose cached contents to drop. If not provided, all
+                cached contents are dropped.
+        """
+        if uri is None:
+            self._cache.clear()
+        else:
+            self._cache.delete(str(uri))
+
     def get_resources(self) -> dict[str, Resource]:
         """Get all registered resources, keyed by URI."""
         return self._resources
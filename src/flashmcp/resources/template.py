@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import inspect
 import re
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Iterable
+from functools import lru_cache
 from typing import Annotated, Any
 from urllib.parse import unquote
 
@@ -14,20 +16,21 @@ from pydantic import (
     BaseModel,
     BeforeValidator,
     Field,
-    TypeAdapter,
     field_validator,
-    validate_call,
 )
 
 from FlashMCP.resources.types import FunctionResource, Resource
 from FlashMCP.server.dependencies import get_context
-from FlashMCP.utilities.json_schema import compress_schema
+from FlashMCP.utilities.components import FlashMCPComponent
 from FlashMCP.utilities.types import (
     _convert_set_defaults,
     find_kwarg_by_type,
+    get_cached_parameters_schema,
+    get_cached_typeadapter,
 )
 
 
+@lru_cache(maxsize=5000)
 def build_regex(template: str) -> re.Pattern:
     parts = re.split(r"(\{[^}]+\})", template)
     pattern = ""
@@ -52,13 +55,135 @@ def match_uri_template(uri: str, uri_template: str) -> dict[str, str] | None:
     return None
 
 
+_WILDCARD_PARAM = re.compile(r"\{[^}]+\*\}")
+
+
+class _RouteNode:
+    __slots__ = ("literals", "patterns", "wildcards", "terminal", "min_order", "regex")
+
+    def __init__(self, regex: re.Pattern | None = None):
+        self.literals: dict[str, _RouteNode] = {}
+        self.patterns: dict[str, _RouteNode] = {}
+        # (order, regex for the rest of the URI, uri template), in order
+        self.wildcards: list[tuple[int, re.Pattern, str]] = []
+        self.terminal: tuple[int, str] | None = None
+        self.min_order = sys.maxsize
+        self.regex = regex
+
+
+class TemplateRouter:
+    """Matches URIs against many URI templates without trying each in turn.
+
+    Templates are compiled once into a trie of "/"-separated segments. Literal
+    segments are found with a dict lookup, segments with parameters are
+    matched with a regex compiled for that segment alone, and a segment with a
+    wildcard parameter (`{path*}`) matches the rest of the URI. When several
+    templates match a URI, the one added first wins, exactly as if each
+    template were tried in the order it was added.
+    """
+
+    def __init__(self, uri_templates: Iterable[str] = ()):
+        self._root = _RouteNode()
+        self._count = 0
+        for uri_template in uri_templates:
+            self.add(uri_template)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, uri_template: str) -> None:
+        """Add a template, with lower precedence than those already added."""
+        order = self._count
+        self._count += 1
+
+        node = self._root
+        node.min_order = min(node.min_order, order)
+        segments = uri_template.split("/")
+        for i, segment in enumerate(segments):
+            if _WILDCARD_PARAM.search(segment):
+                rest = "/".join(segments[i:])
+                node.wildcards.append((order, build_regex(rest), uri_template))
+                return
+            if "{" in segment:
+                child = node.patterns.get(segment)
+                if child is None:
+                    child = node.patterns[segment] = _RouteNode(build_regex(segment))
+            else:
+                child = node.literals.get(segment)
+                if child is None:
+                    child = node.literals[segment] = _RouteNode()
+            child.min_order = min(child.min_order, order)
+            node = child
+
+        if node.terminal is None:
+            node.terminal = (order, uri_template)
+
+    def match(self, uri: str) -> tuple[str, dict[str, str]] | None:
+        """Find the template that matches a URI, and the URI's parameters."""
+        best = self._search(self._root, uri.split("/"), 0, {}, None)
+        if best is None:
+            return None
+        _, uri_template, params = best
+        return uri_template, {k: unquote(v) for k, v in params.items()}
+
+    def _search(
+        self,
+        node: _RouteNode,
+        segments: list[str],
+        index: int,
+        params: dict[str, str],
+        best: tuple[int, str, dict[str, str]] | None,
+    ) -> tuple[int, str, dict[str, str]] | None:
+        # nothing under this node can beat a template that was added earlier
+        if best is not None and node.min_order >= best[0]:
+            return best
+
+        if index == len(segments):
+            if node.terminal is not None and (
+                best is None or node.terminal[0] < best[0]
+            ):
+                best = (node.terminal[0], node.terminal[1], params)
+        else:
+            segment = segments[index]
+            if (child := node.literals.get(segment)) is not None:
+                best = self._search(child, segments, index + 1, params, best)
+            for child in node.patterns.values():
+                if best is not None and child.min_order >= best[0]:
+                    continue
+                if match := child.regex.match(segment):  # type: ignore[union-attr]
+                    best = self._search(
+                        child,
+                        segments,
+                        index + 1,
+                        params | match.groupdict(),
+                        best,
+                    )
+
+        if node.wildcards:
+            rest = "/".join(segments[index:])
+            for order, regex, uri_template in node.wildcards:
+                if best is not None and order >= best[0]:
+                    break
+                if match := regex.match(rest):
+                    best = (order, uri_template, params | match.groupdict())
+                    break
+
+        return best
+
+
 class MyModel(BaseModel):
     key: str
     value: int
 
 
-class ResourceTemplate(BaseModel):
-    """A template for dynamically creating resources."""
+class ResourceTemplate(FlashMCPComponent):
+    """A template for dynamically creating resources.
+
+    The JSON schema of the function's parameters is shared with any tool or
+    prompt made from the same function. The validator that casts URI
+    parameters to the types it expects is only built when the template first
+    creates a resource.
+    """
 
     uri_template: str = Field(
         description="URI template with parameters (e.g. weather://{city}/current)"
@@ -72,6 +197,14 @@ class ResourceTemplate(BaseModel):
         default="text/plain", description="MIME type of the resource content"
     )
     fn: Callable[..., Any]
+    serializer: Callable[[Any], str] | None = Field(
+        None, description="Optional custom serializer for resource results"
+    )
+    cache_ttl: float | None = Field(
+        None,
+        description="Seconds to cache the contents of created resources for; "
+        "contents are not cached by default",
+    )
     parameters: dict[str, Any] = Field(
         description="JSON schema for function parameters"
     )
@@ -93,6 +226,9 @@ class ResourceTemplate(BaseModel):
         description: str | None = None,
         mime_type: str | None = None,
         tags: set[str] | None = None,
+        serializer: Callable[[Any], str] | None = None,
+        cache_ttl: float | None = None,
+        parameters: dict[str, Any] | None = None,
     ) -> ResourceTemplate:
         """Create a template from a function."""
         from FlashMCP.server.context import Context
@@ -148,15 +284,8 @@ class ResourceTemplate(BaseModel):
                     f"URI parameters {uri_params} must be a subset of the function arguments: {func_params}"
                 )
 
-        # Get schema from TypeAdapter - will fail if function isn't properly typed
-        parameters = TypeAdapter(fn).json_schema()
-
-        # compress the schema
-        prune_params = [context_kwarg] if context_kwarg else None
-        parameters = compress_schema(parameters, prune_params=prune_params)
-
-        # ensure the arguments are properly cast
-        fn = validate_call(fn)
+        if parameters is None:
+            parameters = get_cached_parameters_schema(fn, context_kwarg)
 
         return cls(
             uri_template=uri_template,
@@ -164,8 +293,10 @@ class ResourceTemplate(BaseModel):
             description=description or fn.__doc__ or "",
             mime_type=mime_type or "text/plain",
             fn=fn,
-            parameters=parameters,
             tags=tags or set(),
+            serializer=serializer,
+            cache_ttl=cache_ttl,
+            parameters=parameters,
         )
 
     def matches(self, uri: str) -> dict[str, Any] | None:
@@ -183,8 +314,9 @@ class ResourceTemplate(BaseModel):
             kwargs[context_kwarg] = get_context()
 
         async def resource_read_fn() -> str | bytes:
-            # Call function and check if result is a coroutine
-            result = self.fn(**kwargs)
+            # Call function (casting the arguments to the types it expects) and
+            # check if result is a coroutine
+            result = get_cached_typeadapter(self.fn).validate_python(kwargs)
             if inspect.iscoroutine(result):
                 result = await result
             return result
@@ -196,6 +328,8 @@ class ResourceTemplate(BaseModel):
             mime_type=self.mime_type,
             fn=resource_read_fn,
             tags=self.tags,
+            serializer=self.serializer,
+            cache_ttl=self.cache_ttl,
         )
 
     def __eq__(self, other: object) -> bool:
@@ -211,4 +345,6 @@ class ResourceTemplate(BaseModel):
             "description": self.description,
             "mimeType": self.mime_type,
         }
-        return MCPResourceTemplate(**kwargs | overrides)
+        return self._memoize_mcp_object(
+            overrides, lambda: MCPResourceTemplate(**kwargs | overrides)
+        )
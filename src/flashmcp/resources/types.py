@@ -2,23 +2,30 @@
 
 from __future__ import annotations
 
+import bisect
+import fnmatch
 import inspect
-import json
-from collections.abc import Callable
-from pathlib import Path
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path, PurePath
 from typing import Any
 
 import anyio
 import anyio.to_thread
-import httpx
 import pydantic.json
-import pydantic_core
+from mcp import McpError
 from pydantic import Field, ValidationInfo
 
 from FlashMCP.exceptions import ResourceError
 from FlashMCP.resources.resource import Resource
 from FlashMCP.server.dependencies import get_context
+from FlashMCP.utilities.cache import LRUCache
+from FlashMCP.utilities.http import HttpPool, current_http_pool
 from FlashMCP.utilities.logging import get_logger
+from FlashMCP.utilities.pagination import decode_cursor, encode_cursor
+from FlashMCP.utilities.serialization import RawJSON, get_serializer
 from FlashMCP.utilities.types import find_kwarg_by_type
 
 logger = get_logger(__name__)
@@ -35,12 +42,24 @@ class TextResource(Resource):
 
 
 class BinaryResource(Resource):
-    """A resource that reads from bytes."""
+    """A resource that reads from bytes.
+
+    Set offset and/or length to read only a range of the data.
+    """
+
+    query_params = frozenset({"offset", "length"})
 
     data: bytes = Field(description="Binary content of the resource")
+    offset: int = Field(default=0, ge=0, description="Offset of the range to read")
+    length: int | None = Field(
+        default=None, ge=0, description="Length of the range to read"
+    )
 
     async def read(self) -> bytes:
         """Read the binary content."""
+        if self.offset or self.length is not None:
+            end = None if self.length is None else self.offset + self.length
+            return self.data[self.offset : end]
         return self.data
 
 
@@ -58,6 +77,9 @@ class FunctionResource(Resource):
     """
 
     fn: Callable[[], Any]
+    serializer: Callable[[Any], str] | None = Field(
+        None, description="Optional custom serializer for resource results"
+    )
 
     async def read(self) -> str | bytes:
         """Read the resource by calling the wrapped function."""
@@ -78,21 +100,30 @@ class FunctionResource(Resource):
             return result
         elif isinstance(result, str):
             return result
+        elif isinstance(result, RawJSON):
+            return result.text
         else:
-            return pydantic_core.to_json(result, fallback=str, indent=2).decode()
+            return (self.serializer or get_serializer())(result)
 
 
 class FileResource(Resource):
     """A resource that reads from a file.
 
-    Set is_binary=True to read file as binary data instead of text.
+    Set is_binary=True to read file as binary data instead of text. Set offset
+    and/or length to read only a range of the file's bytes.
     """
 
+    query_params = frozenset({"offset", "length"})
+
     path: Path = Field(description="Path to the file")
     is_binary: bool = Field(
         default=False,
         description="Whether to read the file as binary data",
     )
+    offset: int = Field(default=0, ge=0, description="Offset of the range to read")
+    length: int | None = Field(
+        default=None, ge=0, description="Length of the range to read"
+    )
     mime_type: str = Field(
         default="text/plain",
         description="MIME type of the resource content",
@@ -115,18 +146,41 @@ class FileResource(Resource):
         mime_type = info.data.get("mime_type", "text/plain")
         return not mime_type.startswith("text/")
 
+    async def get_cache_validator(self) -> tuple[int, int]:
+        """Get the file's modification time and size."""
+        try:
+            stat = await anyio.to_thread.run_sync(self.path.stat)
+        except Exception as e:
+            raise ResourceError(f"Error reading file {self.path}") from e
+        return stat.st_mtime_ns, stat.st_size
+
     async def read(self) -> str | bytes:
         """Read the file content."""
         try:
+            if self.offset or self.length is not None:
+                data = await anyio.to_thread.run_sync(self._read_range)
+                # a range may split a multi-byte character at either end
+                return data if self.is_binary else data.decode(errors="replace")
             if self.is_binary:
                 return await anyio.to_thread.run_sync(self.path.read_bytes)
             return await anyio.to_thread.run_sync(self.path.read_text)
         except Exception as e:
             raise ResourceError(f"Error reading file {self.path}") from e
 
+    def _read_range(self) -> bytes:
+        with self.path.open("rb") as f:
+            f.seek(self.offset)
+            return f.read(-1 if self.length is None else self.length)
+
 
 class HttpResource(Resource):
-    """A resource that reads from an HTTP endpoint."""
+    """A resource that reads from an HTTP endpoint.
+
+    Reads through a server share its pool of connections. Responses with an
+    ETag or Last-Modified header are kept in the pool and revalidated with a
+    conditional request on the next read, so unchanged content costs a 304
+    response.
+    """
 
     url: str = Field(description="URL to fetch content from")
     mime_type: str = Field(
@@ -135,14 +189,55 @@ class HttpResource(Resource):
 
     async def read(self) -> str | bytes:
         """Read the HTTP content."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.url)
-            response.raise_for_status()
-            return response.text
+        if (pool := current_http_pool()) is not None:
+            return await self._fetch(pool)
+        # read outside a server, so there is no pool to share
+        pool = HttpPool()
+        try:
+            return await self._fetch(pool)
+        finally:
+            await pool.aclose()
+
+    async def _fetch(self, pool: HttpPool) -> str:
+        cached = pool.responses.get(self.url)
+        headers: dict[str, str] = {}
+        if cached is not LRUCache.NOT_FOUND:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = await pool.client.get(self.url, headers=headers)
+        if response.status_code == 304 and cached is not LRUCache.NOT_FOUND:
+            return cached[2]
+        response.raise_for_status()
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if (etag or last_modified) and "no-store" not in response.headers.get(
+            "Cache-Control", ""
+        ):
+            pool.responses.set(
+                self.url,
+                (etag, last_modified, response.text),
+                size=len(response.content),
+            )
+        else:
+            pool.responses.delete(self.url)
+        return response.text
 
 
 class DirectoryResource(Resource):
-    """A resource that lists files in a directory."""
+    """A resource that lists files in a directory.
+
+    Listings come from an index of the directory that is shared between reads
+    and only rescans subdirectories that changed. Set page_size to split large
+    listings into pages; each page includes a cursor for reading the next one
+    (e.g. as `resource://files?cursor=...`).
+    """
+
+    query_params = frozenset({"cursor"})
 
     path: Path = Field(description="Path to the directory")
     recursive: bool = Field(
@@ -154,6 +249,18 @@ class DirectoryResource(Resource):
     mime_type: str = Field(
         default="application/json", description="MIME type of the resource content"
     )
+    page_size: int | None = Field(
+        default=None, ge=1, description="Maximum number of files to list per read"
+    )
+    cursor: str | None = Field(
+        default=None, description="Cursor from a previous read, to list the next page"
+    )
+    refresh_interval: float = Field(
+        default=0,
+        ge=0,
+        description="Seconds to reuse the directory index for before checking the "
+        "directory for changes",
+    )
 
     @pydantic.field_validator("path")
     @classmethod
@@ -164,7 +271,11 @@ class DirectoryResource(Resource):
         return path
 
     def list_files(self) -> list[Path]:
-        """List files in the directory."""
+        """List files in the directory.
+
+        Subdirectories matching the pattern are included, as with `Path.glob`.
+        Reads list only files, from the directory index.
+        """
         if not self.path.exists():
             raise FileNotFoundError(f"Directory not found: {self.path}")
         if not self.path.is_dir():
@@ -185,11 +296,191 @@ class DirectoryResource(Resource):
         except Exception as e:
             raise ResourceError(f"Error listing directory {self.path}: {e}")
 
+    def _matching_files(self) -> list[str]:
+        if not self.path.exists():
+            raise FileNotFoundError(f"Directory not found: {self.path}")
+        if not self.path.is_dir():
+            raise NotADirectoryError(f"Not a directory: {self.path}")
+
+        # patterns follow Path.glob, or Path.rglob when listing recursively
+        pattern = self.pattern or None
+        if pattern is not None and self.recursive:
+            pattern = f"**/{pattern}"
+        # like Path.glob, a pattern with several components can match files
+        # in subdirectories even when the listing isn't recursive
+        recursive = self.recursive or (
+            pattern is not None and len(PurePath(pattern).parts) > 1
+        )
+        try:
+            return _get_directory_index(self.path, recursive).files(
+                pattern, max_age=self.refresh_interval
+            )
+        except Exception as e:
+            raise ResourceError(f"Error listing directory {self.path}: {e}")
+
+    def _list_page(self) -> dict[str, Any]:
+        files = self._matching_files()
+        start = 0
+        if self.cursor is not None:
+            # the cursor is the last file of the previous page, so pages stay
+            # consistent when files are added or removed in between
+            after = decode_cursor(self.cursor)
+            start = bisect.bisect_right(files, after)
+        if self.page_size is None:
+            return {"files": files[start:]}
+
+        page = files[start : start + self.page_size]
+        listing: dict[str, Any] = {"files": page}
+        if start + self.page_size < len(files):
+            listing["nextCursor"] = encode_cursor(page[-1])
+        return listing
+
+    async def get_cache_validator(self) -> tuple[str, ...]:
+        """Get the files in the listing."""
+        try:
+            return tuple(await anyio.to_thread.run_sync(self._matching_files))
+        except Exception as e:
+            raise ResourceError(f"Error reading directory {self.path}") from e
+
     async def read(self) -> str:  # Always returns JSON string
         """Read the directory listing."""
         try:
-            files = await anyio.to_thread.run_sync(self.list_files)
-            file_list = [str(f.relative_to(self.path)) for f in files if f.is_file()]
-            return json.dumps({"files": file_list}, indent=2)
+            listing = await anyio.to_thread.run_sync(self._list_page)
+            return get_serializer()(listing)
+        except McpError:
+            # an invalid cursor
+            raise
         except Exception:
             raise ResourceError(f"Error reading directory {self.path}")
+
+
+class _DirectoryIndex:
+    """The files in a directory, kept up to date incrementally.
+
+    The entries of each directory are stored along with its modification time,
+    which changes whenever an entry is added, removed or renamed. Refreshing the
+    index checks the time of every indexed directory, but only rescans the
+    directories that changed.
+    """
+
+    def __init__(self, root: Path, recursive: bool):
+        self.root = root
+        self.recursive = recursive
+        # relative directory -> (mtime_ns, files, subdirectories)
+        self._dirs: dict[str, tuple[int, list[str], list[str]]] = {}
+        self._files: list[str] = []
+        # pattern -> sorted matching files
+        self._matches: dict[str, list[str]] = {}
+        self._checked_at: float | None = None
+        self._lock = threading.Lock()
+
+    def files(self, pattern: str | None = None, max_age: float = 0) -> list[str]:
+        """Get the sorted relative paths of files matching a glob pattern.
+
+        The pattern is matched against the whole relative path, as with
+        `Path.glob`: `*` matches within one component, and a `**` component
+        matches any number of directories.
+
+        The index is refreshed first, unless it was checked less than `max_age`
+        seconds ago.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._checked_at is None or now - self._checked_at >= max_age:
+                if self._refresh():
+                    self._files = sorted(
+                        name for _, files, _ in self._dirs.values() for name in files
+                    )
+                    self._matches.clear()
+                self._checked_at = now
+
+            if pattern is None:
+                return self._files
+            if (matches := self._matches.get(pattern)) is None:
+                if len(self._matches) >= _MAX_INDEXED_PATTERNS:
+                    self._matches.clear()
+                parts = _glob_parts(pattern)
+                matches = self._matches[pattern] = [
+                    name
+                    for name in self._files
+                    if _glob_match(PurePath(name).parts, parts)
+                ]
+            return matches
+
+    def _refresh(self) -> bool:
+        """Rescan changed directories, returning whether anything changed."""
+        changed = False
+        seen: set[str] = set()
+        pending = [""]
+        while pending:
+            rel = pending.pop()
+            path = self.root / rel
+            try:
+                mtime = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                if not rel:
+                    raise
+                continue  # removed since its parent was scanned
+            seen.add(rel)
+
+            entry = self._dirs.get(rel)
+            if entry is None or entry[0] != mtime:
+                files: list[str] = []
+                subdirs: list[str] = []
+                with os.scandir(path) as entries:
+                    for item in entries:
+                        name = os.path.join(rel, item.name)
+                        if item.is_dir(follow_symlinks=False):
+                            subdirs.append(name)
+                        elif item.is_file():
+                            files.append(name)
+                # a directory changed within the timestamp resolution of the
+                # filesystem could change again without a new mtime, so
+                # rescan it next time
+                if time.time_ns() - mtime < 1_000_000_000:
+                    mtime = -1
+                entry = self._dirs[rel] = (mtime, files, subdirs)
+                changed = True
+
+            if self.recursive:
+                pending.extend(entry[2])
+
+        for rel in self._dirs.keys() - seen:
+            del self._dirs[rel]
+            changed = True
+        return changed
+
+
+def _glob_parts(pattern: str) -> tuple[str, ...]:
+    path = PurePath(pattern)
+    if path.anchor:
+        raise ValueError(f"Non-relative patterns are unsupported: {pattern!r}")
+    return path.parts
+
+
+def _glob_match(parts: Sequence[str], pattern: Sequence[str]) -> bool:
+    """Match the components of a relative path against those of a pattern."""
+    if not pattern:
+        return not parts
+    if pattern[0] == "**":
+        return any(_glob_match(parts[i:], pattern[1:]) for i in range(len(parts) + 1))
+    return (
+        bool(parts)
+        and fnmatch.fnmatch(parts[0], pattern[0])
+        and _glob_match(parts[1:], pattern[1:])
+    )
+
+
+_MAX_INDEXED_PATTERNS = 32
+_directory_indexes = LRUCache(max_entries=64)
+_directory_indexes_lock = threading.Lock()
+
+
+def _get_directory_index(path: Path, recursive: bool) -> _DirectoryIndex:
+    key = (path, recursive)
+    with _directory_indexes_lock:
+        index = _directory_indexes.get(key)
+        if index is LRUCache.NOT_FOUND:
+            index = _DirectoryIndex(path, recursive)
+            _directory_indexes.set(key, index)
+        return index
@@ -246,11 +246,18 @@ def create_sse_app(
     if middleware:
         server_middleware.extend(middleware)
 
+    # Keep the server's shared resources between sessions while the app runs
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncGenerator[None, None]:
+        async with server._running():
+            yield
+
     # Create and return the app
     app = create_base_app(
         routes=server_routes,
         middleware=server_middleware,
         debug=debug,
+        lifespan=lifespan,
     )
     # Store the FlashMCP server instance on the Starlette app state
     app.state.FlashMCP_server = server
@@ -364,10 +371,11 @@ def create_streamable_http_app(
     if middleware:
         server_middleware.extend(middleware)
 
-    # Create a lifespan manager to start and stop the session manager
+    # Create a lifespan manager to start and stop the session manager, keeping
+    # the server's shared resources between sessions while the app runs
     @asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncGenerator[None, None]:
-        async with session_manager.run():
+        async with server._running(), session_manager.run():
             yield
 
     # Create and return the app with lifespan
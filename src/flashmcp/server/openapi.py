@@ -629,6 +629,9 @@ class FlashMCPOpenAPI(FlashMCP):
             elif route_type == RouteType.IGNORE:
                 logger.info(f"Ignoring route: {route.method} {route.path}")
 
+        # the routes were registered on the managers directly
+        self._catalogue_changed()
+
         logger.info(f"Created FlashMCP OpenAPI server with {len(http_routes)} routes")
 
     def _create_openapi_tool(self, route: openapi.HTTPRoute, operation_id: str):
@@ -749,8 +752,7 @@ class FlashMCPOpenAPI(FlashMCP):
             tags=set(route.tags or []),
             timeout=self._timeout,
         )
-        # Register the template by directly assigning to the templates dictionary
-        self._resource_manager._templates[uri_template_str] = template
+        self._resource_manager.add_template(template)
         logger.debug(
             f"Registered TEMPLATE: {uri_template_str} ({route.method} {route.path}) with tags: {route.tags}"
         )
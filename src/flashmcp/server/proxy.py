@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import quote
 
+import anyio
 import mcp.types
+from mcp import ClientSession
 from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.shared.exceptions import McpError
 from mcp.types import (
@@ -22,7 +26,7 @@ from FlashMCP.exceptions import NotFoundError, ResourceError, ToolError
 from FlashMCP.prompts import Prompt, PromptMessage
 from FlashMCP.resources import Resource, ResourceTemplate
 from FlashMCP.server.context import Context
-from FlashMCP.server.server import FlashMCP
+from FlashMCP.server.server import CatalogueKind, FlashMCP
 from FlashMCP.tools.tool import Tool
 from FlashMCP.utilities.logging import get_logger
 
@@ -173,76 +177,143 @@ class ProxyPrompt(Prompt):
 
 
 class FlashMCPProxy(FlashMCP):
-    def __init__(self, client: Client, **kwargs):
-        super().__init__(**kwargs)
-        self.client = client
+    """A server that forwards requests to the server a client is connected to.
 
-    async def get_tools(self) -> dict[str, Tool]:
-        tools = await super().get_tools()
+    The remote server's components are listed on every request, unless the
+    client is kept connected (e.g. with `async with proxy.client:` around the
+    proxy's lifetime). In that case they are kept until the remote server
+    sends a `list_changed` notification or the client disconnects. Listing
+    them again only counts as a change, which rebuilds the lists of the proxy
+    and of the servers it is mounted on, if the remote components differ.
 
-        async with self.client:
-            try:
-                client_tools = await self.client.list_tools()
-            except McpError as e:
-                if e.error.code == METHOD_NOT_FOUND:
-                    client_tools = []
-                else:
-                    raise e
-            for tool in client_tools:
-                tool_proxy = await ProxyTool.from_client(self.client, tool)
-                tools[tool_proxy.name] = tool_proxy
-
-        return tools
-
-    async def get_resources(self) -> dict[str, Resource]:
-        resources = await super().get_resources()
-
-        async with self.client:
-            try:
-                client_resources = await self.client.list_resources()
-            except McpError as e:
-                if e.error.code == METHOD_NOT_FOUND:
-                    client_resources = []
-                else:
-                    raise e
-            for resource in client_resources:
-                resource_proxy = await ProxyResource.from_client(self.client, resource)
-                resources[str(resource_proxy.uri)] = resource_proxy
+    Subscriptions to the remote server's resources are forwarded to it, over
+    the client's connection if it is kept connected, or else over a connection
+    of their own that stays open while they last. The remote server's
+    `resources/updated` notifications are passed on to subscribed clients.
+    """
 
-        return resources
+    def __init__(self, client: Client, **kwargs):
+        super().__init__(**kwargs)
+        self.client = client
+        # the last listed MCP objects of each kind, and their proxy components
+        self._remote: dict[CatalogueKind, tuple[list[Any], dict[str, Any]]] = {}
+        # the session that reports changes to the remote components of each
+        # kind, for kinds listed while the client stayed connected
+        self._watched: dict[CatalogueKind, ClientSession] = {}
+        # remote uri -> number of holds on its subscription through the client
+        self._remote_subscriptions: dict[str, int] = {}
+        client.add_message_handler(self._handle_remote_message)
+
+    def _watches_catalogue(self, kind: CatalogueKind) -> bool:
+        session = self._watched.get(kind)
+        return (
+            session is not None
+            and self.client.is_connected()
+            and self.client.session is session
+            and super()._watches_catalogue(kind)
+        )
 
-    async def get_resource_templates(self) -> dict[str, ResourceTemplate]:
-        templates = await super().get_resource_templates()
+    async def _build_catalogue(self, kind: CatalogueKind) -> dict[str, Any]:
+        components = await super()._build_catalogue(kind)
+        if not self._watches_catalogue(kind):
+            await self._list_remote(kind)
+        components.update(self._remote[kind][1])
+        return components
 
+    async def _list_remote(self, kind: CatalogueKind) -> None:
         async with self.client:
             try:
-                client_templates = await self.client.list_resource_templates()
-            except McpError as e:
-                if e.error.code == METHOD_NOT_FOUND:
-                    client_templates = []
+                if kind == "tools":
+                    listed: list[Any] = await self.client.list_tools()
+                elif kind == "resources":
+                    listed = await self.client.list_resources()
+                elif kind == "resource_templates":
+                    listed = await self.client.list_resource_templates()
                 else:
-                    raise e
-            for template in client_templates:
-                template_proxy = await ProxyTemplate.from_client(self.client, template)
-                templates[template_proxy.uri_template] = template_proxy
-
-        return templates
-
-    async def get_prompts(self) -> dict[str, Prompt]:
-        prompts = await super().get_prompts()
-
-        async with self.client:
-            try:
-                client_prompts = await self.client.list_prompts()
+                    listed = await self.client.list_prompts()
             except McpError as e:
-                if e.error.code == METHOD_NOT_FOUND:
-                    client_prompts = []
-                else:
+                if e.error.code != METHOD_NOT_FOUND:
                     raise e
-            for prompt in client_prompts:
-                prompt_proxy = await ProxyPrompt.from_client(self.client, prompt)
-                prompts[prompt_proxy.name] = prompt_proxy
-        return prompts
+                listed = []
+
+        previous = self._remote.get(kind)
+        if previous is None or previous[0] != listed:
+            self._remote[kind] = (listed, await self._create_proxies(kind, listed))
+            # lists cached with the previous components are outdated
+            if previous is not None:
+                self._catalogue_changed(kind)
+
+        # list_changed notifications only arrive while the client is
+        # connected, so the components are only watched if it stays connected
+        if self.client.is_connected():
+            self._watched[kind] = self.client.session
+
+    async def _create_proxies(
+        self, kind: CatalogueKind, listed: list[Any]
+    ) -> dict[str, Any]:
+        remote: dict[str, Any] = {}
+        for item in listed:
+            if kind == "tools":
+                tool_proxy = await ProxyTool.from_client(self.client, item)
+                remote[tool_proxy.name] = tool_proxy
+            elif kind == "resources":
+                resource_proxy = await ProxyResource.from_client(self.client, item)
+                remote[str(resource_proxy.uri)] = resource_proxy
+            elif kind == "resource_templates":
+                template_proxy = await ProxyTemplate.from_client(self.client, item)
+                remote[template_proxy.uri_template] = template_proxy
+            else:
+                prompt_proxy = await ProxyPrompt.from_client(self.client, item)
+                remote[prompt_proxy.name] = prompt_proxy
+        return remote
+
+    async def _handle_remote_message(self, message: Any) -> None:
+        if not isinstance(message, mcp.types.ServerNotification):
+            return
+        notification = message.root
+        if isinstance(notification, mcp.types.ResourceUpdatedNotification):
+            self.notify_resource_changed(notification.params.uri)
+            return
+        if isinstance(notification, mcp.types.ToolListChangedNotification):
+            kinds: tuple[CatalogueKind, ...] = ("tools",)
+        elif isinstance(notification, mcp.types.ResourceListChangedNotification):
+            kinds = ("resources", "resource_templates")
+        elif isinstance(notification, mcp.types.PromptListChangedNotification):
+            kinds = ("prompts",)
+        else:
+            return
+        # the components are listed again when next requested, and only
+        # count as changed if they differ
+        for kind in kinds:
+            self._watched.pop(kind, None)
+
+    @asynccontextmanager
+    async def _hold_subscription(self, uri: str) -> AsyncIterator[None]:
+        # the remote server drops its subscriptions when the session ends, so
+        # a session must stay open while the subscription is held
+        if not self.client.is_connected():
+            # the client's own connection can only be closed by the task that
+            # opened it, so each held subscription gets a connection of its own
+            async with Client(
+                self.client.transport, message_handler=self._handle_remote_message
+            ) as client:
+                await client.subscribe_resource(uri)
+                yield
+            return
+
+        session = self.client.session
+        if uri not in self._remote_subscriptions:
+            await self.client.subscribe_resource(uri)
+        self._remote_subscriptions[uri] = self._remote_subscriptions.get(uri, 0) + 1
+        try:
+            yield
+        finally:
+            self._remote_subscriptions[uri] -= 1
+            if not self._remote_subscriptions[uri]:
+                del self._remote_subscriptions[uri]
+                if self.client.is_connected() and self.client.session is session:
+                    with anyio.CancelScope(shield=True):
+                        await self.client.unsubscribe_resource(uri)
 
     async def _mcp_call_tool(
         self, key: str, arguments: dict[str, Any]
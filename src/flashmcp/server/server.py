@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import datetime
+import inspect
 import re
 import warnings
-from collections.abc import AsyncIterator, Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from contextlib import (
     AbstractAsyncContextManager,
     AsyncExitStack,
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, Literal
 
 import anyio
+import anyio.to_thread
 import httpx
 import uvicorn
 from mcp.server.auth.provider import OAuthAuthorizationServerProvider
@@ -28,6 +29,15 @@ from mcp.types import (
     EmbeddedResource,
     GetPromptResult,
     ImageContent,
+    ListPromptsRequest,
+    ListPromptsResult,
+    ListResourcesRequest,
+    ListResourcesResult,
+    ListResourceTemplatesRequest,
+    ListResourceTemplatesResult,
+    ListToolsRequest,
+    ListToolsResult,
+    ServerResult,
     TextContent,
     ToolAnnotations,
 )
@@ -44,6 +54,7 @@ from starlette.routing import BaseRoute, Route
 import FlashMCP.server
 import FlashMCP.settings
 from FlashMCP.exceptions import NotFoundError
+from FlashMCP.low_level.server import LowLevelServer
 from FlashMCP.prompts import Prompt, PromptManager
 from FlashMCP.prompts.prompt import PromptResult
 from FlashMCP.resources import Resource, ResourceManager
@@ -53,12 +64,17 @@ from FlashMCP.server.http import (
     create_sse_app,
     create_streamable_http_app,
 )
+from FlashMCP.server.subscriptions import Hold, ResourceSubscriptions
+from FlashMCP.settings import SerializationProfile, ToolExecution
 from FlashMCP.tools import ToolManager
 from FlashMCP.tools.tool import Tool
-from FlashMCP.utilities.cache import TimedCache
 from FlashMCP.utilities.decorators import DecoratedFunction
 from FlashMCP.utilities.logging import get_logger
 from FlashMCP.utilities.mcp_config import MCPConfig
+from FlashMCP.utilities.pagination import PageCache
+from FlashMCP.utilities.serialization import Encoder, get_serializer
+from FlashMCP.utilities.snapshot import CatalogueSnapshot, SnapshotKind
+from FlashMCP.utilities.types import find_kwarg_by_type, get_cached_parameters_schema
 
 if TYPE_CHECKING:
     from FlashMCP.client import Client
@@ -68,6 +84,8 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 DuplicateBehavior = Literal["warn", "error", "replace", "ignore"]
+CatalogueKind = Literal["tools", "resources", "resource_templates", "prompts"]
+CATALOGUE_KINDS: tuple[CatalogueKind, ...] = CatalogueKind.__args__
 
 # Compiled URI parsing regex to split a URI into protocol and path components
 URI_PATTERN = re.compile(r"^([^:]+://)(.*?)$")
@@ -97,6 +115,8 @@ def _lifespan_wrapper(
     @asynccontextmanager
     async def wrap(s: MCPServer[LifespanResultT]) -> AsyncIterator[LifespanResultT]:
         async with AsyncExitStack() as stack:
+            await stack.enter_async_context(app._running())
+            await stack.enter_async_context(app._resource_subscriptions.run())
             context = await stack.enter_async_context(lifespan(app))
             yield context
 
@@ -125,6 +145,16 @@ class FlashMCP(Generic[LifespanResultT]):
         on_duplicate_resources: DuplicateBehavior | None = None,
         on_duplicate_prompts: DuplicateBehavior | None = None,
         resource_prefix_format: Literal["protocol", "path"] | None = None,
+        tool_execution: ToolExecution | None = None,
+        tool_thread_limit: int | None = None,
+        tool_process_workers: int | None = None,
+        tool_timeout: float | None = None,
+        serialization: SerializationProfile | Encoder | None = None,
+        resource_cache_max_bytes: int | None = None,
+        list_page_size: int | None = None,
+        mount_list_timeout: float | None = None,
+        catalogue_snapshot: str | Path | None = None,
+        http_client: httpx.AsyncClient | None = None,
         **settings: Any,
     ):
         if settings:
@@ -147,28 +177,82 @@ class FlashMCP(Generic[LifespanResultT]):
         else:
             self.resource_prefix_format = resource_prefix_format
 
+        self.list_page_size: int | None
+        if list_page_size is None:
+            self.list_page_size = FlashMCP.settings.settings.list_page_size
+        else:
+            self.list_page_size = list_page_size
+
+        self.mount_list_timeout: float | None
+        if mount_list_timeout is None:
+            self.mount_list_timeout = FlashMCP.settings.settings.mount_list_timeout
+        else:
+            self.mount_list_timeout = mount_list_timeout
+
+        # schemas saved by `save_catalogue_snapshot`, read when the first
+        # component is added
+        self._snapshot: CatalogueSnapshot | None = (
+            CatalogueSnapshot(catalogue_snapshot)
+            if catalogue_snapshot is not None
+            else None
+        )
+
         self.tags: set[str] = tags or set()
         self.dependencies = dependencies
-        self._cache = TimedCache(
-            expiration=datetime.timedelta(seconds=cache_expiration_seconds or 0)
-        )
+        if cache_expiration_seconds is not None:
+            # Deprecated since 2.5.0
+            warnings.warn(
+                "The cache_expiration_seconds parameter is deprecated and ignored. "
+                "Mounted servers are no longer polled; their components are "
+                "collected again whenever they change.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        # bumped for a kind whenever the components of that kind of this server
+        # or of a server mounted on it change; the catalogue of each kind is
+        # cached until its generation is bumped
+        self._generations: dict[CatalogueKind, int] = dict.fromkeys(CATALOGUE_KINDS, 0)
+        self._catalogue: dict[CatalogueKind, tuple[int, dict[str, Any]]] = {}
         self._mounted_servers: dict[str, MountedServer] = {}
+        self._mount_index = MountIndex()
+        # the servers this server is mounted on, with its prefix on each
+        self._mounted_on: list[tuple[FlashMCP, str]] = []
+        # sessions and HTTP apps currently running the server
+        self._running_count = 0
+        self._resource_subscriptions = ResourceSubscriptions()
+        self._page_caches: dict[CatalogueKind, PageCache] = {
+            kind: PageCache() for kind in CATALOGUE_KINDS
+        }
         self._additional_http_routes: list[BaseRoute] = []
+        # without an explicit profile, results follow the `serialization`
+        # setting at the time they are produced
+        serializer = (
+            get_serializer(serialization) if serialization is not None else None
+        )
         self._tool_manager = ToolManager(
             duplicate_behavior=on_duplicate_tools,
-            serializer=tool_serializer,
+            serializer=tool_serializer or serializer,
+            execution=tool_execution,
+            thread_limit=tool_thread_limit,
+            process_workers=tool_process_workers,
+            timeout=tool_timeout,
         )
         self._resource_manager = ResourceManager(
-            duplicate_behavior=on_duplicate_resources
+            duplicate_behavior=on_duplicate_resources,
+            serializer=serializer,
+            cache_max_bytes=resource_cache_max_bytes,
+            http_client=http_client,
+        )
+        self._prompt_manager = PromptManager(
+            duplicate_behavior=on_duplicate_prompts, serializer=serializer
         )
-        self._prompt_manager = PromptManager(duplicate_behavior=on_duplicate_prompts)
 
         if lifespan is None:
             self._has_lifespan = False
             lifespan = default_lifespan
         else:
             self._has_lifespan = True
-        self._mcp_server = MCPServer[LifespanResultT](
+        self._mcp_server = LowLevelServer[LifespanResultT](
             name=name or "FlashMCP",
             instructions=instructions,
             lifespan=_lifespan_wrapper(self, lifespan),
@@ -196,6 +280,32 @@ class FlashMCP(Generic[LifespanResultT]):
     def instructions(self) -> str | None:
         return self._mcp_server.instructions
 
+    @asynccontextmanager
+    async def _running(self) -> AsyncIterator[None]:
+        """Keep the resources the server shares between sessions, such as its
+        tool process pool and the HTTP client of its HTTP resources, while a
+        session or an HTTP app runs the server.
+
+        They are released when the last one stops, along with those of the
+        servers mounted on this one.
+        """
+        async with AsyncExitStack() as stack:
+            for mounted_server in list(self._mounted_servers.values()):
+                await stack.enter_async_context(mounted_server.server._running())
+            self._running_count += 1
+            try:
+                yield
+            finally:
+                self._running_count -= 1
+                if not self._running_count:
+                    with anyio.CancelScope(shield=True):
+                        await self._release_resources()
+
+    async def _release_resources(self) -> None:
+        await self._resource_manager.http.aclose()
+        # waits for the calls running in the process pool to finish
+        await anyio.to_thread.run_sync(self._tool_manager.executor.shutdown)
+
     async def run_async(
         self,
         transport: Literal["stdio", "streamable-http", "sse"] | None = None,
@@ -233,61 +343,187 @@ class FlashMCP(Generic[LifespanResultT]):
 
     def _setup_handlers(self) -> None:
         """Set up core MCP protocol handlers."""
-        self._mcp_server.list_tools()(self._mcp_list_tools)
+        self._mcp_server.paginated_list(ListToolsRequest)(self._mcp_list_tools_page)
         self._mcp_server.call_tool()(self._mcp_call_tool)
-        self._mcp_server.list_resources()(self._mcp_list_resources)
+        self._mcp_server.paginated_list(ListResourcesRequest)(
+            self._mcp_list_resources_page
+        )
         self._mcp_server.read_resource()(self._mcp_read_resource)
-        self._mcp_server.list_prompts()(self._mcp_list_prompts)
+        self._mcp_server.subscribe_resource()(self._mcp_subscribe_resource)
+        self._mcp_server.unsubscribe_resource()(self._mcp_unsubscribe_resource)
+        self._mcp_server.paginated_list(ListPromptsRequest)(self._mcp_list_prompts_page)
         self._mcp_server.get_prompt()(self._mcp_get_prompt)
-        self._mcp_server.list_resource_templates()(self._mcp_list_resource_templates)
+        self._mcp_server.paginated_list(ListResourceTemplatesRequest)(
+            self._mcp_list_resource_templates_page
+        )
 
     async def get_tools(self) -> dict[str, Tool]:
         """Get all registered tools, indexed by registered key."""
-        if (tools := self._cache.get("tools")) is self._cache.NOT_FOUND:
-            tools: dict[str, Tool] = {}
-            for server in self._mounted_servers.values():
-                server_tools = await server.get_tools()
-                tools.update(server_tools)
-            tools.update(self._tool_manager.get_tools())
-            self._cache.set("tools", tools)
-        return tools
+        return await self._get_catalogue("tools")
 
     async def get_resources(self) -> dict[str, Resource]:
         """Get all registered resources, indexed by registered key."""
-        if (resources := self._cache.get("resources")) is self._cache.NOT_FOUND:
-            resources: dict[str, Resource] = {}
-            for server in self._mounted_servers.values():
-                server_resources = await server.get_resources()
-                resources.update(server_resources)
-            resources.update(self._resource_manager.get_resources())
-            self._cache.set("resources", resources)
-        return resources
+        return await self._get_catalogue("resources")
 
     async def get_resource_templates(self) -> dict[str, ResourceTemplate]:
         """Get all registered resource templates, indexed by registered key."""
-        if (
-            templates := self._cache.get("resource_templates")
-        ) is self._cache.NOT_FOUND:
-            templates: dict[str, ResourceTemplate] = {}
-            for server in self._mounted_servers.values():
-                server_templates = await server.get_resource_templates()
-                templates.update(server_templates)
-            templates.update(self._resource_manager.get_templates())
-            self._cache.set("resource_templates", templates)
-        return templates
+        return await self._get_catalogue("resource_templates")
 
     async def get_prompts(self) -> dict[str, Prompt]:
         """
         List all available prompts.
         """
-        if (prompts := self._cache.get("prompts")) is self._cache.NOT_FOUND:
-            prompts: dict[str, Prompt] = {}
-            for server in self._mounted_servers.values():
-                server_prompts = await server.get_prompts()
-                prompts.update(server_prompts)
-            prompts.update(self._prompt_manager.get_prompts())
-            self._cache.set("prompts", prompts)
-        return prompts
+        return await self._get_catalogue("prompts")
+
+    async def _get_catalogue(self, kind: CatalogueKind) -> dict[str, Any]:
+        """Get the components of a kind from this server and its mounted
+        servers, collecting them again only if the catalogue changed since
+        they were last collected.
+
+        Returns a copy, so callers changing it don't change the cached
+        catalogue."""
+        generation = self._generations[kind]
+        cached = self._catalogue.get(kind)
+        if (
+            cached is not None
+            and cached[0] == generation
+            and self._watches_catalogue(kind)
+        ):
+            return dict(cached[1])
+        components = await self._build_catalogue(kind)
+        # a change while collecting means the result may already be outdated
+        if generation == self._generations[kind] and self._watches_catalogue(kind):
+            self._catalogue[kind] = (generation, components)
+        return dict(components)
+
+    def _watches_catalogue(self, kind: CatalogueKind) -> bool:
+        """Whether every change to the components of a kind is recorded with
+        `_catalogue_changed`, so they can be cached. Not the case if a server
+        mounted on this one (such as a proxy of a remote server) can't see
+        changes to its components."""
+        return all(
+            mounted_server.server._watches_catalogue(kind)
+            for mounted_server in self._mounted_servers.values()
+        )
+
+    async def _build_catalogue(self, kind: CatalogueKind) -> dict[str, Any]:
+        # mounted servers are listed concurrently, and merged in mount order
+        mounted_servers = list(self._mounted_servers.values())
+        listed: list[dict[str, Any] | None] = [None] * len(mounted_servers)
+
+        async def list_mounted(i: int) -> None:
+            listed[i] = await self._list_mounted(mounted_servers[i], kind)
+
+        if mounted_servers:
+            async with anyio.create_task_group() as tg:
+                for i in range(len(mounted_servers)):
+                    tg.start_soon(list_mounted, i)
+
+        components: dict[str, Any] = {}
+        for server_components in listed:
+            if server_components is not None:
+                components.update(server_components)
+        if any(server_components is None for server_components in listed):
+            # the list is incomplete, so it must not be reused
+            self._catalogue_changed(kind)
+        if kind == "tools":
+            components.update(self._tool_manager.get_tools())
+        elif kind == "resources":
+            components.update(self._resource_manager.get_resources())
+        elif kind == "resource_templates":
+            components.update(self._resource_manager.get_templates())
+        else:
+            components.update(self._prompt_manager.get_prompts())
+        return components
+
+    async def _list_mounted(
+        self, server: MountedServer, kind: CatalogueKind
+    ) -> dict[str, Any] | None:
+        """List the components of a mounted server, or None if it failed or
+        took longer than `mount_list_timeout`."""
+        try:
+            with anyio.fail_after(self.mount_list_timeout):
+                return await server.get_catalogue(kind)
+        except TimeoutError:
+            logger.error(
+                f"Timed out listing {kind} of mounted server {server.prefix!r} "
+                f"after {self.mount_list_timeout}s"
+            )
+        except Exception as e:
+            logger.error(
+                f"Error listing {kind} of mounted server {server.prefix!r}: {e}",
+                exc_info=True,
+            )
+        return None
+
+    def _catalogue_changed(self, *kinds: CatalogueKind) -> None:
+        """Record that a component was added or removed, or a server mounted
+        or unmounted, on this server or on a server mounted on it.
+
+        Args:
+            *kinds: The kinds of components that changed; all of them if none
+                are given
+        """
+        for kind in kinds or CATALOGUE_KINDS:
+            self._generations[kind] += 1
+        for server, _ in self._mounted_on:
+            server._catalogue_changed(*kinds)
+
+    def save_catalogue_snapshot(self, path: str | Path | None = None) -> None:
+        """Save the parameter schemas of this server's function tools, resource
+        templates and prompts to a catalogue snapshot.
+
+        A server created with `catalogue_snapshot` set to the saved file uses
+        these schemas when the same functions are added again, instead of
+        generating them, which makes starting a server with many components
+        much faster. Components of mounted servers are not included; give each
+        server its own snapshot.
+
+        Args:
+            path: The file to write; defaults to the server's `catalogue_snapshot`
+        """
+        from FlashMCP.server.context import Context
+
+        if path is None:
+            if self._snapshot is None:
+                raise ValueError(
+                    "A path is required when the server has no catalogue_snapshot"
+                )
+            path = self._snapshot.path
+
+        components: list[
+            tuple[SnapshotKind, str, Callable[..., Any], dict[str, Any]]
+        ] = []
+        for tool in self._tool_manager.get_tools().values():
+            if type(tool) is Tool:
+                components.append(("tools", tool.name, tool.fn, tool.parameters))
+        for template in self._resource_manager.get_templates().values():
+            if type(template) is ResourceTemplate:
+                components.append(
+                    (
+                        "resource_templates",
+                        template.uri_template,
+                        template.fn,
+                        template.parameters,
+                    )
+                )
+        for prompt in self._prompt_manager.get_prompts().values():
+            if type(prompt) is Prompt:
+                # prompts keep the function wrapped by its validator
+                fn = inspect.unwrap(prompt.fn)
+                context_kwarg = find_kwarg_by_type(fn, kwarg_type=Context)
+                parameters = get_cached_parameters_schema(fn, context_kwarg)
+                components.append(("prompts", prompt.name, fn, parameters))
+        CatalogueSnapshot.save(path, components)
+
+    def _snapshot_parameters(
+        self, kind: SnapshotKind, key: str | None, fn: AnyFunction
+    ) -> dict[str, Any] | None:
+        """Get the saved parameter schema of a component being added from a
+        function, if there is a catalogue snapshot with an entry for it."""
+        if self._snapshot is None:
+            return None
+        return self._snapshot.parameters(kind, key or getattr(fn, "__name__", ""), fn)
 
     def custom_route(
         self,
@@ -374,47 +610,173 @@ class FlashMCP(Generic[LifespanResultT]):
         prompts = await self.get_prompts()
         return [prompt.to_mcp_prompt(name=key) for key, prompt in prompts.items()]
 
+    async def _mcp_list_tools_page(self, cursor: str | None) -> ServerResult:
+        """
+        List a page of the available tools, in the format expected by the
+        low-level MCP server.
+        """
+        return self._page_caches["tools"].get(
+            await self.get_tools(),
+            cursor,
+            self.list_page_size,
+            lambda page, next_cursor: ListToolsResult(
+                tools=[tool.to_mcp_tool(name=key) for key, tool in page],
+                nextCursor=next_cursor,
+            ),
+        )
+
+    async def _mcp_list_resources_page(self, cursor: str | None) -> ServerResult:
+        """
+        List a page of the available resources, in the format expected by the
+        low-level MCP server.
+        """
+        return self._page_caches["resources"].get(
+            await self.get_resources(),
+            cursor,
+            self.list_page_size,
+            lambda page, next_cursor: ListResourcesResult(
+                resources=[resource.to_mcp_resource(uri=key) for key, resource in page],
+                nextCursor=next_cursor,
+            ),
+        )
+
+    async def _mcp_list_resource_templates_page(
+        self, cursor: str | None
+    ) -> ServerResult:
+        """
+        List a page of the available resource templates, in the format expected
+        by the low-level MCP server.
+        """
+        return self._page_caches["resource_templates"].get(
+            await self.get_resource_templates(),
+            cursor,
+            self.list_page_size,
+            lambda page, next_cursor: ListResourceTemplatesResult(
+                resourceTemplates=[
+                    template.to_mcp_template(uriTemplate=key) for key, template in page
+                ],
+                nextCursor=next_cursor,
+            ),
+        )
+
+    async def _mcp_list_prompts_page(self, cursor: str | None) -> ServerResult:
+        """
+        List a page of the available prompts, in the format expected by the
+        low-level MCP server.
+        """
+        return self._page_caches["prompts"].get(
+            await self.get_prompts(),
+            cursor,
+            self.list_page_size,
+            lambda page, next_cursor: ListPromptsResult(
+                prompts=[prompt.to_mcp_prompt(name=key) for key, prompt in page],
+                nextCursor=next_cursor,
+            ),
+        )
+
     async def _mcp_call_tool(
         self, key: str, arguments: dict[str, Any]
     ) -> list[TextContent | ImageContent | EmbeddedResource]:
-        """Call a tool by name with arguments."""
+        """Call a tool by name with arguments.
 
-        with FlashMCP.server.context.Context(FlashMCP=self):
-            if self._tool_manager.has_tool(key):
-                result = await self._tool_manager.call_tool(key, arguments)
+        Tools of mounted servers, however deeply nested, are called directly
+        on the server that owns them, which is also the server reported by the
+        request's context.
+        """
 
-            else:
-                for server in self._mounted_servers.values():
-                    if server.match_tool(key):
-                        new_key = server.strip_tool_prefix(key)
-                        result = await server.server._mcp_call_tool(new_key, arguments)
-                        break
-                else:
+        with FlashMCP.server.context.Context(FlashMCP=self) as context:
+            server: FlashMCP = self
+            while not server._tool_manager.has_tool(key):
+                if (mounted := server._mount_index.resolve_name(key)) is None:
                     raise NotFoundError(f"Unknown tool: {key}")
-            return result
+                server, key = mounted[0].server, mounted[1]
+                if _handles_requests(server, "_mcp_call_tool"):
+                    return await server._mcp_call_tool(key, arguments)
+                context.FlashMCP = server
+            return await server._tool_manager.call_tool(key, arguments)
 
     async def _mcp_read_resource(self, uri: AnyUrl | str) -> list[ReadResourceContents]:
         """
         Read a resource by URI, in the format expected by the low-level MCP
         server.
         """
+        with FlashMCP.server.context.Context(FlashMCP=self) as context:
+            server: FlashMCP = self
+            uri = str(uri)
+            while (
+                result := await server._resource_manager.resolve_and_read(uri)
+            ) is None:
+                if (mounted := server._mount_index.resolve_uri(uri)) is None:
+                    raise NotFoundError(f"Unknown resource: {uri}")
+                server, uri = mounted[0].server, mounted[1]
+                if _handles_requests(server, "_mcp_read_resource"):
+                    return await server._mcp_read_resource(uri)
+                context.FlashMCP = server
+            content, mime_type = result
+            return [ReadResourceContents(content=content, mime_type=mime_type)]
+
+    async def _mcp_subscribe_resource(self, uri: AnyUrl) -> None:
+        """
+        Subscribe the current session to changes of a resource, in the format
+        expected by the low-level MCP server.
+        """
         with FlashMCP.server.context.Context(FlashMCP=self):
-            if self._resource_manager.has_resource(uri):
-                resource = await self._resource_manager.get_resource(uri)
-                content = await self._resource_manager.read_resource(uri)
-                return [
-                    ReadResourceContents(
-                        content=content,
-                        mime_type=resource.mime_type,
-                    )
-                ]
+            resource, hold = await self._find_subscription(str(uri))
+        await self._resource_subscriptions.subscribe(
+            str(uri), resource, self._mcp_server.request_context.session, hold
+        )
+
+    async def _mcp_unsubscribe_resource(self, uri: AnyUrl) -> None:
+        """
+        Unsubscribe the current session from changes of a resource, in the format
+        expected by the low-level MCP server.
+        """
+        self._resource_subscriptions.unsubscribe(
+            str(uri), self._mcp_server.request_context.session
+        )
+
+    async def _find_subscription(self, uri: str) -> tuple[Resource | None, Hold | None]:
+        """Get the resource for a URI from this server or a mounted server, or,
+        if the server that would have it reads resources from elsewhere (as
+        proxies do), a hold on a subscription to it there."""
+        server: FlashMCP = self
+        while not server._resource_manager.has_resource(uri):
+            if (mounted := server._mount_index.resolve_uri(uri)) is not None:
+                server, uri = mounted[0].server, mounted[1]
+            elif _handles_requests(server, "_mcp_read_resource"):
+                return None, partial(server._hold_subscription, uri)
             else:
-                for server in self._mounted_servers.values():
-                    if server.match_resource(str(uri)):
-                        new_uri = server.strip_resource_prefix(str(uri))
-                        return await server.server._mcp_read_resource(new_uri)
-                else:
-                    raise NotFoundError(f"Unknown resource: {uri}")
+                raise NotFoundError(f"Unknown resource: {uri}")
+        return await server._resource_manager.get_resource(uri), None
+
+    def _hold_subscription(self, uri: str) -> AbstractAsyncContextManager[None]:
+        """Keep a subscription to a resource that this server reads from
+        elsewhere open while in this context. Servers that handle their own
+        resource reads, such as proxies, implement this.
+
+        Raises:
+            NotFoundError: If the resource can't be subscribed to
+        """
+        raise NotFoundError(f"Unknown resource: {uri}")
+
+    def notify_resource_changed(self, uri: AnyUrl | str) -> None:
+        """Notify clients subscribed to a resource that its contents changed.
+
+        File and directory resources are watched for changes automatically;
+        call this when the contents of any other resource change, e.g. from a
+        tool that updates the data a function resource returns. Notifications
+        are debounced and sent in the background, so this returns immediately.
+        If this server is mounted on others, their clients are notified too.
+
+        Args:
+            uri: The URI of the resource that changed
+        """
+        uri = str(uri)
+        self._resource_subscriptions.notify(uri)
+        for server, prefix in self._mounted_on:
+            server.notify_resource_changed(
+                add_resource_prefix(uri, prefix, self.resource_prefix_format)
+            )
 
     async def _mcp_get_prompt(
         self, name: str, arguments: dict[str, Any] | None = None
@@ -424,19 +786,18 @@ class FlashMCP(Generic[LifespanResultT]):
         MCP server.
 
         """
-        with FlashMCP.server.context.Context(FlashMCP=self):
-            if self._prompt_manager.has_prompt(name):
-                prompt_result = await self._prompt_manager.render_prompt(
-                    name, arguments=arguments or {}
-                )
-                return prompt_result
-            else:
-                for server in self._mounted_servers.values():
-                    if server.match_prompt(name):
-                        new_key = server.strip_prompt_prefix(name)
-                        return await server.server._mcp_get_prompt(new_key, arguments)
-                else:
+        with FlashMCP.server.context.Context(FlashMCP=self) as context:
+            server: FlashMCP = self
+            while not server._prompt_manager.has_prompt(name):
+                if (mounted := server._mount_index.resolve_name(name)) is None:
                     raise NotFoundError(f"Unknown prompt: {name}")
+                server, name = mounted[0].server, mounted[1]
+                if _handles_requests(server, "_mcp_get_prompt"):
+                    return await server._mcp_get_prompt(name, arguments)
+                context.FlashMCP = server
+            return await server._prompt_manager.render_prompt(
+                name, arguments=arguments or {}
+            )
 
     def add_tool(
         self,
@@ -445,6 +806,14 @@ class FlashMCP(Generic[LifespanResultT]):
         description: str | None = None,
         tags: set[str] | None = None,
         annotations: ToolAnnotations | dict[str, Any] | None = None,
+        execution: ToolExecution | None = None,
+        cache_ttl: float | None = None,
+        cache_max_entries: int | None = None,
+        coalesce: bool = False,
+        max_concurrency: int | None = None,
+        max_queue: int | None = None,
+        queue_timeout: float | None = None,
+        timeout: float | None = None,
     ) -> None:
         """Add a tool to the server.
 
@@ -457,6 +826,23 @@ class FlashMCP(Generic[LifespanResultT]):
             description: Optional description of what the tool does
             tags: Optional set of tags for categorizing the tool
             annotations: Optional annotations about the tool's behavior
+            execution: Optional execution policy for the tool ("inline",
+                "thread" or "process"), overriding the server's `tool_execution`
+                default
+            cache_ttl: Optional number of seconds to cache the tool's results
+                for, keyed on its validated arguments. 0 disables caching. By
+                default only tools annotated with `idempotentHint` are cached.
+            cache_max_entries: Optional maximum number of results to cache
+            coalesce: If True, concurrent calls with identical arguments share a
+                single execution and its result
+            max_concurrency: Optional maximum number of calls to the tool that
+                may run at once
+            max_queue: Optional maximum number of calls waiting for a slot when
+                `max_concurrency` is reached; further calls fail immediately
+            queue_timeout: Optional number of seconds a call may wait for a slot
+                before it fails
+            timeout: Optional number of seconds a call may run before it is
+                cancelled, overriding the server's `tool_timeout` default
         """
         if isinstance(annotations, dict):
             annotations = ToolAnnotations(**annotations)
@@ -464,11 +850,20 @@ class FlashMCP(Generic[LifespanResultT]):
         self._tool_manager.add_tool_from_fn(
             fn,
             name=name,
+            parameters=self._snapshot_parameters("tools", name, fn),
             description=description,
             tags=tags,
             annotations=annotations,
+            execution=execution,
+            cache_ttl=cache_ttl,
+            cache_max_entries=cache_max_entries,
+            coalesce=coalesce,
+            max_concurrency=max_concurrency,
+            max_queue=max_queue,
+            queue_timeout=queue_timeout,
+            timeout=timeout,
         )
-        self._cache.clear()
+        self._catalogue_changed("tools")
 
     def remove_tool(self, name: str) -> None:
         """Remove a tool from the server.
@@ -480,7 +875,7 @@ class FlashMCP(Generic[LifespanResultT]):
             NotFoundError: If the tool is not found
         """
         self._tool_manager.remove_tool(name)
-        self._cache.clear()
+        self._catalogue_changed("tools")
 
     def tool(
         self,
@@ -488,6 +883,14 @@ class FlashMCP(Generic[LifespanResultT]):
         description: str | None = None,
         tags: set[str] | None = None,
         annotations: ToolAnnotations | dict[str, Any] | None = None,
+        execution: ToolExecution | None = None,
+        cache_ttl: float | None = None,
+        cache_max_entries: int | None = None,
+        coalesce: bool = False,
+        max_concurrency: int | None = None,
+        max_queue: int | None = None,
+        queue_timeout: float | None = None,
+        timeout: float | None = None,
     ) -> Callable[[AnyFunction], AnyFunction]:
         """Decorator to register a tool.
 
@@ -500,12 +903,37 @@ class FlashMCP(Generic[LifespanResultT]):
             description: Optional description of what the tool does
             tags: Optional set of tags for categorizing the tool
             annotations: Optional annotations about the tool's behavior
+            execution: Optional execution policy for the tool ("inline",
+                "thread" or "process"), overriding the server's `tool_execution`
+                default
+            cache_ttl: Optional number of seconds to cache the tool's results
+                for, keyed on its validated arguments. 0 disables caching. By
+                default only tools annotated with `idempotentHint` are cached.
+            cache_max_entries: Optional maximum number of results to cache
+            coalesce: If True, concurrent calls with identical arguments share a
+                single execution and its result
+            max_concurrency: Optional maximum number of calls to the tool that
+                may run at once
+            max_queue: Optional maximum number of calls waiting for a slot when
+                `max_concurrency` is reached; further calls fail immediately
+            queue_timeout: Optional number of seconds a call may wait for a slot
+                before it fails
+            timeout: Optional number of seconds a call may run before it is
+                cancelled, overriding the server's `tool_timeout` default
 
         Example:
             @server.tool()
             def my_tool(x: int) -> str:
                 return str(x)
 
+            @server.tool(execution="thread")
+            def blocking_tool(path: str) -> str:
+                return Path(path).read_text()
+
+            @server.tool(cache_ttl=300)
+            def lookup(key: str) -> str:
+                return expensive_lookup(key)
+
             @server.tool()
             def tool_with_context(x: int, ctx: Context) -> str:
                 ctx.info(f"Processing {x}")
@@ -531,6 +959,14 @@ class FlashMCP(Generic[LifespanResultT]):
                 description=description,
                 tags=tags,
                 annotations=annotations,
+                execution=execution,
+                cache_ttl=cache_ttl,
+                cache_max_entries=cache_max_entries,
+                coalesce=coalesce,
+                max_concurrency=max_concurrency,
+                max_queue=max_queue,
+                queue_timeout=queue_timeout,
+                timeout=timeout,
             )
             return fn
 
@@ -544,7 +980,7 @@ class FlashMCP(Generic[LifespanResultT]):
         """
 
         self._resource_manager.add_resource(resource, key=key)
-        self._cache.clear()
+        self._catalogue_changed("resources")
 
     def add_resource_fn(
         self,
@@ -554,6 +990,7 @@ class FlashMCP(Generic[LifespanResultT]):
         description: str | None = None,
         mime_type: str | None = None,
         tags: set[str] | None = None,
+        cache_ttl: float | None = None,
     ) -> None:
         """Add a resource or template to the server from a function.
 
@@ -567,16 +1004,19 @@ class FlashMCP(Generic[LifespanResultT]):
             description: Optional description of the resource
             mime_type: Optional MIME type for the resource
             tags: Optional set of tags for categorizing the resource
+            cache_ttl: Optional number of seconds to cache the contents for
         """
         self._resource_manager.add_resource_or_template_from_fn(
             fn=fn,
             uri=uri,
+            parameters=self._snapshot_parameters("resource_templates", uri, fn),
             name=name,
             description=description,
             mime_type=mime_type,
             tags=tags,
+            cache_ttl=cache_ttl,
         )
-        self._cache.clear()
+        self._catalogue_changed("resources", "resource_templates")
 
     def resource(
         self,
@@ -586,6 +1026,7 @@ class FlashMCP(Generic[LifespanResultT]):
         description: str | None = None,
         mime_type: str | None = None,
         tags: set[str] | None = None,
+        cache_ttl: float | None = None,
     ) -> Callable[[AnyFunction], AnyFunction]:
         """Decorator to register a function as a resource.
 
@@ -608,6 +1049,8 @@ class FlashMCP(Generic[LifespanResultT]):
             description: Optional description of the resource
             mime_type: Optional MIME type for the resource
             tags: Optional set of tags for categorizing the resource
+            cache_ttl: Optional number of seconds to cache the contents for, so
+                repeated reads of the same URI skip the function
 
         Example:
             @server.resource("resource://my-resource")
@@ -648,6 +1091,7 @@ class FlashMCP(Generic[LifespanResultT]):
                 description=description,
                 mime_type=mime_type,
                 tags=tags,
+                cache_ttl=cache_ttl,
             )
             return fn
 
@@ -668,10 +1112,11 @@ class FlashMCP(Generic[LifespanResultT]):
         self._prompt_manager.add_prompt_from_fn(
             fn=fn,
             name=name,
+            parameters=self._snapshot_parameters("prompts", name, fn),
             description=description,
             tags=tags,
         )
-        self._cache.clear()
+        self._catalogue_changed("prompts")
 
     def prompt(
         self,
@@ -1039,12 +1484,19 @@ class FlashMCP(Generic[LifespanResultT]):
             server=server,
             prefix=prefix,
         )
+        if (replaced := self._mounted_servers.get(prefix)) is not None:
+            # the replaced server no longer reports its changes to this one
+            replaced.server._mounted_on.remove((self, prefix))
         self._mounted_servers[prefix] = mounted_server
-        self._cache.clear()
+        self._mount_index = MountIndex(self._mounted_servers.values())
+        server._mounted_on.append((self, prefix))
+        self._catalogue_changed()
 
     def unmount(self, prefix: str) -> None:
-        self._mounted_servers.pop(prefix)
-        self._cache.clear()
+        mounted_server = self._mounted_servers.pop(prefix)
+        self._mount_index = MountIndex(self._mounted_servers.values())
+        mounted_server.server._mounted_on.remove((self, prefix))
+        self._catalogue_changed()
 
     async def import_server(
         self,
@@ -1136,7 +1588,7 @@ class FlashMCP(Generic[LifespanResultT]):
         logger.debug(f"Imported resources and templates with prefix '{prefix}/'")
         logger.debug(f"Imported prompts with prefix '{prompt_prefix}'")
 
-        self._cache.clear()
+        self._catalogue_changed()
 
     @classmethod
     def from_openapi(
@@ -1261,32 +1713,51 @@ class MountedServer:
     ):
         self.server = server
         self.prefix = prefix
+        # kind -> (server's generation of the kind, prefixed components)
+        self._snapshots: dict[CatalogueKind, tuple[int, dict[str, Any]]] = {}
+
+    async def get_catalogue(self, kind: CatalogueKind) -> dict[str, Any]:
+        """Get the mounted server's components of a kind, with prefixed keys.
+
+        The prefixed components are reused until the mounted server's
+        catalogue changes, so a change elsewhere in the parent doesn't prefix
+        them again.
+        """
+        generation = self.server._generations[kind]
+        cached = self._snapshots.get(kind)
+        if (
+            cached is not None
+            and cached[0] == generation
+            and self.server._watches_catalogue(kind)
+        ):
+            return cached[1]
+        components = await getattr(self.server, f"get_{kind}")()
+        if kind == "tools" or kind == "prompts":
+            prefixed = {f"{self.prefix}_{key}": c for key, c in components.items()}
+        else:
+            prefixed = {
+                add_resource_prefix(
+                    key, self.prefix, self.server.resource_prefix_format
+                ): component
+                for key, component in components.items()
+            }
+        if generation == self.server._generations[kind] and (
+            self.server._watches_catalogue(kind)
+        ):
+            self._snapshots[kind] = (generation, prefixed)
+        return prefixed
 
     async def get_tools(self) -> dict[str, Tool]:
-        tools = await self.server.get_tools()
-        return {f"{self.prefix}_{key}": tool for key, tool in tools.items()}
+        return await self.get_catalogue("tools")
 
     async def get_resources(self) -> dict[str, Resource]:
-        resources = await self.server.get_resources()
-        return {
-            add_resource_prefix(
-                key, self.prefix, self.server.resource_prefix_format
-            ): resource
-            for key, resource in resources.items()
-        }
+        return await self.get_catalogue("resources")
 
     async def get_resource_templates(self) -> dict[str, ResourceTemplate]:
-        templates = await self.server.get_resource_templates()
-        return {
-            add_resource_prefix(
-                key, self.prefix, self.server.resource_prefix_format
-            ): template
-            for key, template in templates.items()
-        }
+        return await self.get_catalogue("resource_templates")
 
     async def get_prompts(self) -> dict[str, Prompt]:
-        prompts = await self.server.get_prompts()
-        return {f"{self.prefix}_{key}": prompt for key, prompt in prompts.items()}
+        return await self.get_catalogue("prompts")
 
     def match_tool(self, key: str) -> bool:
         return key.startswith(f"{self.prefix}_")
@@ -1309,6 +1780,82 @@ class MountedServer:
         return key.removeprefix(f"{self.prefix}_")
 
 
+def _handles_requests(server: FlashMCP, method: str) -> bool:
+    """Check if a server overrides how it handles a kind of request (as proxies
+    do), so requests must be passed to it instead of resolved through it."""
+    return getattr(type(server), method) is not getattr(FlashMCP, method)
+
+
+class MountIndex:
+    """The mounted servers of a server, indexed by prefix to route requests.
+
+    A name or URI is resolved by looking up its first characters for each
+    length of prefix that is mounted, longest first, rather than by checking
+    every mounted server. When several prefixes match, the longest one wins.
+    The index is rebuilt whenever a server is mounted or unmounted.
+    """
+
+    def __init__(self, mounted_servers: Iterable[MountedServer] = ()):
+        # tool and prompt prefixes, as in "prefix_name"
+        self._names = _PrefixTable("_")
+        # resource prefixes, as in "prefix+protocol://path"
+        self._protocol_prefixes = _PrefixTable("+")
+        # resource prefixes, as in "protocol://prefix/path"
+        self._path_prefixes = _PrefixTable("/")
+        for mounted in mounted_servers:
+            self._names.add(mounted.prefix, mounted)
+            if not mounted.prefix:
+                # resources of servers mounted without a prefix keep their URIs
+                continue
+            if mounted.server.resource_prefix_format == "protocol":
+                self._protocol_prefixes.add(mounted.prefix, mounted)
+            else:
+                self._path_prefixes.add(mounted.prefix, mounted)
+
+    def resolve_name(self, name: str) -> tuple[MountedServer, str] | None:
+        """Get the mounted server a tool or prompt name belongs to, and the
+        name on that server."""
+        return self._names.resolve(name)
+
+    def resolve_uri(self, uri: str) -> tuple[MountedServer, str] | None:
+        """Get the mounted server a resource URI belongs to, and the URI on
+        that server."""
+        if (resolved := self._protocol_prefixes.resolve(uri)) is not None:
+            return resolved
+        if self._path_prefixes and (match := URI_PATTERN.match(uri)):
+            protocol, path = match.groups()
+            if (resolved := self._path_prefixes.resolve(path)) is not None:
+                mounted, path = resolved
+                return mounted, f"{protocol}{path}"
+        return None
+
+
+class _PrefixTable:
+    """Mounted servers by prefix, for prefixes followed by a separator."""
+
+    def __init__(self, separator: str):
+        self.separator = separator
+        self._prefixes: dict[str, MountedServer] = {}
+        self._lengths: list[int] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._prefixes)
+
+    def add(self, prefix: str, mounted: MountedServer) -> None:
+        self._prefixes[prefix] = mounted
+        self._lengths = sorted({len(p) for p in self._prefixes}, reverse=True)
+
+    def resolve(self, key: str) -> tuple[MountedServer, str] | None:
+        """Get the server for the longest prefix of a key, and the rest of the
+        key after the prefix and separator."""
+        for length in self._lengths:
+            if key[length : length + 1] == self.separator and (
+                mounted := self._prefixes.get(key[:length])
+            ):
+                return mounted, key[length + 1 :]
+        return None
+
+
 def add_resource_prefix(
     uri: str, prefix: str, prefix_format: Literal["protocol", "path"] | None = None
 ) -> str:
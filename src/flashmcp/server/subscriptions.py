@@ -0,0 +1,242 @@
+"""Resource subscriptions and change notifications."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import anyio
+from anyio.abc import TaskGroup, TaskStatus
+from mcp.server.session import ServerSession
+from pydantic import AnyUrl
+
+import FlashMCP
+from FlashMCP.exceptions import ResourceError
+from FlashMCP.resources import Resource
+from FlashMCP.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
+Hold = Callable[[], AbstractAsyncContextManager[None]]
+
+_current_session: ContextVar[SessionSubscriptions | None] = ContextVar(
+    "session_subscriptions", default=None
+)
+
+
+class ResourceSubscriptions:
+    """The resources each session of a server is subscribed to.
+
+    Changes are collected for `resource_notification_debounce` seconds and then
+    sent as `resources/updated` notifications to every subscribed session, so a
+    burst of changes results in a single notification per session and resource.
+
+    Resources that implement `get_cache_validator` (such as files and
+    directories) are watched while they have subscribers, by checking their
+    validator every `resource_watch_interval` seconds. Other resources are only
+    reported as changed when `notify` is called.
+
+    Resources a server reads from elsewhere, such as those of a proxy's remote
+    server, are subscribed to with a `hold`: a context that keeps a
+    subscription to the resource open for as long as it is entered.
+
+    Watching, holding and sending notifications happen in a task group of the session,
+    entered by `run()` from the session's lifespan, so they stop when the
+    session ends.
+    """
+
+    def __init__(self):
+        self._sessions: set[SessionSubscriptions] = set()
+
+    @asynccontextmanager
+    async def run(self) -> AsyncIterator[None]:
+        """Run the subscriptions of the session whose lifespan enters this
+        context. They are dropped, and their tasks cancelled, when it exits."""
+        async with anyio.create_task_group() as tg:
+            subscriptions = SessionSubscriptions(tg)
+            self._sessions.add(subscriptions)
+            token = _current_session.set(subscriptions)
+            try:
+                yield
+            finally:
+                _current_session.reset(token)
+                self._sessions.discard(subscriptions)
+                tg.cancel_scope.cancel()
+
+    def subscribers(self, uri: str) -> list[ServerSession]:
+        """Get the sessions subscribed to a URI."""
+        return [
+            subscriptions.session
+            for subscriptions in self._sessions
+            if subscriptions.session is not None and uri in subscriptions.uris
+        ]
+
+    async def subscribe(
+        self,
+        uri: str,
+        resource: Resource | None,
+        session: ServerSession,
+        hold: Hold | None = None,
+    ) -> None:
+        """Subscribe a session to changes of the resource at a URI.
+
+        Args:
+            uri: The URI subscribed to
+            resource: The resource, if the server has it
+            session: The subscribing session
+            hold: A context to enter while the session is subscribed, for
+                resources the server reads from elsewhere
+
+        Raises:
+            RuntimeError: If the session is not running in `run()`
+        """
+        subscriptions = _current_session.get()
+        if subscriptions is None or subscriptions not in self._sessions:
+            raise RuntimeError("Resource subscriptions require a running session")
+        await subscriptions.subscribe(uri, resource, session, hold)
+
+    def unsubscribe(self, uri: str, session: ServerSession) -> None:
+        """Unsubscribe a session from changes of the resource at a URI."""
+        for subscriptions in list(self._sessions):
+            if subscriptions.session is session:
+                subscriptions.unsubscribe(uri)
+
+    def notify(self, uri: str) -> None:
+        """Report that the resource at a URI changed.
+
+        The notification is sent after the debounce interval, from a background
+        task, so this can be called as often as the resource changes.
+        """
+        for subscriptions in list(self._sessions):
+            subscriptions.notify(uri)
+
+
+class SessionSubscriptions:
+    """The subscriptions of one session, along with the tasks watching their
+    resources and notifying the session of changes."""
+
+    def __init__(self, task_group: TaskGroup):
+        self._task_group = task_group
+        self.session: ServerSession | None = None
+        self.uris: set[str] = set()
+        # watched uri -> (resource, last validator)
+        self._watched: dict[str, tuple[Resource, Any]] = {}
+        # held uri -> the cancel scope of the task holding it
+        self._holds: dict[str, anyio.CancelScope] = {}
+        self._pending: set[str] = set()
+        self._flushing = False
+        self._watching = False
+
+    async def subscribe(
+        self,
+        uri: str,
+        resource: Resource | None,
+        session: ServerSession,
+        hold: Hold | None,
+    ) -> None:
+        if hold is not None and uri not in self._holds:
+            # raises if the subscription can't be held
+            await self._task_group.start(self._hold, uri, hold)
+        if (
+            resource is not None
+            and uri not in self._watched
+            and _is_watchable(resource)
+        ):
+            self._watched[uri] = (resource, await _get_validator(resource))
+            if not self._watching:
+                self._watching = True
+                self._task_group.start_soon(self._watch)
+        self.session = session
+        self.uris.add(uri)
+
+    def unsubscribe(self, uri: str) -> None:
+        self.uris.discard(uri)
+        self._watched.pop(uri, None)
+        if (scope := self._holds.pop(uri, None)) is not None:
+            scope.cancel()
+
+    def notify(self, uri: str) -> None:
+        if uri not in self.uris:
+            return
+        self._pending.add(uri)
+        if not self._flushing:
+            self._flushing = True
+            self._task_group.start_soon(self._flush)
+
+    async def _flush(self) -> None:
+        await anyio.sleep(FlashMCP.settings.settings.resource_notification_debounce)
+        # changes reported while sending are sent by the next flush
+        self._flushing = False
+        pending, self._pending = self._pending, set()
+        for uri in pending:
+            if uri not in self.uris or self.session is None:
+                continue
+            try:
+                await self.session.send_resource_updated(AnyUrl(uri))
+            except Exception as e:
+                # the session is gone, so it won't be sent any more notifications
+                logger.debug(f"Dropping resource subscriptions: {e}")
+                self.uris.clear()
+                self._watched.clear()
+                for scope in self._holds.values():
+                    scope.cancel()
+                self._holds.clear()
+                return
+
+    async def _hold(
+        self,
+        uri: str,
+        hold: Hold,
+        *,
+        task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED,
+    ) -> None:
+        started = False
+        with anyio.CancelScope() as scope:
+            try:
+                async with hold():
+                    self._holds[uri] = scope
+                    task_status.started()
+                    started = True
+                    await anyio.sleep_forever()
+            except Exception:
+                # errors before the subscription is held go to the subscriber
+                if not started:
+                    raise
+                logger.exception(f"Error ending subscription to {uri}")
+            finally:
+                if self._holds.get(uri) is scope:
+                    del self._holds[uri]
+
+    async def _watch(self) -> None:
+        try:
+            while self._watched:
+                await anyio.sleep(FlashMCP.settings.settings.resource_watch_interval)
+                for uri, (resource, validator) in list(self._watched.items()):
+                    try:
+                        current = await _get_validator(resource)
+                    except Exception:
+                        # changes are still reported when `notify` is called
+                        logger.exception(
+                            f"Error watching resource {uri}; not watching it any more"
+                        )
+                        self._watched.pop(uri, None)
+                        continue
+                    if current != validator and uri in self._watched:
+                        self._watched[uri] = (resource, current)
+                        self.notify(uri)
+        finally:
+            self._watching = False
+
+
+def _is_watchable(resource: Resource) -> bool:
+    return type(resource).get_cache_validator is not Resource.get_cache_validator
+
+
+async def _get_validator(resource: Resource) -> Any:
+    try:
+        return await resource.get_cache_validator()
+    except ResourceError:
+        # e.g. a deleted file; it is reported as changed when it comes back
+        return None
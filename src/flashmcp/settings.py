@@ -15,6 +15,10 @@ LOG_LEVEL = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
 DuplicateBehavior = Literal["warn", "error", "replace", "ignore"]
 
+ToolExecution = Literal["inline", "thread", "process"]
+
+SerializationProfile = Literal["compact", "pretty"]
+
 
 class Settings(BaseSettings):
     """FlashMCP settings."""
@@ -77,6 +81,158 @@ class Settings(BaseSettings):
         ),
     ] = False
 
+    image_max_bytes: Annotated[
+        int,
+        Field(
+            default=50_000_000,
+            description=inspect.cleandoc(
+                """
+                The maximum size, in bytes, of an image returned with the Image
+                helper. Larger images are rejected before they are read or
+                encoded.
+                """
+            ),
+        ),
+    ] = 50_000_000
+
+    serialization: Annotated[
+        SerializationProfile,
+        Field(
+            default="pretty",
+            description=inspect.cleandoc(
+                """
+                How tool, prompt and resource results that are not already
+                strings are serialized to JSON text. "pretty" indents with two
+                spaces; "compact" omits all optional whitespace, which produces
+                smaller payloads and encodes faster.
+                """
+            ),
+        ),
+    ] = "pretty"
+
+    http_max_connections: Annotated[
+        int,
+        Field(
+            default=100,
+            description=inspect.cleandoc(
+                """
+                The maximum number of concurrent connections in the pool shared
+                by HTTP resources.
+                """
+            ),
+        ),
+    ] = 100
+
+    http_max_keepalive_connections: Annotated[
+        int,
+        Field(
+            default=20,
+            description=inspect.cleandoc(
+                """
+                The maximum number of idle connections kept open in the pool
+                shared by HTTP resources.
+                """
+            ),
+        ),
+    ] = 20
+
+    http_timeout: Annotated[
+        float,
+        Field(
+            default=30.0,
+            description=inspect.cleandoc(
+                """
+                The timeout, in seconds, for requests made by HTTP resources.
+                """
+            ),
+        ),
+    ] = 30.0
+
+    http2: Annotated[
+        bool,
+        Field(
+            default=False,
+            description=inspect.cleandoc(
+                """
+                Whether HTTP resources may use HTTP/2. Requires the `h2`
+                package (`pip install httpx[http2]`).
+                """
+            ),
+        ),
+    ] = False
+
+    resource_notification_debounce: Annotated[
+        float,
+        Field(
+            default=0.1,
+            description=inspect.cleandoc(
+                """
+                The number of seconds to collect resource changes for before
+                notifying subscribed clients, so a burst of changes to a
+                resource results in a single `resources/updated` notification.
+                """
+            ),
+        ),
+    ] = 0.1
+
+    resource_watch_interval: Annotated[
+        float,
+        Field(
+            default=1.0,
+            description=inspect.cleandoc(
+                """
+                The number of seconds between checks for changes to subscribed
+                file and directory resources.
+                """
+            ),
+        ),
+    ] = 1.0
+
+    list_page_size: Annotated[
+        int | None,
+        Field(
+            default=None,
+            description=inspect.cleandoc(
+                """
+                The maximum number of tools, resources, resource templates or
+                prompts returned by a single list request. Larger catalogues are
+                split into pages that clients request with a cursor. None
+                returns everything in one response.
+                """
+            ),
+        ),
+    ] = None
+
+    mount_list_timeout: Annotated[
+        float | None,
+        Field(
+            default=None,
+            description=inspect.cleandoc(
+                """
+                The maximum number of seconds to wait for each mounted server
+                when listing components. Mounted servers that take longer, or
+                fail, are left out of the list and the error is logged. None
+                waits for every mounted server.
+                """
+            ),
+        ),
+    ] = None
+
+    tool_stream_max_bytes: Annotated[
+        int,
+        Field(
+            default=1_000_000,
+            description=inspect.cleandoc(
+                """
+                The maximum size, in bytes, of the final result assembled from
+                a streaming (async generator) tool's chunks. Every chunk is still
+                sent to the client as it is produced; chunks beyond this limit
+                are left out of the final result.
+                """
+            ),
+        ),
+    ] = 1_000_000
+
     @model_validator(mode="after")
     def setup_logging(self) -> Self:
         """Finalize the settings."""
@@ -132,7 +288,7 @@ class ServerSettings(BaseSettings):
         ),
     ] = []
 
-    # cache settings (for checking mounted servers)
+    # deprecated and ignored; mounted servers are no longer polled
     cache_expiration_seconds: float = 0
 
     auth: AuthSettings | None = None
@@ -0,0 +1,425 @@
+"""Execution policies for running tool functions."""
+
+from __future__ import annotations as _annotations
+
+import importlib
+import inspect
+import multiprocessing
+import os
+import pickle
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import anyio
+import anyio.to_thread
+from mcp.types import EmbeddedResource, ImageContent, TextContent
+from pydantic_core import ArgsKwargs, SchemaValidator
+
+from FlashMCP.exceptions import ToolRejectedError
+from FlashMCP.settings import ToolExecution
+from FlashMCP.utilities.logging import get_logger
+from FlashMCP.utilities.types import get_cached_typeadapter
+
+if TYPE_CHECKING:
+    from FlashMCP.tools.tool import Tool
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class ToolExecutionStats:
+    """Counters for tool calls offloaded to a worker pool."""
+
+    calls: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    queue_depth: int = 0
+    running: int = 0
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        if not self.calls:
+            return 0.0
+        return self.total_wait_seconds / self.calls
+
+
+@lru_cache(maxsize=5000)
+def get_arguments_validator(fn: Callable[..., Any]) -> SchemaValidator:
+    """
+    Build a validator for a function's arguments that does not call the
+    function. It reuses the arguments schema pydantic generates for the
+    function, so validation behaves exactly like calling through a
+    TypeAdapter. The validator returns an `(args, kwargs)` tuple.
+    """
+
+    def arguments_schema(schema: Any) -> Any:
+        if schema["type"] == "definitions":
+            return {**schema, "schema": arguments_schema(schema["schema"])}
+        if schema["type"] == "call":
+            return schema["arguments_schema"]
+        raise ValueError(
+            f"Unsupported schema type for tool arguments: {schema['type']}"
+        )
+
+    return SchemaValidator(arguments_schema(get_cached_typeadapter(fn).core_schema))
+
+
+def _initialize_worker(modules: list[str]) -> None:
+    """Import tool modules when a worker process starts."""
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.warning(f"Could not pre-import module {module!r} in worker: {e}")
+
+
+def _call_in_worker(
+    fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Any:
+    return fn(*args, **kwargs)
+
+
+class ToolExecutor:
+    """Runs tools according to their execution policy.
+
+    - "inline": the tool function is called directly on the event loop.
+    - "thread": synchronous tool functions are called in an anyio worker
+      thread, bounded by a capacity limiter shared by all of the server's
+      threaded tools.
+    - "process": synchronous tool functions are called in a persistent pool
+      of worker processes. Arguments are validated and results are converted
+      to content in the server process; only the validated arguments and the
+      raw result cross the process boundary, so both must be picklable, and
+      the function itself must be importable by reference (a module-level
+      function that does not take a Context).
+
+    Async tool functions always run inline, since offloading them would only
+    add overhead. Tools that override `Tool.run` (such as proxy or OpenAPI
+    tools) are also always run inline.
+    """
+
+    def __init__(
+        self,
+        execution: ToolExecution | None = None,
+        thread_limit: int | None = None,
+        process_workers: int | None = None,
+    ):
+        if execution is None:
+            execution = "inline"
+
+        if execution not in ToolExecution.__args__:
+            raise ValueError(
+                f"Invalid execution: {execution}. "
+                f"Must be one of: {', '.join(ToolExecution.__args__)}"
+            )
+
+        self.execution: ToolExecution = execution
+        self.limiter = anyio.CapacityLimiter(thread_limit or 40)
+        self._stats = ToolExecutionStats()
+
+        self.process_workers = process_workers
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._process_limiter: anyio.CapacityLimiter | None = None
+        self._process_stats = ToolExecutionStats()
+        self._process_modules: set[str] = set()
+
+    @property
+    def stats(self) -> ToolExecutionStats:
+        """Current thread pool statistics."""
+        return self._update_stats(self._stats, self.limiter)
+
+    @property
+    def process_stats(self) -> ToolExecutionStats:
+        """Current process pool statistics."""
+        return self._update_stats(self._process_stats, self._process_limiter)
+
+    def _update_stats(
+        self, stats: ToolExecutionStats, limiter: anyio.CapacityLimiter | None
+    ) -> ToolExecutionStats:
+        if limiter is not None:
+            limiter_stats = limiter.statistics()
+            stats.queue_depth = limiter_stats.tasks_waiting
+            stats.running = limiter_stats.borrowed_tokens
+        return stats
+
+    def resolve(self, tool: Tool) -> ToolExecution:
+        """Get the execution policy that applies to a tool."""
+        from FlashMCP.tools.tool import Tool
+
+        execution = tool.execution or self.execution
+        # checked last, since it builds the tool's call plan
+        if (
+            execution == "inline"
+            or type(tool).run is not Tool.run
+            or tool.call_plan.is_async
+        ):
+            return "inline"
+        return execution
+
+    def register(self, tool: Tool) -> None:
+        """Check that a tool can run under its execution policy.
+
+        Raises:
+            ValueError: If the tool uses process execution but its function
+                can not be sent to a worker process.
+        """
+        if self.resolve(tool) != "process":
+            return
+
+        if tool.call_plan.context_kwarg is not None:
+            raise ValueError(
+                f"Tool {tool.name!r} can not use process execution because it "
+                "requests a Context"
+            )
+        try:
+            pickle.dumps(tool.fn)
+        except Exception as e:
+            raise ValueError(
+                f"Tool {tool.name!r} can not use process execution because its "
+                "function can not be pickled. Process tools must be module-level "
+                "functions."
+            ) from e
+
+        # workers pre-import the modules known when the pool starts; modules
+        # of tools registered later are imported on their first call
+        module = getattr(tool.fn, "__module__", None)
+        if module and module != "__main__":
+            self._process_modules.add(module)
+
+    async def run(
+        self, tool: Tool, arguments: dict[str, Any]
+    ) -> list[TextContent | ImageContent | EmbeddedResource]:
+        """Run a tool with arguments according to its execution policy."""
+        execution = self.resolve(tool)
+        if execution == "inline":
+            return await tool.run(arguments)
+
+        arguments = tool.prepare_arguments(arguments)
+        if execution == "thread":
+            result = await self.run_sync_in_thread(tool.call_plan.validate, arguments)
+        else:
+            args, kwargs = get_arguments_validator(tool.fn).validate_python(
+                ArgsKwargs((), arguments)
+            )
+            result = await self.run_sync_in_process(tool.fn, args, kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+
+        return await tool.convert_result(result)
+
+    async def run_sync_in_thread(
+        self, fn: Callable[[dict[str, Any]], Any], arguments: dict[str, Any]
+    ) -> Any:
+        """Call `fn(arguments)` in a worker thread, recording queue wait time."""
+        submitted = time.perf_counter()
+        started: float | None = None
+
+        def call() -> Any:
+            nonlocal started
+            started = time.perf_counter()
+            return fn(arguments)
+
+        # abandon the thread on cancellation (for example, a timeout) so the
+        # caller is not held up; the function runs to completion regardless
+        try:
+            return await anyio.to_thread.run_sync(
+                call, limiter=self.limiter, abandon_on_cancel=True
+            )
+        finally:
+            if started is not None:
+                self._record_wait(self._stats, started - submitted)
+
+    async def run_sync_in_process(
+        self,
+        fn: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Call `fn(*args, **kwargs)` in the process pool, recording queue wait time."""
+        pool, limiter = self._get_process_pool()
+        submitted = time.perf_counter()
+        started: float | None = None
+
+        # each in-flight call holds one limiter token while it waits on the
+        # pool, so calls beyond the worker count queue here, where they can be
+        # measured, rather than inside the executor
+        def call() -> Any:
+            nonlocal started
+            started = time.perf_counter()
+            return pool.submit(_call_in_worker, fn, args, kwargs).result()
+
+        try:
+            return await anyio.to_thread.run_sync(
+                call, limiter=limiter, abandon_on_cancel=True
+            )
+        finally:
+            if started is not None:
+                self._record_wait(self._process_stats, started - submitted)
+
+    def _get_process_pool(self) -> tuple[ProcessPoolExecutor, anyio.CapacityLimiter]:
+        if self._process_pool is None or self._process_limiter is None:
+            workers = self.process_workers or os.cpu_count() or 1
+            # spawn (rather than fork) so workers never inherit the server's
+            # threads or event loop state
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker,
+                initargs=(sorted(self._process_modules),),
+            )
+            self._process_limiter = anyio.CapacityLimiter(workers)
+        return self._process_pool, self._process_limiter
+
+    def shutdown(self) -> None:
+        """Shut down the process pool, if one was started, waiting for running
+        calls to finish. The server does this when it stops running; a later
+        call starts a new pool."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True, cancel_futures=True)
+            self._process_pool = None
+            self._process_limiter = None
+
+    def _record_wait(self, stats: ToolExecutionStats, wait: float) -> None:
+        stats.calls += 1
+        stats.total_wait_seconds += wait
+        stats.max_wait_seconds = max(stats.max_wait_seconds, wait)
+
+
+@dataclass
+class CoalescingStats:
+    """Counters for a `CallCoalescer`."""
+
+    executions: int = 0
+    coalesced: int = 0
+    in_flight: int = 0
+
+
+class _InFlightCall(Generic[T]):
+    def __init__(self):
+        self.done = anyio.Event()
+        self.completed = False
+        self.result: T | None = None
+        self.error: Exception | None = None
+
+
+class CallCoalescer:
+    """Shares one in-flight execution between concurrent calls with the same key.
+
+    The first caller for a key runs the call; callers that arrive while it is
+    running wait for it and receive the same result or exception. Nothing is
+    kept once the call finishes, so this is independent of result caching.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, _InFlightCall[Any]] = {}
+        self._stats = CoalescingStats()
+
+    @property
+    def stats(self) -> CoalescingStats:
+        self._stats.in_flight = len(self._calls)
+        return self._stats
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        while (call := self._calls.get(key)) is not None:
+            await call.done.wait()
+            if call.completed:
+                self._stats.coalesced += 1
+                if call.error is not None:
+                    raise call.error
+                return call.result  # type: ignore[return-value]
+            # the running call was cancelled before it finished, so there is
+            # no result to share; run the call again
+
+        call = _InFlightCall[T]()
+        self._calls[key] = call
+        self._stats.executions += 1
+        try:
+            call.result = await fn()
+            call.completed = True
+            return call.result
+        except Exception as e:
+            call.error = e
+            call.completed = True
+            raise
+        finally:
+            del self._calls[key]
+            call.done.set()
+
+
+@dataclass
+class ConcurrencyStats:
+    """Counters for a `ConcurrencyLimit`."""
+
+    admitted: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    queue_depth: int = 0
+    running: int = 0
+
+
+class ConcurrencyLimit:
+    """Bounds how many calls to a tool run at once.
+
+    Calls beyond `max_concurrency` wait in a queue. When `max_queue` calls are
+    already waiting, new calls are rejected immediately, and calls that wait
+    longer than `queue_timeout` seconds are rejected as well, so an overloaded
+    tool fails fast instead of piling up requests.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int | None = None,
+        queue_timeout: float | None = None,
+    ):
+        self.limiter = anyio.CapacityLimiter(max_concurrency)
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._stats = ConcurrencyStats()
+
+    @property
+    def stats(self) -> ConcurrencyStats:
+        limiter_stats = self.limiter.statistics()
+        self._stats.queue_depth = limiter_stats.tasks_waiting
+        self._stats.running = limiter_stats.borrowed_tokens
+        return self._stats
+
+    @asynccontextmanager
+    async def acquire(self, name: str) -> AsyncIterator[None]:
+        """Hold a slot for a call to the tool `name`.
+
+        Raises:
+            ToolRejectedError: If the queue is full or the call waited longer
+                than `queue_timeout`.
+        """
+        if (
+            self.max_queue is not None
+            and self.limiter.available_tokens < 1
+            and self.limiter.statistics().tasks_waiting >= self.max_queue
+        ):
+            self._stats.rejected += 1
+            raise ToolRejectedError(
+                f"Tool {name!r} is at capacity, please try again later"
+            )
+
+        try:
+            with anyio.fail_after(self.queue_timeout):
+                await self.limiter.acquire()
+        except TimeoutError:
+            self._stats.timed_out += 1
+            raise ToolRejectedError(
+                f"Tool {name!r} is at capacity, please try again later"
+            ) from None
+
+        self._stats.admitted += 1
+        try:
+            yield
+        finally:
+            self.limiter.release()
@@ -2,22 +2,32 @@ from __future__ import annotations
 
 import inspect
 import json
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Annotated, Any
 
+import anyio.to_thread
 import pydantic_core
 from mcp.types import EmbeddedResource, ImageContent, TextContent, ToolAnnotations
 from mcp.types import Tool as MCPTool
-from pydantic import BaseModel, BeforeValidator, Field
+from pydantic import BeforeValidator, Field, PrivateAttr
 
 import FlashMCP
 from FlashMCP.server.dependencies import get_context
-from FlashMCP.utilities.json_schema import compress_schema
+from FlashMCP.settings import ToolExecution
+from FlashMCP.utilities.components import FlashMCPComponent
 from FlashMCP.utilities.logging import get_logger
+from FlashMCP.utilities.serialization import (
+    RawJSON,
+    get_serializer,
+    pretty_serializer,
+)
 from FlashMCP.utilities.types import (
     Image,
     _convert_set_defaults,
     find_kwarg_by_type,
+    get_cached_parameters_schema,
     get_cached_typeadapter,
 )
 
@@ -27,11 +37,51 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-def default_serializer(data: Any) -> str:
-    return pydantic_core.to_json(data, fallback=str, indent=2).decode()
+default_serializer = pretty_serializer
+
+
+@dataclass(frozen=True)
+class ToolCallPlan:
+    """Everything `Tool.run` needs to know about a function, computed once.
+
+    Building the plan requires signature inspection and TypeAdapter
+    construction, so it is done when the tool is created (or lazily on the
+    first call) rather than on every invocation.
+    """
+
+    context_kwarg: str | None
+    json_parse_params: tuple[str, ...]
+    validate: Callable[[Any], Any]
+    is_async: bool
+
+    @classmethod
+    def from_function(
+        cls, fn: Callable[..., Any], parameters: dict[str, Any]
+    ) -> ToolCallPlan:
+        from FlashMCP.server.context import Context
+
+        signature = inspect.signature(fn)
 
+        # parameters that may arrive as stringified JSON; simple types are
+        # skipped because pydantic already coerces them from strings
+        json_parse_params = tuple(
+            name
+            for name in parameters.get("properties", {})
+            if name in signature.parameters
+            and signature.parameters[name].annotation not in (int, float, bool)
+        )
+
+        return cls(
+            context_kwarg=find_kwarg_by_type(fn, kwarg_type=Context),
+            json_parse_params=json_parse_params,
+            validate=get_cached_typeadapter(fn).validate_python,
+            is_async=inspect.iscoroutinefunction(fn)
+            or inspect.iscoroutinefunction(getattr(fn, "__call__", None))
+            or inspect.isasyncgenfunction(fn),
+        )
 
-class Tool(BaseModel):
+
+class Tool(FlashMCPComponent):
     """Internal tool registration info."""
 
     fn: Callable[..., Any]
@@ -47,6 +97,52 @@ class Tool(BaseModel):
     serializer: Callable[[Any], str] | None = Field(
         None, description="Optional custom serializer for tool results"
     )
+    execution: ToolExecution | None = Field(
+        None,
+        description="How to run the tool function; defaults to the server's policy",
+    )
+    cache_ttl: float | None = Field(
+        None,
+        description="Seconds to cache results for; 0 disables caching. Defaults to "
+        "caching only tools annotated as idempotent",
+    )
+    cache_max_entries: int | None = Field(
+        None, description="Maximum number of cached results for the tool"
+    )
+    coalesce: bool = Field(
+        False,
+        description="Share one execution between concurrent calls with identical "
+        "arguments",
+    )
+    max_concurrency: int | None = Field(
+        None, ge=1, description="Maximum number of calls to the tool running at once"
+    )
+    max_queue: int | None = Field(
+        None,
+        ge=0,
+        description="Maximum number of calls waiting for a slot; further calls are "
+        "rejected",
+    )
+    queue_timeout: float | None = Field(
+        None,
+        gt=0,
+        description="Seconds a call may wait for a slot before it is rejected",
+    )
+    timeout: float | None = Field(
+        None,
+        gt=0,
+        description="Seconds a call may run before it is cancelled; defaults to "
+        "the server's timeout",
+    )
+
+    _call_plan: ToolCallPlan | None = PrivateAttr(default=None)
+
+    @property
+    def call_plan(self) -> ToolCallPlan:
+        """The precompiled call plan for this tool's function."""
+        if self._call_plan is None:
+            self._call_plan = ToolCallPlan.from_function(self.fn, self.parameters)
+        return self._call_plan
 
     @classmethod
     def from_function(
@@ -57,8 +153,22 @@ class Tool(BaseModel):
         tags: set[str] | None = None,
         annotations: ToolAnnotations | None = None,
         serializer: Callable[[Any], str] | None = None,
+        execution: ToolExecution | None = None,
+        cache_ttl: float | None = None,
+        cache_max_entries: int | None = None,
+        coalesce: bool = False,
+        max_concurrency: int | None = None,
+        max_queue: int | None = None,
+        queue_timeout: float | None = None,
+        timeout: float | None = None,
+        parameters: dict[str, Any] | None = None,
     ) -> Tool:
-        """Create a Tool from a function."""
+        """Create a Tool from a function.
+
+        If the JSON schema of the function's parameters is given (such as one
+        saved in a catalogue snapshot), it is used instead of being generated,
+        and the tool's call plan is only built when it is first called.
+        """
         from FlashMCP.server.context import Context
 
         # Reject functions with *args or **kwargs
@@ -76,18 +186,13 @@ class Tool(BaseModel):
 
         func_doc = description or fn.__doc__ or ""
 
-        type_adapter = get_cached_typeadapter(fn)
-        schema = type_adapter.json_schema()
-
-        context_kwarg = find_kwarg_by_type(fn, kwarg_type=Context)
-        if context_kwarg:
-            prune_params = [context_kwarg]
+        if parameters is None:
+            context_kwarg = find_kwarg_by_type(fn, kwarg_type=Context)
+            schema = get_cached_parameters_schema(fn, context_kwarg)
         else:
-            prune_params = None
+            schema = parameters
 
-        schema = compress_schema(schema, prune_params=prune_params)
-
-        return cls(
+        tool = cls(
             fn=fn,
             name=func_name,
             description=func_doc,
@@ -95,19 +200,41 @@ class Tool(BaseModel):
             tags=tags or set(),
             annotations=annotations,
             serializer=serializer,
+            execution=execution,
+            cache_ttl=cache_ttl,
+            cache_max_entries=cache_max_entries,
+            coalesce=coalesce,
+            max_concurrency=max_concurrency,
+            max_queue=max_queue,
+            queue_timeout=queue_timeout,
+            timeout=timeout,
         )
+        if parameters is None:
+            tool._call_plan = ToolCallPlan.from_function(fn, schema)
+        return tool
 
     async def run(
         self, arguments: dict[str, Any]
     ) -> list[TextContent | ImageContent | EmbeddedResource]:
         """Run the tool with arguments."""
-        from FlashMCP.server.context import Context
+        arguments = self.prepare_arguments(arguments)
+
+        result = self.call_plan.validate(arguments)
+        if inspect.isawaitable(result):
+            result = await result
+        elif inspect.isasyncgen(result):
+            return await self.stream_result(result)
+
+        return await self.convert_result(result)
+
+    def prepare_arguments(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Inject the context and pre-parse arguments before validation."""
+        plan = self.call_plan
 
         arguments = arguments.copy()
 
-        context_kwarg = find_kwarg_by_type(self.fn, kwarg_type=Context)
-        if context_kwarg and context_kwarg not in arguments:
-            arguments[context_kwarg] = get_context()
+        if plan.context_kwarg and plan.context_kwarg not in arguments:
+            arguments[plan.context_kwarg] = get_context()
 
         if FlashMCP.settings.settings.tool_attempt_parse_json_args:
             # Pre-parse data from JSON in order to handle cases like `["a", "b", "c"]`
@@ -116,35 +243,81 @@ class Tool(BaseModel):
             # Claude desktop is prone to this - in fact it seems incapable of NOT doing
             # this. For sub-models, it tends to pass dicts (JSON objects) as JSON strings,
             # which can be pre-parsed here.
-            signature = inspect.signature(self.fn)
-            for param_name in self.parameters["properties"]:
+            for param_name in plan.json_parse_params:
                 arg = arguments.get(param_name, None)
-                # if not in signature, we won't have annotations, so skip logic
-                if param_name not in signature.parameters:
-                    continue
                 # if not a string, we won't have a JSON to parse, so skip logic
                 if not isinstance(arg, str):
                     continue
-                # skip if the type is a simple type (int, float, bool)
-                if signature.parameters[param_name].annotation in (
-                    int,
-                    float,
-                    bool,
-                ):
-                    continue
                 try:
                     arguments[param_name] = json.loads(arg)
 
                 except json.JSONDecodeError:
                     pass
 
-        type_adapter = get_cached_typeadapter(self.fn)
-        result = type_adapter.validate_python(arguments)
-        if inspect.isawaitable(result):
-            result = await result
+        return arguments
 
+    async def convert_result(
+        self, result: Any
+    ) -> list[TextContent | ImageContent | EmbeddedResource]:
+        """Convert a raw function result to MCP content.
+
+        Results that include image files are converted in a worker thread, so
+        reading and encoding the files does not block the event loop.
+        """
+        if _has_image_file(result):
+            return await anyio.to_thread.run_sync(
+                partial(_convert_to_content, result, serializer=self.serializer)
+            )
         return _convert_to_content(result, serializer=self.serializer)
 
+    async def stream_result(
+        self, chunks: AsyncIterator[Any]
+    ) -> list[TextContent | ImageContent | EmbeddedResource]:
+        """Convert the chunks of an async generator tool as they are produced.
+
+        Each chunk is sent to the client as a progress notification as soon as
+        it is yielded (if the client asked for progress), with the chunk's text
+        as the progress message. The chunks are also collected into the final
+        result, up to `tool_stream_max_bytes`; later chunks are left out of it.
+        """
+        try:
+            context = get_context()
+        except RuntimeError:
+            context = None
+
+        max_bytes = FlashMCP.settings.settings.tool_stream_max_bytes
+        content: list[TextContent | ImageContent | EmbeddedResource] = []
+        size = 0
+        count = 0
+        omitted = 0
+
+        async for chunk in chunks:
+            count += 1
+            chunk_content = await self.convert_result(chunk)
+
+            if context is not None:
+                text = "".join(
+                    item.text for item in chunk_content if isinstance(item, TextContent)
+                )
+                await context.report_progress(count, message=text or None)
+
+            chunk_size = sum(_content_size(item) for item in chunk_content)
+            if omitted or size + chunk_size > max_bytes:
+                omitted += 1
+                continue
+            content.extend(chunk_content)
+            size += chunk_size
+
+        if omitted:
+            content.append(
+                TextContent(
+                    type="text",
+                    text=f"[{omitted} of {count} chunks were omitted from this "
+                    "result because it exceeded the maximum size]",
+                )
+            )
+        return content
+
     def to_mcp_tool(self, **overrides: Any) -> MCPTool:
         kwargs = {
             "name": self.name,
@@ -152,7 +325,9 @@ class Tool(BaseModel):
             "inputSchema": self.parameters,
             "annotations": self.annotations,
         }
-        return MCPTool(**kwargs | overrides)
+        return self._memoize_mcp_object(
+            overrides, lambda: MCPTool(**kwargs | overrides)
+        )
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Tool):
@@ -160,6 +335,22 @@ class Tool(BaseModel):
         return self.model_dump() == other.model_dump()
 
 
+def _has_image_file(result: Any) -> bool:
+    if isinstance(result, Image):
+        return result.path is not None
+    if isinstance(result, list | tuple):
+        return any(isinstance(item, Image) and item.path for item in result)
+    return False
+
+
+def _content_size(item: TextContent | ImageContent | EmbeddedResource) -> int:
+    if isinstance(item, TextContent):
+        return len(item.text.encode())
+    if isinstance(item, ImageContent):
+        return len(item.data)
+    return len(pydantic_core.to_json(item))
+
+
 def _convert_to_content(
     result: Any,
     serializer: Callable[[Any], str] | None = None,
@@ -175,6 +366,9 @@ def _convert_to_content(
     if isinstance(result, Image):
         return [result.to_image_content()]
 
+    if isinstance(result, RawJSON):
+        return [TextContent(type="text", text=result.text)]
+
     if isinstance(result, list | tuple) and not _process_as_single_item:
         # if the result is a list, then it could either be a list of MCP types,
         # or a "regular" list that the tool is returning, or a mix of both.
@@ -186,7 +380,9 @@ def _convert_to_content(
         other_content = []
 
         for item in result:
-            if isinstance(item, TextContent | ImageContent | EmbeddedResource | Image):
+            if isinstance(
+                item, TextContent | ImageContent | EmbeddedResource | Image | RawJSON
+            ):
                 mcp_types.append(_convert_to_content(item)[0])
             else:
                 other_content.append(item)
@@ -199,7 +395,7 @@ def _convert_to_content(
 
     if not isinstance(result, str):
         if serializer is None:
-            result = default_serializer(result)
+            result = get_serializer()(result)
         else:
             try:
                 result = serializer(result)
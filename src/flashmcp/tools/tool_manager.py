@@ -1,13 +1,31 @@
 from __future__ import annotations as _annotations
 
+import hashlib
+import json
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
+import anyio
+import pydantic_core
 from mcp.types import EmbeddedResource, ImageContent, TextContent, ToolAnnotations
 
-from FlashMCP.exceptions import NotFoundError, ToolError
-from FlashMCP.settings import DuplicateBehavior
+from FlashMCP.exceptions import (
+    NotFoundError,
+    ToolError,
+    ToolRejectedError,
+    ToolTimeoutError,
+)
+from FlashMCP.settings import DuplicateBehavior, ToolExecution
+from FlashMCP.tools.execution import (
+    CallCoalescer,
+    CoalescingStats,
+    ConcurrencyLimit,
+    ConcurrencyStats,
+    ToolExecutor,
+    get_arguments_validator,
+)
 from FlashMCP.tools.tool import Tool
+from FlashMCP.utilities.cache import CacheStats, LRUCache
 from FlashMCP.utilities.logging import get_logger
 
 if TYPE_CHECKING:
@@ -15,6 +33,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+DEFAULT_CACHE_TTL = 60.0
+DEFAULT_CACHE_MAX_ENTRIES = 128
+
 
 class ToolManager:
     """Manages FlashMCP tools."""
@@ -23,9 +44,27 @@ class ToolManager:
         self,
         duplicate_behavior: DuplicateBehavior | None = None,
         serializer: Callable[[Any], str] | None = None,
+        execution: ToolExecution | None = None,
+        thread_limit: int | None = None,
+        process_workers: int | None = None,
+        cache_ttl: float | None = None,
+        cache_max_entries: int | None = None,
+        timeout: float | None = None,
     ):
         self._tools: dict[str, Tool] = {}
         self._serializer = serializer
+        self._caches: dict[str, LRUCache] = {}
+        self._coalescers: dict[str, CallCoalescer] = {}
+        self._limits: dict[str, ConcurrencyLimit] = {}
+        self._timeouts: dict[str, int] = {}
+        self.timeout = timeout
+        self.cache_ttl = DEFAULT_CACHE_TTL if cache_ttl is None else cache_ttl
+        self.cache_max_entries = cache_max_entries or DEFAULT_CACHE_MAX_ENTRIES
+        self.executor = ToolExecutor(
+            execution=execution,
+            thread_limit=thread_limit,
+            process_workers=process_workers,
+        )
 
         # Default to "warn" if None is provided
         if duplicate_behavior is None:
@@ -64,6 +103,15 @@ class ToolManager:
         description: str | None = None,
         tags: set[str] | None = None,
         annotations: ToolAnnotations | None = None,
+        execution: ToolExecution | None = None,
+        cache_ttl: float | None = None,
+        cache_max_entries: int | None = None,
+        coalesce: bool = False,
+        max_concurrency: int | None = None,
+        max_queue: int | None = None,
+        queue_timeout: float | None = None,
+        timeout: float | None = None,
+        parameters: dict[str, Any] | None = None,
     ) -> Tool:
         """Add a tool to the server."""
         tool = Tool.from_function(
@@ -73,25 +121,46 @@ class ToolManager:
             tags=tags,
             annotations=annotations,
             serializer=self._serializer,
+            execution=execution,
+            cache_ttl=cache_ttl,
+            cache_max_entries=cache_max_entries,
+            coalesce=coalesce,
+            max_concurrency=max_concurrency,
+            max_queue=max_queue,
+            queue_timeout=queue_timeout,
+            timeout=timeout,
+            parameters=parameters,
         )
         return self.add_tool(tool)
 
     def add_tool(self, tool: Tool, key: str | None = None) -> Tool:
         """Register a tool with the server."""
         key = key or tool.name
+        if (tool.cache_ttl or tool.coalesce) and tool.call_plan.context_kwarg:
+            raise ValueError(
+                f"Tool {tool.name!r} can not cache or coalesce calls because it "
+                "requests a Context"
+            )
+        if tool.max_concurrency is None and (
+            tool.max_queue is not None or tool.queue_timeout is not None
+        ):
+            raise ValueError(
+                f"Tool {tool.name!r} sets max_queue or queue_timeout without "
+                "max_concurrency"
+            )
         existing = self._tools.get(key)
         if existing:
-            if self.duplicate_behavior == "warn":
-                logger.warning(f"Tool already exists: {key}")
-                self._tools[key] = tool
-            elif self.duplicate_behavior == "replace":
-                self._tools[key] = tool
-            elif self.duplicate_behavior == "error":
+            if self.duplicate_behavior == "error":
                 raise ValueError(f"Tool already exists: {key}")
             elif self.duplicate_behavior == "ignore":
                 return existing
-        else:
-            self._tools[key] = tool
+        # only tools that are stored are checked and prepared for execution
+        self.executor.register(tool)
+        if existing:
+            if self.duplicate_behavior == "warn":
+                logger.warning(f"Tool already exists: {key}")
+            self._drop_call_state(key)
+        self._tools[key] = tool
         return tool
 
     def remove_tool(self, key: str) -> None:
@@ -105,6 +174,7 @@ class ToolManager:
         """
         if key in self._tools:
             del self._tools[key]
+            self._drop_call_state(key)
         else:
             raise NotFoundError(f"Unknown tool: {key}")
 
@@ -117,7 +187,36 @@ class ToolManager:
             raise NotFoundError(f"Unknown tool: {key}")
 
         try:
-            return await tool.run(arguments)
+            cache = self._get_cache(key, tool)
+            coalescer = self._get_coalescer(key, tool)
+            if cache is None and coalescer is None:
+                return await self._run(key, tool, arguments)
+
+            call_key = self._call_key(tool, arguments)
+            if cache is not None:
+                cached = cache.get(call_key)
+                if cached is not LRUCache.NOT_FOUND:
+                    return list(cached)
+
+            if coalescer is not None:
+                result = list(
+                    await coalescer.run(
+                        call_key, lambda: self._run(key, tool, arguments)
+                    )
+                )
+            else:
+                result = await self._run(key, tool, arguments)
+
+            if cache is not None:
+                cache.set(
+                    call_key, list(result), size=len(pydantic_core.to_json(result))
+                )
+            return result
+
+        # rejections and timeouts are expected under load, so skip the traceback
+        except (ToolRejectedError, ToolTimeoutError) as e:
+            logger.warning(f"Error calling tool {key!r}: {e}")
+            raise e
 
         # raise ToolErrors as-is
         except ToolError as e:
@@ -128,3 +227,159 @@ class ToolManager:
         except Exception as e:
             logger.exception(f"Error calling tool {key!r}: {e}")
             raise ToolError(f"Error calling tool {key!r}") from e
+
+    async def _run(
+        self, key: str, tool: Tool, arguments: dict[str, Any]
+    ) -> list[TextContent | ImageContent | EmbeddedResource]:
+        """Run a tool within its concurrency limit, if it has one."""
+        limit = self._get_limit(key, tool)
+        if limit is None:
+            return await self._run_with_timeout(key, tool, arguments)
+        async with limit.acquire(key):
+            return await self._run_with_timeout(key, tool, arguments)
+
+    async def _run_with_timeout(
+        self, key: str, tool: Tool, arguments: dict[str, Any]
+    ) -> list[TextContent | ImageContent | EmbeddedResource]:
+        """Run a tool, cancelling it if it exceeds its timeout.
+
+        Cancellation reaches async tools at their next await. Threaded and
+        process tools are abandoned rather than interrupted: the call fails
+        right away, but the function keeps running until it returns and its
+        result is discarded. Inline sync tools block the event loop, so they
+        can not be interrupted at all.
+        """
+        timeout = tool.timeout or self.timeout
+        if timeout is None:
+            return await self.executor.run(tool, arguments)
+
+        # the block only falls through when the deadline cancelled the call
+        with anyio.move_on_after(timeout):
+            return await self.executor.run(tool, arguments)
+        self._timeouts[key] = self._timeouts.get(key, 0) + 1
+        raise ToolTimeoutError(f"Tool {key!r} timed out after {timeout} seconds")
+
+    def timeout_count(self, key: str) -> int:
+        """Get the number of calls to a tool that timed out."""
+        return self._timeouts.get(key, 0)
+
+    def _get_limit(self, key: str, tool: Tool) -> ConcurrencyLimit | None:
+        if tool.max_concurrency is None:
+            return None
+        limit = self._limits.get(key)
+        if limit is None:
+            limit = self._limits[key] = ConcurrencyLimit(
+                tool.max_concurrency,
+                max_queue=tool.max_queue,
+                queue_timeout=tool.queue_timeout,
+            )
+        return limit
+
+    def concurrency_stats(self, key: str) -> ConcurrencyStats | None:
+        """Get concurrency statistics for a tool, or None if it is not limited."""
+        tool = self._tools.get(key)
+        if tool is None:
+            return None
+        limit = self._get_limit(key, tool)
+        return limit.stats if limit is not None else None
+
+    def _drop_call_state(self, key: str) -> None:
+        """Forget the caches, coalescers, limits and timeout count of a replaced
+        or removed tool."""
+        self._caches.pop(key, None)
+        self._coalescers.pop(key, None)
+        self._limits.pop(key, None)
+        self._timeouts.pop(key, None)
+
+    def cache_stats(self, key: str) -> CacheStats | None:
+        """Get result cache statistics for a tool, or None if it is not cached."""
+        cache = self._caches.get(key)
+        return cache.stats if cache is not None else None
+
+    def invalidate_cache(
+        self, key: str | None = None, arguments: dict[str, Any] | None = None
+    ) -> None:
+        """Drop cached tool results.
+
+        Args:
+            key: The tool whose results to drop. If not provided, the results
+                of all tools are dropped.
+            arguments: Only drop the result cached for these arguments.
+        """
+        if key is None:
+            for cache in self._caches.values():
+                cache.clear()
+            return
+
+        cache = self._caches.get(key)
+        if cache is None:
+            return
+        if arguments is None:
+            cache.clear()
+        else:
+            cache.delete(self._call_key(self.get_tool(key), arguments))
+
+    def _get_cache(self, key: str, tool: Tool) -> LRUCache | None:
+        """Get the result cache for a tool, or None if its results are not cached.
+
+        Tools cache results when they set `cache_ttl`. Tools that do not set it
+        are cached with the manager's default TTL if they are annotated as
+        idempotent, since repeating those calls has no additional effect.
+        """
+        cache = self._caches.get(key)
+        if cache is not None:
+            return cache
+
+        ttl = tool.cache_ttl
+        if ttl is None:
+            idempotent = tool.annotations is not None and bool(
+                tool.annotations.idempotentHint
+            )
+            # results may depend on the request for tools that use a Context,
+            # and tools that override `run` can not be validated locally
+            if (
+                not idempotent
+                or type(tool).run is not Tool.run
+                or tool.call_plan.context_kwarg is not None
+            ):
+                return None
+            ttl = self.cache_ttl
+        if not ttl:
+            return None
+
+        cache = LRUCache(
+            ttl=ttl, max_entries=tool.cache_max_entries or self.cache_max_entries
+        )
+        self._caches[key] = cache
+        return cache
+
+    def coalesce_stats(self, key: str) -> CoalescingStats | None:
+        """Get call coalescing statistics for a tool, or None if it has no calls."""
+        coalescer = self._coalescers.get(key)
+        return coalescer.stats if coalescer is not None else None
+
+    def _get_coalescer(self, key: str, tool: Tool) -> CallCoalescer | None:
+        if not tool.coalesce:
+            return None
+        coalescer = self._coalescers.get(key)
+        if coalescer is None:
+            coalescer = self._coalescers[key] = CallCoalescer()
+        return coalescer
+
+    def _call_key(self, tool: Tool, arguments: dict[str, Any]) -> str:
+        """Hash a canonical form of the arguments a tool would be called with.
+
+        Arguments are validated first, so calls that differ only in key order,
+        omitted defaults or coercible values (like `"1"` and `1`) share a key.
+        """
+        if type(tool).run is Tool.run:
+            args, kwargs = get_arguments_validator(tool.fn).validate_python(
+                pydantic_core.ArgsKwargs((), tool.prepare_arguments(arguments))
+            )
+            arguments = {**dict(enumerate(args)), **kwargs}
+        canonical = json.dumps(
+            pydantic_core.to_jsonable_python(arguments, fallback=repr),
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
@@ -1,4 +1,8 @@
 import datetime
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 UTC = datetime.timezone.utc
@@ -24,3 +28,98 @@ class TimedCache:
 
     def clear(self) -> None:
         self.cache.clear()
+
+
+@dataclass
+class CacheStats:
+    """Counters for an `LRUCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+
+class LRUCache:
+    """A least-recently-used cache with optional expiration and size limits.
+
+    Entries expire `ttl` seconds after they are set, unless a different `ttl`
+    is passed when setting them. When `max_entries` or
+    `max_bytes` is exceeded, the least recently used entries are evicted.
+    The size of each entry is supplied by the caller when it is set.
+    """
+
+    NOT_FOUND = object()
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (value, size in bytes, expiration on the monotonic clock)
+        self.cache: OrderedDict[Any, tuple[Any, int, float | None]] = OrderedDict()
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        self._stats.entries = len(self.cache)
+        return self._stats
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def get(self, key: Any, valid: Callable[[Any], bool] | None = None) -> Any:
+        """Get the value for a key, or NOT_FOUND.
+
+        Expired entries are dropped, as are entries whose value `valid`
+        rejects, and count as misses.
+        """
+        entry = self.cache.get(key)
+        if entry is not None:
+            value, _, expires = entry
+            if (expires is None or expires > time.monotonic()) and (
+                valid is None or valid(value)
+            ):
+                self.cache.move_to_end(key)
+                self._stats.hits += 1
+                return value
+            self.delete(key)
+        self._stats.misses += 1
+        return self.NOT_FOUND
+
+    def set(
+        self, key: Any, value: Any, size: int = 0, ttl: float | None = None
+    ) -> None:
+        if self.max_bytes is not None and size > self.max_bytes:
+            # never cache an entry that could not fit on its own
+            self.delete(key)
+            return
+
+        self.delete(key)
+        ttl = self.ttl if ttl is None else ttl
+        expires = time.monotonic() + ttl if ttl is not None else None
+        self.cache[key] = (value, size, expires)
+        self._stats.size_bytes += size
+
+        while (self.max_entries is not None and len(self.cache) > self.max_entries) or (
+            self.max_bytes is not None and self._stats.size_bytes > self.max_bytes
+        ):
+            _, (_, evicted_size, _) = self.cache.popitem(last=False)
+            self._stats.size_bytes -= evicted_size
+            self._stats.evictions += 1
+
+    def delete(self, key: Any) -> bool:
+        entry = self.cache.pop(key, None)
+        if entry is None:
+            return False
+        self._stats.size_bytes -= entry[1]
+        return True
+
+    def clear(self) -> None:
+        self.cache.clear()
+        self._stats.size_bytes = 0
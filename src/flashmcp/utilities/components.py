@@ -0,0 +1,52 @@
+"""Shared base class for FlashMCP components."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, PrivateAttr
+
+T = TypeVar("T")
+
+
+class FlashMCPComponent(BaseModel):
+    """Base class for tools, resources, resource templates and prompts.
+
+    Components remember the MCP objects they are converted to, so listing them
+    again doesn't rebuild the same objects. The remembered objects are dropped
+    whenever a field of the component is assigned.
+    """
+
+    # overrides -> MCP object; replaced (rather than cleared) when a field
+    # changes, so holders of the old dict can tell the component changed
+    _mcp_objects: dict[Any, Any] = PrivateAttr(default_factory=dict)
+
+    def _memoize_mcp_object(
+        self, overrides: dict[str, Any], build: Callable[[], T]
+    ) -> T:
+        """Get the MCP object for a set of overrides, building it only once."""
+        try:
+            key = frozenset(overrides.items())
+        except TypeError:
+            # unhashable overrides can't be remembered
+            return build()
+        if (mcp_object := self._mcp_objects.get(key)) is None:
+            mcp_object = self._mcp_objects[key] = build()
+        return mcp_object
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._mcp_objects = {}
+
+    def __copy__(self):
+        copied = super().__copy__()
+        # model_copy(update=...) changes fields without assigning them
+        copied._mcp_objects = {}
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None):
+        copied = super().__deepcopy__(memo)
+        copied._mcp_objects = {}
+        return copied
@@ -0,0 +1,71 @@
+"""HTTP connection pools for HTTP resources."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import httpx
+
+import FlashMCP
+from FlashMCP.utilities.cache import LRUCache
+
+DEFAULT_RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+_current_pool: ContextVar[HttpPool | None] = ContextVar("http_pool", default=None)
+
+
+class HttpPool:
+    """The HTTP client shared by a server's HTTP resources, along with the
+    responses they can revalidate.
+
+    The client pools connections, so repeated requests to the same host reuse
+    them instead of paying for a new TCP and TLS handshake each time. It is
+    created from the `http_*` settings when first used and closed by
+    `aclose()`, which the server calls when it stops running; it is created
+    again if the pool is used after that. A client passed in is used as-is and
+    is never closed by the pool.
+    """
+
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        self._client = client
+        self._owns_client = client is None
+        # url -> (etag, last modified, text) of responses that can be revalidated
+        self.responses = LRUCache(max_bytes=DEFAULT_RESPONSE_CACHE_MAX_BYTES)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pool's client, created if needed."""
+        if self._client is None or (self._owns_client and self._client.is_closed):
+            settings = FlashMCP.settings.settings
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.http_max_connections,
+                    max_keepalive_connections=settings.http_max_keepalive_connections,
+                ),
+                timeout=settings.http_timeout,
+                http2=settings.http2,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pool's client, unless it was passed in."""
+        if self._owns_client and self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+
+@contextmanager
+def use_http_pool(pool: HttpPool) -> Iterator[None]:
+    """Make HTTP resources read within this context use `pool`."""
+    token = _current_pool.set(pool)
+    try:
+        yield
+    finally:
+        _current_pool.reset(token)
+
+
+def current_http_pool() -> HttpPool | None:
+    """Get the pool of the server reading a resource, if any."""
+    return _current_pool.get()
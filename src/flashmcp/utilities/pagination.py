@@ -0,0 +1,132 @@
+"""Cursor-based pagination of MCP list results."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import bisect
+from collections.abc import Callable, Mapping
+from typing import Any, TypeVar
+
+from mcp import McpError
+from mcp.types import INVALID_PARAMS, ErrorData, PaginatedResult, ServerResult
+
+from FlashMCP.low_level.server import SerializedResult
+from FlashMCP.utilities.components import FlashMCPComponent
+
+T = TypeVar("T")
+C = TypeVar("C", bound=FlashMCPComponent)
+
+
+def encode_cursor(key: str) -> str:
+    """Encode the key of the last item on a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> str:
+    """Decode a cursor into the key of the last item on the previous page.
+
+    Raises:
+        McpError: If the cursor is invalid.
+    """
+    try:
+        return base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeError) as e:
+        raise McpError(
+            ErrorData(code=INVALID_PARAMS, message=f"Invalid cursor: {cursor!r}")
+        ) from e
+
+
+def paginate(
+    items: Mapping[str, T], cursor: str | None, page_size: int | None
+) -> tuple[list[tuple[str, T]], str | None]:
+    """Get a page of items, and the cursor for the next page if there is one.
+
+    Paginated items are ordered by key, and each cursor is the key of the last
+    item on its page rather than a position. Pages therefore stay consistent
+    when items are added or removed between requests: the next page starts
+    after that key, whether or not it still exists.
+
+    Args:
+        items: The items to paginate, by key
+        cursor: The cursor from the previous page, or None for the first page
+        page_size: The maximum number of items per page, or None to return
+            every item after the cursor
+
+    Returns:
+        The (key, item) pairs on the page, and the cursor for the next page,
+        or None if this is the last page.
+    """
+    if cursor is None and page_size is None:
+        return list(items.items()), None
+
+    keys = sorted(items)
+    start = 0 if cursor is None else bisect.bisect_right(keys, decode_cursor(cursor))
+    if page_size is None:
+        page = keys[start:]
+    else:
+        page = keys[start : start + page_size]
+    next_cursor = encode_cursor(page[-1]) if start + len(page) < len(keys) else None
+    return [(key, items[key]) for key in page], next_cursor
+
+
+class PageCache:
+    """The pages of a list result, reused while the listed components are
+    unchanged.
+
+    Each page is built and serialized once. It is rebuilt when a component is
+    added, removed or replaced, or when a field of a listed component is
+    assigned; checking that takes a pass over the components but doesn't
+    convert or serialize any of them.
+    """
+
+    def __init__(self):
+        # (key, component, component's MCP objects) for each listed component
+        self._components: list[tuple[str, FlashMCPComponent, dict[Any, Any]]] = []
+        self._page_size: int | None = None
+        self._pages: dict[str | None, ServerResult] = {}
+
+    def get(
+        self,
+        components: Mapping[str, C],
+        cursor: str | None,
+        page_size: int | None,
+        build: Callable[[list[tuple[str, C]], str | None], PaginatedResult],
+    ) -> ServerResult:
+        """Get a page of components, building it only if it isn't cached.
+
+        Args:
+            components: The components to list, by key
+            cursor: The cursor from the previous page, or None for the first page
+            page_size: The maximum number of components per page
+            build: Builds the list result from the page's (key, component)
+                pairs and the cursor for the next page
+        """
+        if page_size != self._page_size or not self._is_current(components):
+            self._components = [
+                (key, component, component._mcp_objects)
+                for key, component in components.items()
+            ]
+            self._page_size = page_size
+            self._pages = {}
+        if (result := self._pages.get(cursor)) is None:
+            page, next_cursor = paginate(components, cursor, page_size)
+            result = SerializedResult(build(page, next_cursor))  # type: ignore[arg-type]
+            # only the cursors handed out are cached, so clients can't grow
+            # the cache by making up cursors
+            if cursor is None or any(
+                getattr(cached.root, "nextCursor", None) == cursor
+                for cached in self._pages.values()
+            ):
+                self._pages[cursor] = result
+        return result
+
+    def _is_current(self, components: Mapping[str, FlashMCPComponent]) -> bool:
+        return len(components) == len(self._components) and all(
+            key == cached_key
+            and component is cached_component
+            and component._mcp_objects is mcp_objects
+            for (key, component), (cached_key, cached_component, mcp_objects) in zip(
+                components.items(), self._components
+            )
+        )
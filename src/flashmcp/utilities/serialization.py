@@ -0,0 +1,82 @@
+"""Serialization of tool, prompt and resource results to JSON text."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import pydantic_core
+
+import FlashMCP
+from FlashMCP.settings import SerializationProfile
+
+Encoder = Callable[[Any], str | bytes]
+
+
+def pretty_serializer(data: Any) -> str:
+    return pydantic_core.to_json(data, fallback=str, indent=2).decode()
+
+
+def compact_serializer(data: Any) -> str:
+    return pydantic_core.to_json(data, fallback=str).decode()
+
+
+SERIALIZERS: dict[str, Callable[[Any], str]] = {
+    "pretty": pretty_serializer,
+    "compact": compact_serializer,
+}
+
+
+def get_serializer(
+    serialization: SerializationProfile | Encoder | None = None,
+) -> Callable[[Any], str]:
+    """Get a serializer for a serialization profile or a custom encoder.
+
+    Args:
+        serialization: "pretty", "compact", or a custom encoder such as
+            `orjson.dumps`. Encoders may return str or UTF-8 bytes. Defaults to
+            the `serialization` setting.
+    """
+    if serialization is None:
+        serialization = FlashMCP.settings.settings.serialization
+
+    if callable(serialization):
+        encoder = serialization
+
+        def serializer(data: Any) -> str:
+            result = encoder(data)
+            if isinstance(result, bytes):
+                return result.decode()
+            return result
+
+        return serializer
+
+    if serialization not in SerializationProfile.__args__:
+        raise ValueError(
+            f"Invalid serialization: {serialization}. "
+            f"Must be one of: {', '.join(SerializationProfile.__args__)}"
+        )
+    return SERIALIZERS[serialization]
+
+
+class RawJSON:
+    """JSON that has already been serialized.
+
+    Return this from a tool, prompt or resource function to send JSON text it
+    already holds (for example, a payload from an upstream API or a cache)
+    as-is, without decoding and encoding it again.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: str | bytes):
+        self.data = data
+
+    @property
+    def text(self) -> str:
+        if isinstance(self.data, bytes):
+            return self.data.decode()
+        return self.data
+
+    def __repr__(self) -> str:
+        return f"RawJSON({self.data!r})"
@@ -0,0 +1,156 @@
+"""On-disk snapshots of the parameter schemas of a server's components."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import sys
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, Literal
+
+import pydantic
+
+import FlashMCP
+from FlashMCP.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
+SnapshotKind = Literal["tools", "resource_templates", "prompts"]
+
+# bumped whenever the format of the file changes
+SNAPSHOT_VERSION = 1
+
+
+class CatalogueSnapshot:
+    """The JSON schemas of the parameters of a server's function components,
+    saved so that a later start of the server can skip generating them.
+
+    Generating the schema of a function (and the validator it is generated
+    from) is most of the cost of registering a tool. A server started with a
+    snapshot uses the saved schemas instead, and only builds a tool's validator
+    when the tool is first called.
+
+    The file is read the first time a schema is looked up. It is ignored as a
+    whole if the source files of the modules defining the components, or the
+    FlashMCP or pydantic versions, have changed since it was saved; a single
+    entry is ignored if it was saved for a function with a different name or
+    signature. Types imported from other modules are not checked, so save the
+    snapshot again when they change.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = Path(path)
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    def parameters(
+        self, kind: SnapshotKind, key: str, fn: Callable[..., Any]
+    ) -> dict[str, Any] | None:
+        """Get the saved parameter schema of a component, or None if there is
+        no valid entry for it.
+
+        Args:
+            kind: The kind of component
+            key: The component's name, or its URI template for resource templates
+            fn: The function the component is being created from
+        """
+        if self._entries is None:
+            self._entries = self._load()
+        entry = self._entries.get(f"{kind}:{key}")
+        if entry is None or entry["fn"] != fingerprint(fn):
+            return None
+        return entry["parameters"]
+
+    @classmethod
+    def save(
+        cls,
+        path: str | os.PathLike[str],
+        components: Iterable[
+            tuple[SnapshotKind, str, Callable[..., Any], dict[str, Any]]
+        ],
+    ) -> None:
+        """Save the parameter schemas of components.
+
+        Args:
+            path: The file to write
+            components: (kind, key, function, parameter schema) for each component
+        """
+        entries: dict[str, dict[str, Any]] = {}
+        modules: set[str] = set()
+        for kind, key, fn, parameters in components:
+            entries[f"{kind}:{key}"] = {
+                "fn": fingerprint(fn),
+                "parameters": parameters,
+            }
+            if module := getattr(fn, "__module__", None):
+                modules.add(module)
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "source": source_hash(modules),
+            "modules": sorted(modules),
+            "components": entries,
+        }
+        path = Path(path)
+        # write to a temporary file first so a server starting meanwhile never
+        # reads half a snapshot
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")))
+        tmp.replace(path)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self.path.read_bytes())
+        except FileNotFoundError:
+            logger.debug(f"No catalogue snapshot at {self.path}")
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable catalogue snapshot {self.path}: {e}")
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != SNAPSHOT_VERSION
+            or data.get("source") != source_hash(data.get("modules", []))
+        ):
+            logger.warning(
+                f"Ignoring stale catalogue snapshot {self.path}; save it again "
+                "to speed up startup"
+            )
+            return {}
+        return data["components"]
+
+
+def fingerprint(fn: Callable[..., Any]) -> str:
+    """Identify a function by its module, qualified name and signature."""
+    name = getattr(fn, "__qualname__", None) or type(fn).__qualname__
+    try:
+        signature = str(inspect.signature(fn))
+    except (TypeError, ValueError):
+        signature = "(?)"
+    return f"{getattr(fn, '__module__', None)}:{name}{signature}"
+
+
+def source_hash(modules: Iterable[str]) -> str:
+    """Hash the source files of modules, along with the FlashMCP and pydantic
+    versions that schemas are generated with."""
+    digest = hashlib.sha256(f"{FlashMCP.__version__} {pydantic.VERSION}".encode())
+    for module in sorted(modules):
+        digest.update(f"\0{module}\0".encode())
+        if (file := _module_file(module)) is not None:
+            try:
+                digest.update(Path(file).read_bytes())
+            except OSError:
+                pass
+    return digest.hexdigest()
+
+
+def _module_file(module: str) -> str | None:
+    if (loaded := sys.modules.get(module)) is not None:
+        return getattr(loaded, "__file__", None)
+    try:
+        spec = importlib.util.find_spec(module)
+    except (ImportError, ValueError):
+        return None
+    return spec.origin if spec is not None else None
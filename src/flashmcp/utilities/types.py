@@ -1,16 +1,23 @@
 """Common types used across FlashMCP."""
 
 import base64
+import binascii
 import inspect
+import mmap
+import threading
 from collections.abc import Callable
 from functools import lru_cache
 from pathlib import Path
 from types import UnionType
-from typing import Annotated, TypeVar, Union, get_args, get_origin
+from typing import Annotated, Any, TypeVar, Union, get_args, get_origin
 
 from mcp.types import ImageContent
 from pydantic import TypeAdapter
 
+import FlashMCP
+from FlashMCP.utilities.cache import LRUCache
+from FlashMCP.utilities.json_schema import compress_schema
+
 T = TypeVar("T")
 
 
@@ -25,6 +32,21 @@ def get_cached_typeadapter(cls: T) -> TypeAdapter[T]:
     return TypeAdapter(cls)
 
 
+@lru_cache(maxsize=5000)
+def get_cached_parameters_schema(
+    fn: Callable[..., Any], prune_param: str | None = None
+) -> dict[str, Any]:
+    """
+    Get the compressed JSON schema of a function's parameters, leaving out
+    `prune_param` (such as an injected Context argument).
+
+    Tools, prompts and resource templates created from the same function share
+    the cached schema, so it must not be modified.
+    """
+    schema = get_cached_typeadapter(fn).json_schema()
+    return compress_schema(schema, prune_params=[prune_param] if prune_param else None)
+
+
 def issubclass_safe(cls: type, base: type) -> bool:
     """Check if cls is a subclass of base, even if cls is a type variable."""
     try:
@@ -119,13 +141,80 @@ class Image:
         return "image/png"  # default for raw binary data
 
     def to_image_content(self) -> ImageContent:
-        """Convert to MCP ImageContent."""
+        """Convert to MCP ImageContent.
+
+        Image files are read through a memory map and their encoded data is
+        cached until the file's modification time or size changes. Reading
+        a file blocks, so tool results with image files are converted in a
+        worker thread.
+
+        Raises:
+            ValueError: If the image is larger than the `image_max_bytes`
+                setting.
+        """
         if self.path:
-            with open(self.path, "rb") as f:
-                data = base64.b64encode(f.read()).decode()
+            data = _encode_image_file(self.path)
         elif self.data is not None:
+            _check_image_size(len(self.data))
             data = base64.b64encode(self.data).decode()
         else:
             raise ValueError("No image data available")
 
         return ImageContent(type="image", data=data, mimeType=self._mime_type)
+
+
+# encoded image files, keyed by (path, modification time, size)
+_image_cache = LRUCache(max_bytes=64 * 1024 * 1024)
+_image_cache_lock = threading.Lock()
+
+# a multiple of 3, so that chunks encode to base64 without padding
+_BASE64_CHUNK_SIZE = 3 * 1024 * 1024
+
+
+def _check_image_size(size: int) -> None:
+    max_bytes = FlashMCP.settings.settings.image_max_bytes
+    if size > max_bytes:
+        raise ValueError(
+            f"Image is too large ({size} bytes); the maximum is {max_bytes} bytes"
+        )
+
+
+def _encode_image_file(path: Path) -> str:
+    stat = path.stat()
+    _check_image_size(stat.st_size)
+
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    with _image_cache_lock:
+        data = _image_cache.get(key)
+    if data is not LRUCache.NOT_FOUND:
+        return data
+
+    data = _base64_encode_file(path)
+    with _image_cache_lock:
+        _image_cache.set(key, data, size=len(data))
+    return data
+
+
+def _base64_encode_file(path: Path) -> str:
+    """Base64-encode a file without reading it into memory first.
+
+    The file is memory mapped and encoded chunk by chunk into a buffer sized
+    for the whole output, so the only full-size copies are that buffer and
+    the final string.
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, 2)
+        if size == 0:
+            return ""
+        _check_image_size(size)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            encoded = bytearray(4 * ((size + 2) // 3))
+            with memoryview(mapped) as view:
+                position = 0
+                for start in range(0, size, _BASE64_CHUNK_SIZE):
+                    chunk = binascii.b2a_base64(
+                        view[start : start + _BASE64_CHUNK_SIZE], newline=False
+                    )
+                    encoded[position : position + len(chunk)] = chunk
+                    position += len(chunk)
+    return encoded.decode("ascii")
@@ -2,10 +2,12 @@ import asyncio
 import sys
 from typing import cast
 
+import mcp.types
 import pytest
 from mcp import McpError
 from pydantic import AnyUrl
 
+from FlashMCP import Context
 from FlashMCP.client import Client
 from FlashMCP.client.transports import (
     FlashMCPTransport,
@@ -335,6 +337,37 @@ async def test_client_nested_context_manager(FlashMCP_server):
     assert client._session is None
 
 
+async def test_added_message_handlers(FlashMCP_server):
+    """Test that added message handlers receive messages after the client's own."""
+    received = []
+
+    async def first(message):
+        received.append(("first", message))
+
+    async def second(message):
+        received.append(("second", message))
+
+    @FlashMCP_server.tool()
+    async def notify(context: Context) -> None:
+        await context.session.send_tool_list_changed()
+
+    client = Client(FlashMCP_server, message_handler=first)
+    async with client:
+        client.add_message_handler(second)
+        await client.call_tool("notify", {})
+
+    notifications = [
+        (name, message.root)
+        for name, message in received
+        if isinstance(message, mcp.types.ServerNotification)
+    ]
+    assert [name for name, _ in notifications] == ["first", "second"]
+    assert all(
+        isinstance(notification, mcp.types.ToolListChangedNotification)
+        for _, notification in notifications
+    )
+
+
 async def test_resource_template(FlashMCP_server):
     """Test using a resource template with InMemoryClient."""
     client = Client(transport=FlashMCPTransport(FlashMCP_server))
@@ -0,0 +1,224 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from mcp import McpError
+from mcp.types import INVALID_PARAMS
+from pydantic import AnyUrl
+
+from FlashMCP.exceptions import ResourceError
+from FlashMCP.resources import DirectoryResource, ResourceManager
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """Create a small directory tree for testing."""
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.py").write_text("b")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "c.txt").write_text("c")
+    (tmp_path / "sub" / "deeper").mkdir()
+    (tmp_path / "sub" / "deeper" / "d.py").write_text("d")
+    return tmp_path
+
+
+async def read_files(resource: DirectoryResource) -> list[str]:
+    return json.loads(await resource.read())["files"]
+
+
+class TestDirectoryResource:
+    """Test DirectoryResource listings."""
+
+    async def test_list_directory(self, tree: Path):
+        resource = DirectoryResource(uri=AnyUrl("dir://test"), path=tree)
+        assert await read_files(resource) == ["a.txt", "b.py"]
+
+    async def test_list_directory_recursively(self, tree: Path):
+        resource = DirectoryResource(
+            uri=AnyUrl("dir://test"), path=tree, recursive=True
+        )
+        assert await read_files(resource) == [
+            "a.txt",
+            "b.py",
+            os.path.join("sub", "c.txt"),
+            os.path.join("sub", "deeper", "d.py"),
+        ]
+
+    async def test_pattern(self, tree: Path):
+        resource = DirectoryResource(
+            uri=AnyUrl("dir://test"), path=tree, recursive=True, pattern="*.py"
+        )
+        assert await read_files(resource) == [
+            "b.py",
+            os.path.join("sub", "deeper", "d.py"),
+        ]
+
+        resource = DirectoryResource(
+            uri=AnyUrl("dir://test"), path=tree, pattern="*.py"
+        )
+        assert await read_files(resource) == ["b.py"]
+
+    @pytest.mark.parametrize("recursive", [False, True])
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "*.py",
+            "*.txt",
+            "?.txt",
+            "[ab].*",
+            "sub/*.txt",
+            "sub/*",
+            "*/*.py",
+            "**/*.py",
+            "sub/**/*.py",
+            "deeper/*.py",
+            "d.py",
+            "sub",
+        ],
+    )
+    async def test_pattern_follows_glob(
+        self, tree: Path, pattern: str, recursive: bool
+    ):
+        resource = DirectoryResource(
+            uri=AnyUrl("dir://test"), path=tree, recursive=recursive, pattern=pattern
+        )
+        globbed = tree.rglob(pattern) if recursive else tree.glob(pattern)
+        expected = sorted(str(p.relative_to(tree)) for p in globbed if p.is_file())
+        assert await read_files(resource) == expected
+
+    async def test_absolute_pattern_is_rejected(self, tree: Path):
+        resource = DirectoryResource(
+            uri=AnyUrl("dir://test"), path=tree, pattern=str(tree / "*.py")
+        )
+        with pytest.raises(ResourceError):
+            await resource.read()
+
+    async def test_list_files(self, tree: Path):
+        resource = DirectoryResource(uri=AnyUrl("dir://test"), path=tree)
+        # unlike reads, list_files includes directories, as Path.glob does
+        assert sorted(resource.list_files()) == [
+            tree / "a.txt",
+            tree / "b.py",
+            tree / "sub",
+        ]
+
+        resource = DirectoryResource(
+            uri=AnyUrl("dir://test"), path=tree, recursive=True, pattern="*.txt"
+        )
+        assert sorted(resource.list_files()) == [
+            tree / "a.txt",
+            tree / "sub" / "c.txt",
+        ]
+
+    async def test_listing_reflects_changes(self, tree: Path):
+        resource = DirectoryResource(
+            uri=AnyUrl("dir://test"), path=tree, recursive=True
+        )
+        await read_files(resource)
+
+        (tree / "sub" / "deeper" / "e.txt").write_text("e")
+        (tree / "a.txt").unlink()
+        (tree / "new").mkdir()
+        (tree / "new" / "f.txt").write_text("f")
+        assert await read_files(resource) == [
+            "b.py",
+            os.path.join("new", "f.txt"),
+            os.path.join("sub", "c.txt"),
+            os.path.join("sub", "deeper", "d.py"),
+            os.path.join("sub", "deeper", "e.txt"),
+        ]
+
+        for name in [
+            "c.txt",
+            os.path.join("deeper", "d.py"),
+            os.path.join("deeper", "e.txt"),
+        ]:
+            (tree / "sub" / name).unlink()
+        (tree / "sub" / "deeper").rmdir()
+        (tree / "sub").rmdir()
+        assert await read_files(resource) == ["b.py", os.path.join("new", "f.txt")]
+
+    async def test_unchanged_directories_are_not_rescanned(
+        self, tree: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        resource = DirectoryResource(
+            uri=AnyUrl("dir://test"), path=tree, recursive=True
+        )
+        await read_files(resource)
+
+        # make every directory look like it last changed long ago
+        old = 1_000_000_000
+        for path in [tree, tree / "sub", tree / "sub" / "deeper"]:
+            os.utime(path, ns=(old, old))
+        await read_files(resource)
+
+        scanned = []
+        original_scandir = os.scandir
+
+        def scandir(path):
+            scanned.append(Path(path))
+            return original_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+        (tree / "sub" / "e.txt").write_text("e")
+        assert os.path.join("sub", "e.txt") in await read_files(resource)
+        assert scanned == [tree / "sub"]
+
+    async def test_refresh_interval(self, tree: Path):
+        resource = DirectoryResource(
+            uri=AnyUrl("dir://test"), path=tree, refresh_interval=60
+        )
+        assert await read_files(resource) == ["a.txt", "b.py"]
+
+        (tree / "c.txt").write_text("c")
+        assert await read_files(resource) == ["a.txt", "b.py"]
+
+    async def test_pagination(self, tree: Path):
+        resource = DirectoryResource(
+            uri=AnyUrl("dir://test"), path=tree, recursive=True, page_size=3
+        )
+        first = json.loads(await resource.read())
+        assert first["files"] == ["a.txt", "b.py", os.path.join("sub", "c.txt")]
+
+        resource.cursor = first["nextCursor"]
+        second = json.loads(await resource.read())
+        assert second == {"files": [os.path.join("sub", "deeper", "d.py")]}
+
+    async def test_pagination_through_manager(self, tree: Path):
+        manager = ResourceManager()
+        manager.add_resource(
+            DirectoryResource(uri=AnyUrl("dir://test"), path=tree, page_size=1)
+        )
+
+        first = json.loads(await manager.read_resource("dir://test"))
+        assert first["files"] == ["a.txt"]
+
+        second = json.loads(
+            await manager.read_resource(f"dir://test?cursor={first['nextCursor']}")
+        )
+        assert second == {"files": ["b.py"]}
+
+    async def test_missing_directory(self, tmp_path: Path):
+        resource = DirectoryResource(
+            uri=AnyUrl("dir://test"), path=tmp_path / "missing"
+        )
+        with pytest.raises(ResourceError, match="Error reading directory"):
+            await resource.read()
+
+    async def test_invalid_cursor(self, tree: Path):
+        resource = DirectoryResource(
+            uri=AnyUrl("dir://test"), path=tree, cursor="not a cursor"
+        )
+        with pytest.raises(McpError, match="Invalid cursor") as exc_info:
+            await resource.read()
+        assert exc_info.value.error.code == INVALID_PARAMS
+
+    async def test_invalid_cursor_through_manager(self, tree: Path):
+        manager = ResourceManager()
+        manager.add_resource(
+            DirectoryResource(uri=AnyUrl("dir://test"), path=tree, page_size=1)
+        )
+        with pytest.raises(McpError, match="Invalid cursor") as exc_info:
+            await manager.read_resource("dir://test?cursor=not-a-cursor")
+        assert exc_info.value.error.code == INVALID_PARAMS
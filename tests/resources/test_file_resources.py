@@ -115,3 +115,55 @@ class TestFileResource:
                 await resource.read()
         finally:
             temp_file.chmod(0o644)  # Restore permissions
+
+
+class TestFileResourceRanges:
+    """Test reading ranges and chunks of files."""
+
+    @pytest.fixture
+    def data_file(self, tmp_path: Path) -> Path:
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"0123456789")
+        return path
+
+    @pytest.mark.parametrize(
+        "offset, length, expected",
+        [
+            (0, None, b"0123456789"),
+            (3, None, b"3456789"),
+            (0, 4, b"0123"),
+            (3, 4, b"3456"),
+            (8, 10, b"89"),
+            (20, 5, b""),
+            (5, 0, b""),
+        ],
+    )
+    async def test_read_range(
+        self, data_file: Path, offset: int, length: int | None, expected: bytes
+    ):
+        resource = FileResource(
+            uri=FileUrl(data_file.as_uri()),
+            path=data_file,
+            is_binary=True,
+            offset=offset,
+            length=length,
+        )
+        assert await resource.read() == expected
+
+    async def test_read_text_range(self, tmp_path: Path):
+        path = tmp_path / "data.txt"
+        path.write_text("héllo wörld", encoding="utf-8")
+        resource = FileResource(
+            uri=FileUrl(path.as_uri()), path=path, offset=7, length=6
+        )
+        assert await resource.read() == "wörld"
+
+        # a range that splits a character does not fail
+        resource = FileResource(
+            uri=FileUrl(path.as_uri()), path=path, offset=2, length=3
+        )
+        assert await resource.read() == "�ll"
+
+    def test_negative_range_error(self, data_file: Path):
+        with pytest.raises(ValueError):
+            FileResource(uri=FileUrl(data_file.as_uri()), path=data_file, offset=-1)
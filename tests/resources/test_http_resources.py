@@ -0,0 +1,112 @@
+import httpx
+import pytest
+from pydantic import AnyUrl
+
+from FlashMCP.exceptions import ResourceError
+from FlashMCP.resources import HttpResource, ResourceManager
+
+
+@pytest.fixture
+def server():
+    """Serve HTTP resources from an in-memory handler, recording requests."""
+
+    class Server:
+        def __init__(self):
+            self.requests: list[httpx.Request] = []
+            self.body = "version 1"
+            self.headers = {"ETag": '"v1"'}
+            self.client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+        def handler(self, request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            etag = self.headers.get("ETag")
+            if etag and request.headers.get("If-None-Match") == etag:
+                return httpx.Response(304)
+            last_modified = self.headers.get("Last-Modified")
+            if last_modified and (
+                request.headers.get("If-Modified-Since") == last_modified
+            ):
+                return httpx.Response(304)
+            return httpx.Response(200, text=self.body, headers=self.headers)
+
+    return Server()
+
+
+@pytest.fixture
+def manager(server) -> ResourceManager:
+    manager = ResourceManager(http_client=server.client)
+    manager.add_resource(
+        HttpResource(uri=AnyUrl("resource://data"), url="http://test/data")
+    )
+    return manager
+
+
+class TestHttpResource:
+    """Test HttpResource reads."""
+
+    async def test_read(self, server, manager: ResourceManager):
+        assert await manager.read_resource("resource://data") == "version 1"
+        assert len(server.requests) == 1
+
+    async def test_revalidates_with_etag(self, server, manager: ResourceManager):
+        assert await manager.read_resource("resource://data") == "version 1"
+        assert await manager.read_resource("resource://data") == "version 1"
+
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
+
+        server.body = "version 2"
+        server.headers = {"ETag": '"v2"'}
+        assert await manager.read_resource("resource://data") == "version 2"
+        assert await manager.read_resource("resource://data") == "version 2"
+        assert server.requests[3].headers["If-None-Match"] == '"v2"'
+
+    async def test_revalidates_with_last_modified(
+        self, server, manager: ResourceManager
+    ):
+        server.headers = {"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        assert await manager.read_resource("resource://data") == "version 1"
+        assert await manager.read_resource("resource://data") == "version 1"
+        assert (
+            server.requests[1].headers["If-Modified-Since"]
+            == "Wed, 21 Oct 2015 07:28:00 GMT"
+        )
+
+    async def test_responses_without_validators_are_not_cached(
+        self, server, manager: ResourceManager
+    ):
+        server.headers = {}
+        await manager.read_resource("resource://data")
+        await manager.read_resource("resource://data")
+        assert "If-None-Match" not in server.requests[1].headers
+        assert len(manager.http.responses) == 0
+
+    async def test_no_store_responses_are_not_cached(
+        self, server, manager: ResourceManager
+    ):
+        server.headers = {"ETag": '"v1"', "Cache-Control": "no-store"}
+        await manager.read_resource("resource://data")
+        await manager.read_resource("resource://data")
+        assert "If-None-Match" not in server.requests[1].headers
+
+    async def test_responses_are_kept_per_manager(
+        self, server, manager: ResourceManager
+    ):
+        other = ResourceManager(http_client=server.client)
+        other.add_resource(
+            HttpResource(uri=AnyUrl("resource://data"), url="http://test/data")
+        )
+        await manager.read_resource("resource://data")
+        await other.read_resource("resource://data")
+        assert "If-None-Match" not in server.requests[1].headers
+        assert len(manager.http.responses) == len(other.http.responses) == 1
+
+    async def test_error_status(self):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(404))
+        )
+        manager = ResourceManager(http_client=client)
+        manager.add_resource(
+            HttpResource(uri=AnyUrl("resource://missing"), url="http://test/missing")
+        )
+        with pytest.raises(ResourceError):
+            await manager.read_resource("resource://missing")
@@ -1,11 +1,13 @@
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from unittest.mock import patch
 
 import pytest
 from pydantic import AnyUrl, FileUrl
 
 from FlashMCP.exceptions import NotFoundError, ResourceError
 from FlashMCP.resources import (
+    BinaryResource,
     FileResource,
     FunctionResource,
     ResourceManager,
@@ -624,3 +626,395 @@ class TestResourceErrorHandling:
         # First, the template creation will fail with ValueError
         with pytest.raises(ResourceError, match="Error reading resource"):
             await manager.read_resource("buggy://test")
+
+
+class TestTemplateRouting:
+    """Test that templates are matched in the order they were added."""
+
+    @staticmethod
+    def make_template(uri_template: str, label: str) -> ResourceTemplate:
+        def fn(**kwargs) -> str:
+            return label
+
+        return ResourceTemplate.from_function(
+            fn=fn, uri_template=uri_template, name=label
+        )
+
+    async def test_first_matching_template_wins(self):
+        manager = ResourceManager()
+        manager.add_template(self.make_template("test://{x}/{y}", "generic"))
+        manager.add_template(self.make_template("test://a/{y}", "specific"))
+
+        resource = await manager.get_resource("test://a/1")
+        assert await resource.read() == "generic"
+
+    async def test_template_added_after_lookup(self):
+        manager = ResourceManager()
+        manager.add_template(self.make_template("test://a/{x}", "a"))
+        assert not manager.has_resource("test://b/1")
+
+        manager.add_template(self.make_template("test://b/{x}", "b"))
+        assert manager.has_resource("test://b/1")
+        resource = await manager.get_resource("test://b/1")
+        assert await resource.read() == "b"
+
+    async def test_template_replaced_by_another(self):
+        manager = ResourceManager()
+        manager.add_template(self.make_template("test://a/{x}", "a"))
+        assert manager.has_resource("test://a/1")
+
+        manager.remove_template("test://a/{x}")
+        manager.add_template(self.make_template("test://b/{x}", "b"))
+        assert not manager.has_resource("test://a/1")
+        with pytest.raises(NotFoundError):
+            await manager.get_resource("test://a/1")
+        resource = await manager.get_resource("test://b/1")
+        assert await resource.read() == "b"
+
+    async def test_replacing_template_keeps_precedence(self):
+        manager = ResourceManager(duplicate_behavior="replace")
+        manager.add_template(self.make_template("test://{x}/{y}", "generic"))
+        manager.add_template(self.make_template("test://a/{y}", "specific"))
+        manager.add_template(self.make_template("test://{x}/{y}", "replaced"))
+
+        resource = await manager.get_resource("test://a/1")
+        assert await resource.read() == "replaced"
+
+    async def test_remove_template(self):
+        manager = ResourceManager()
+        manager.add_template(self.make_template("test://{x}/{y}", "generic"))
+        manager.add_template(self.make_template("test://a/{y}", "specific"))
+        assert manager.has_resource("test://b/1")
+
+        manager.remove_template("test://{x}/{y}")
+        assert not manager.has_resource("test://b/1")
+        resource = await manager.get_resource("test://a/1")
+        assert await resource.read() == "specific"
+
+    def test_remove_unknown_template(self):
+        manager = ResourceManager()
+        with pytest.raises(NotFoundError, match="Unknown resource template"):
+            manager.remove_template("test://{x}")
+
+
+class TestResolveAndRead:
+    """Test reading resources with a single resolution pass."""
+
+    async def test_resolve_and_read_resource(self):
+        manager = ResourceManager()
+        resource = FunctionResource(
+            uri=AnyUrl("data://test"),
+            name="test",
+            fn=lambda: "Hello",
+            mime_type="text/markdown",
+        )
+        manager.add_resource(resource)
+
+        assert await manager.resolve_and_read("data://test") == (
+            "Hello",
+            "text/markdown",
+        )
+
+    async def test_resolve_and_read_template_creates_resource_once(self):
+        manager = ResourceManager()
+        calls = []
+
+        def greet(name: str) -> str:
+            calls.append(name)
+            return f"Hello, {name}!"
+
+        manager.add_template(
+            ResourceTemplate.from_function(
+                fn=greet, uri_template="greet://{name}", name="greeter"
+            )
+        )
+
+        content, mime_type = await manager.resolve_and_read("greet://world")  # type: ignore[misc]
+        assert content == "Hello, world!"
+        assert mime_type == "text/plain"
+        assert calls == ["world"]
+
+    async def test_resolve_and_read_unknown_resource(self):
+        manager = ResourceManager()
+        assert await manager.resolve_and_read("data://missing") is None
+
+    async def test_resolve_and_read_wraps_errors(self):
+        manager = ResourceManager()
+
+        def fail() -> str:
+            raise ValueError("secret details")
+
+        manager.add_resource(
+            FunctionResource(uri=AnyUrl("data://fail"), name="fail", fn=fail)
+        )
+
+        with pytest.raises(ResourceError, match="Error reading resource") as exc:
+            await manager.resolve_and_read("data://fail")
+        assert "secret details" not in str(exc.value)
+
+
+class TestResourceContentCache:
+    """Test caching resource contents."""
+
+    async def test_resources_are_not_cached_by_default(self):
+        manager = ResourceManager()
+        calls = []
+
+        def get_data() -> str:
+            calls.append(1)
+            return "data"
+
+        manager.add_resource_from_fn(get_data, uri="data://test")
+        await manager.read_resource("data://test")
+        await manager.read_resource("data://test")
+        assert len(calls) == 2
+        assert manager.cache_stats().entries == 0
+
+    async def test_function_resource_cached(self):
+        manager = ResourceManager()
+        calls = []
+
+        def get_data() -> str:
+            calls.append(1)
+            return "data"
+
+        manager.add_resource_from_fn(get_data, uri="data://test", cache_ttl=60)
+        first = await manager.read_resource("data://test")
+        second = await manager.resolve_and_read("data://test")
+        assert first == "data"
+        assert second == ("data", "text/plain")
+        assert len(calls) == 1
+
+        stats = manager.cache_stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.entries == 1
+        assert stats.size_bytes == 4
+
+    async def test_cached_contents_are_shared(self):
+        manager = ResourceManager()
+        manager.add_resource_from_fn(
+            lambda: b"x" * 1000, uri="data://blob", name="blob", cache_ttl=60
+        )
+        first = await manager.read_resource("data://blob")
+        second = await manager.read_resource("data://blob")
+        assert first is second
+
+    async def test_cache_expires(self):
+        manager = ResourceManager()
+        calls = []
+
+        def get_data() -> str:
+            calls.append(1)
+            return "data"
+
+        manager.add_resource_from_fn(get_data, uri="data://test", cache_ttl=10)
+        with patch("time.monotonic", return_value=100.0):
+            await manager.read_resource("data://test")
+        with patch("time.monotonic", return_value=105.0):
+            await manager.read_resource("data://test")
+        assert len(calls) == 1
+        with patch("time.monotonic", return_value=111.0):
+            await manager.read_resource("data://test")
+        assert len(calls) == 2
+
+    async def test_template_resources_cached_by_uri(self):
+        manager = ResourceManager()
+        calls = []
+
+        def greet(name: str) -> str:
+            calls.append(name)
+            return f"Hello, {name}!"
+
+        manager.add_template_from_fn(greet, "greet://{name}", cache_ttl=60)
+        assert await manager.read_resource("greet://a") == "Hello, a!"
+        assert await manager.read_resource("greet://b") == "Hello, b!"
+        assert await manager.read_resource("greet://a") == "Hello, a!"
+        assert calls == ["a", "b"]
+
+    async def test_file_resource_revalidated(self, tmp_path: Path):
+        path = tmp_path / "data.txt"
+        path.write_text("version 1")
+        manager = ResourceManager()
+        manager.add_resource(
+            FileResource(uri=FileUrl(f"file://{path}"), path=path, cache_ttl=60)
+        )
+
+        assert await manager.read_resource(f"file://{path}") == "version 1"
+        assert await manager.read_resource(f"file://{path}") == "version 1"
+        assert manager.cache_stats().hits == 1
+
+        path.write_text("version 2, longer")
+        assert await manager.read_resource(f"file://{path}") == "version 2, longer"
+        # the contents cached for the old version were dropped
+        assert manager.cache_stats().entries == 1
+
+    async def test_missing_file_is_not_served_from_cache(self, tmp_path: Path):
+        path = tmp_path / "data.txt"
+        path.write_text("data")
+        manager = ResourceManager()
+        manager.add_resource(
+            FileResource(uri=FileUrl(f"file://{path}"), path=path, cache_ttl=60)
+        )
+        await manager.read_resource(f"file://{path}")
+
+        path.unlink()
+        with pytest.raises(ResourceError, match="Error reading file"):
+            await manager.read_resource(f"file://{path}")
+
+    async def test_invalidate_cache(self):
+        manager = ResourceManager()
+        calls = []
+
+        def greet(name: str) -> str:
+            calls.append(name)
+            return f"Hello, {name}!"
+
+        manager.add_template_from_fn(greet, "greet://{name}", cache_ttl=60)
+        await manager.read_resource("greet://a")
+        await manager.read_resource("greet://b")
+
+        manager.invalidate_cache("greet://a")
+        await manager.read_resource("greet://a")
+        await manager.read_resource("greet://b")
+        assert calls == ["a", "b", "a"]
+
+        manager.invalidate_cache()
+        assert manager.cache_stats().entries == 0
+        await manager.read_resource("greet://b")
+        assert calls == ["a", "b", "a", "b"]
+
+    async def test_evicts_by_size(self):
+        manager = ResourceManager(cache_max_bytes=150)
+        manager.add_template_from_fn(
+            lambda name: name * 100, "data://{name}", name="data", cache_ttl=60
+        )
+        await manager.read_resource("data://a")
+        await manager.read_resource("data://b")
+
+        stats = manager.cache_stats()
+        assert stats.entries == 1
+        assert stats.evictions == 1
+        assert stats.size_bytes == 100
+
+    async def test_evicted_contents_leave_nothing_behind(self, tmp_path: Path):
+        for i in range(20):
+            (tmp_path / f"{i}.txt").write_text("x" * 10)
+        manager = ResourceManager(cache_max_bytes=100)
+        manager.add_template_from_fn(
+            lambda name: name, "data://{name}", name="data", cache_ttl=60
+        )
+        manager.add_resource(
+            FileResource(
+                uri=FileUrl(f"file://{tmp_path}/0.txt"),
+                path=tmp_path / "0.txt",
+                cache_ttl=60,
+            )
+        )
+        for i in range(1000):
+            await manager.read_resource(f"data://{i}")
+        await manager.read_resource(f"file://{tmp_path}/0.txt")
+
+        stats = manager.cache_stats()
+        assert stats.size_bytes <= 100
+        assert len(manager._cache) == stats.entries
+        assert stats.entries < 100
+
+    async def test_stale_contents_count_as_miss(self, tmp_path: Path):
+        path = tmp_path / "data.txt"
+        path.write_text("version 1")
+        manager = ResourceManager()
+        manager.add_resource(
+            FileResource(uri=FileUrl(f"file://{path}"), path=path, cache_ttl=60)
+        )
+        await manager.read_resource(f"file://{path}")
+        path.write_text("version 2, longer")
+        await manager.read_resource(f"file://{path}")
+
+        stats = manager.cache_stats()
+        assert (stats.hits, stats.misses, stats.entries) == (0, 2, 1)
+
+    async def test_adding_resource_drops_template_contents(self):
+        manager = ResourceManager()
+        manager.add_template_from_fn(
+            lambda name: f"template {name}", "data://{name}", name="t", cache_ttl=60
+        )
+        assert await manager.read_resource("data://a") == "template a"
+
+        manager.add_resource_from_fn(lambda: "resource", uri="data://a", name="r")
+        assert await manager.read_resource("data://a") == "resource"
+
+    async def test_replacing_template_drops_contents(self):
+        manager = ResourceManager(duplicate_behavior="replace")
+        manager.add_template_from_fn(
+            lambda name: f"old {name}", "data://{name}", name="t", cache_ttl=60
+        )
+        assert await manager.read_resource("data://a") == "old a"
+
+        manager.add_template_from_fn(
+            lambda name: f"new {name}", "data://{name}", name="t", cache_ttl=60
+        )
+        assert await manager.read_resource("data://a") == "new a"
+
+    def test_context_resources_can_not_be_cached(self):
+        from FlashMCP import Context
+
+        manager = ResourceManager()
+
+        def get_data(ctx: Context) -> str:
+            return "data"
+
+        with pytest.raises(ValueError, match="requests a Context"):
+            manager.add_resource_from_fn(get_data, uri="data://test", cache_ttl=60)
+
+
+class TestResourceRanges:
+    """Test reading ranges of resources through URI queries."""
+
+    async def test_read_file_range(self, temp_file: Path):
+        manager = ResourceManager()
+        manager.add_resource(
+            FileResource(uri=FileUrl(temp_file.as_uri()), path=temp_file)
+        )
+
+        uri = f"{temp_file.as_uri()}?offset=5&length=4"
+        assert await manager.read_resource(uri) == "cont"
+        assert manager.has_resource(uri)
+
+    async def test_read_binary_range(self):
+        manager = ResourceManager()
+        manager.add_resource(
+            BinaryResource(
+                uri=AnyUrl("data://blob"),
+                data=b"0123456789",
+                mime_type="application/octet-stream",
+            )
+        )
+
+        assert await manager.resolve_and_read("data://blob?offset=7") == (
+            b"789",
+            "application/octet-stream",
+        )
+        resource = await manager.get_resource("data://blob?length=2")
+        assert isinstance(resource, BinaryResource)
+        assert str(resource.uri) == "data://blob?length=2"
+        assert await resource.read() == b"01"
+
+    async def test_invalid_range(self):
+        manager = ResourceManager()
+        manager.add_resource(BinaryResource(uri=AnyUrl("data://blob"), data=b"0"))
+
+        with pytest.raises(ResourceError, match="Invalid query"):
+            await manager.read_resource("data://blob?offset=-1")
+        with pytest.raises(ResourceError, match="Invalid query"):
+            await manager.read_resource("data://blob?length=abc")
+
+    async def test_other_queries_are_not_ranges(self):
+        manager = ResourceManager()
+        manager.add_resource(BinaryResource(uri=AnyUrl("data://blob"), data=b"0"))
+        manager.add_resource_from_fn(lambda: "text", uri="data://text", name="text")
+
+        with pytest.raises(NotFoundError):
+            await manager.read_resource("data://blob?version=2")
+        with pytest.raises(NotFoundError):
+            await manager.read_resource("data://text?offset=1")
@@ -6,7 +6,8 @@ from pydantic import BaseModel
 
 from FlashMCP import Context
 from FlashMCP.resources import FunctionResource, ResourceTemplate
-from FlashMCP.resources.template import match_uri_template
+from FlashMCP.resources.template import TemplateRouter, match_uri_template
+from FlashMCP.utilities.types import get_cached_parameters_schema
 
 
 class TestResourceTemplate:
@@ -368,6 +369,90 @@ class TestResourceTemplate:
         )
         assert template.uri_template == "test://{x}/{y}/{z}"
 
+    def test_parameters_schema(self):
+        def func(x: int, ctx: Context, y: str = "a") -> str:
+            return f"{x}{y}"
+
+        template = ResourceTemplate.from_function(
+            fn=func, uri_template="test://{x}", name="test"
+        )
+        assert template.parameters == {
+            "type": "object",
+            "properties": {
+                "x": {"title": "X", "type": "integer"},
+                "y": {"default": "a", "title": "Y", "type": "string"},
+            },
+            "required": ["x"],
+        }
+
+    def test_explicit_parameters(self):
+        template = ResourceTemplate(
+            uri_template="test://{x}",
+            name="test",
+            description="",
+            fn=lambda x: x,
+            parameters={"type": "object"},
+        )
+        assert template.parameters == {"type": "object"}
+
+    def test_parameters_are_a_field(self):
+        def func(x: int) -> int:
+            return x
+
+        template = ResourceTemplate.from_function(
+            fn=func, uri_template="test://{x}", name="test"
+        )
+        dumped = template.model_dump()
+        assert dumped["parameters"] == get_cached_parameters_schema(func, None)
+        assert ResourceTemplate(**dumped) == template
+
+        template.parameters = {"type": "object"}
+        assert template.parameters == {"type": "object"}
+        assert template.model_dump()["parameters"] == {"type": "object"}
+
+    async def test_validator_is_built_on_first_read(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        import FlashMCP.resources.template
+
+        built = []
+        original = FlashMCP.resources.template.get_cached_typeadapter
+
+        def get_cached_typeadapter(fn):
+            built.append(fn)
+            return original(fn)
+
+        monkeypatch.setattr(
+            FlashMCP.resources.template,
+            "get_cached_typeadapter",
+            get_cached_typeadapter,
+        )
+
+        def func(x: int) -> int:
+            return x * 2
+
+        template = ResourceTemplate.from_function(
+            fn=func, uri_template="test://{x}", name="test"
+        )
+        assert built == []
+
+        resource = await template.create_resource("test://2", {"x": "2"})
+        assert await resource.read() == "4"
+        assert built == [func]
+
+    def test_schema_is_shared_with_tools(self):
+        from FlashMCP.tools import Tool
+
+        def func(x: int) -> int:
+            return x
+
+        template = ResourceTemplate.from_function(
+            fn=func, uri_template="test://{x}", name="test"
+        )
+        tool = Tool.from_function(func)
+        assert template.parameters == get_cached_parameters_schema(func, None)
+        assert tool.parameters == template.parameters
+
 
 class TestMatchUriTemplate:
     """Test match_uri_template function."""
@@ -639,3 +724,68 @@ class TestContextHandling:
         assert isinstance(resource, FunctionResource)
         content = await resource.read()
         assert content == "42"
+
+
+class TestTemplateRouter:
+    """Test the compiled template router."""
+
+    @pytest.mark.parametrize(
+        "uri_template, uri",
+        [
+            ("test://a/{x}/b", "test://a/x/b"),
+            ("test://a/{x}/b", "test://a/x/y/b"),
+            ("test://{x}/{y}", "test://foo/email@domain.com"),
+            ("test://{x}/{y}", f"test://escaped{quote('/', safe='')}word/bar"),
+            ("test://{x}/{y}", "prefix+test://foo/123"),
+            ("test://{x}/{y}", "test://foo"),
+            ("test://a/b/{x}/c/d/{y}", "test://a/b/foo/c/d/123"),
+            ("prefix+test://{x}/test/{y}", "prefix+test://foo/test/123"),
+            ("test://a/{x*}/b", "test://a/x/y/b"),
+            ("test://a/{x*}/b", "test://a/x/y/z"),
+            ("test://a/{x*}/b/{y*}", "test://a/x/y/b/c/d"),
+            ("test://a/{x*}/{y}", "test://a/x/y/b"),
+            ("test://a/{x}{y}", "test://a/x/y"),
+            ("file://abc/{path*}.py", "file://abc/x/y/z.py"),
+            ("file://abc/{path*}.py", "file://abc/x/y/z.md"),
+            ("file://abc/{name}.py", "file://abc/z.py"),
+        ],
+    )
+    def test_router_agrees_with_match_uri_template(self, uri_template: str, uri: str):
+        router = TemplateRouter([uri_template])
+        expected = match_uri_template(uri=uri, uri_template=uri_template)
+        result = router.match(uri)
+        if expected is None:
+            assert result is None
+        else:
+            assert result == (uri_template, expected)
+
+    def test_first_added_template_wins(self):
+        router = TemplateRouter(["test://{x}/{y}", "test://a/{y}"])
+        assert router.match("test://a/1") == ("test://{x}/{y}", {"x": "a", "y": "1"})
+
+        router = TemplateRouter(["test://a/{y}", "test://{x}/{y}"])
+        assert router.match("test://a/1") == ("test://a/{y}", {"y": "1"})
+        assert router.match("test://b/1") == ("test://{x}/{y}", {"x": "b", "y": "1"})
+
+    def test_wildcard_precedence_follows_add_order(self):
+        router = TemplateRouter(["test://{path*}", "test://a/{x}"])
+        assert router.match("test://a/b") == ("test://{path*}", {"path": "a/b"})
+
+        router = TemplateRouter(["test://a/{x}", "test://{path*}"])
+        assert router.match("test://a/b") == ("test://a/{x}", {"x": "b"})
+        assert router.match("test://b/c") == ("test://{path*}", {"path": "b/c"})
+
+    def test_add_after_construction(self):
+        router = TemplateRouter(["test://a/{x}"])
+        assert router.match("other://b") is None
+        router.add("other://{y}")
+        assert len(router) == 2
+        assert router.match("other://b") == ("other://{y}", {"y": "b"})
+
+    def test_many_templates(self):
+        router = TemplateRouter(f"api://service{i}/{{id}}" for i in range(1000))
+        assert router.match("api://service999/42") == (
+            "api://service999/{id}",
+            {"id": "42"},
+        )
+        assert router.match("api://service1000/42") is None
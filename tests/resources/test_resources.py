@@ -1,7 +1,7 @@
 import pytest
 from pydantic import AnyUrl
 
-from FlashMCP.resources import FunctionResource, Resource
+from FlashMCP.resources import BinaryResource, FunctionResource, Resource
 
 
 class TestResourceValidation:
@@ -98,3 +98,18 @@ class TestResourceValidation:
 
         with pytest.raises(TypeError, match="abstract method"):
             ConcreteResource(uri=AnyUrl("test://test"), name="test")  # type: ignore
+
+
+class TestBinaryResource:
+    """Test BinaryResource ranges and chunks."""
+
+    async def test_read(self):
+        data = b"0123456789"
+        resource = BinaryResource(uri=AnyUrl("data://test"), data=data)
+        assert await resource.read() is data
+
+    async def test_read_range(self):
+        resource = BinaryResource(
+            uri=AnyUrl("data://test"), data=b"0123456789", offset=3, length=4
+        )
+        assert await resource.read() == b"3456"
@@ -25,7 +25,7 @@ from pydantic import TypeAdapter
 from starlette.applications import Starlette
 from starlette.routing import Mount
 
-from FlashMCP import Context, FlashMCP
+from FlashMCP import Client, Context, FlashMCP
 from FlashMCP.utilities.tests import run_server_in_process
 
 
@@ -394,3 +394,61 @@ async def test_missing_lifespan_logs_informative_error(tmp_path: Path):
     assert (
         "--- FALLBACK EXCEPTION IN SERVER RUNNER (PRE-UVICORN) ---" not in log_content
     )
+
+
+async def test_process_pool_is_shut_down_with_last_session():
+    """The tool process pool is shared by sessions and shut down with the last."""
+    mcp = FlashMCP()
+    shutdowns = []
+    mcp._tool_manager.executor.shutdown = lambda: shutdowns.append(True)  # type: ignore[method-assign]
+
+    async with Client(mcp):
+        async with Client(mcp):
+            pass
+        assert shutdowns == []
+    assert shutdowns == [True]
+
+
+async def test_process_pool_is_kept_while_http_app_runs():
+    """An HTTP app keeps the server's resources between its sessions."""
+    mcp = FlashMCP()
+    shutdowns = []
+    mcp._tool_manager.executor.shutdown = lambda: shutdowns.append(True)  # type: ignore[method-assign]
+    app = mcp.http_app()
+
+    async with app.router.lifespan_context(app):
+        async with Client(mcp):
+            pass
+        assert shutdowns == []
+    assert shutdowns == [True]
+
+
+async def test_mounted_server_resources_are_released():
+    """Servers mounted on a running server release their resources with it."""
+    mcp = FlashMCP()
+    sub = FlashMCP()
+    mcp.mount("sub", sub)
+    shutdowns = []
+    sub._tool_manager.executor.shutdown = lambda: shutdowns.append(True)  # type: ignore[method-assign]
+
+    async with Client(mcp):
+        assert shutdowns == []
+    assert shutdowns == [True]
+
+
+async def test_http_client_is_closed_with_last_session():
+    """The client of the server's HTTP resources is closed when it stops."""
+    mcp = FlashMCP()
+    async with Client(mcp):
+        client = mcp._resource_manager.http.client
+    assert client.is_closed
+
+
+async def test_given_http_client_is_kept_open():
+    """A client passed to the server is left for its owner to close."""
+    client = httpx.AsyncClient()
+    mcp = FlashMCP(http_client=client)
+    async with Client(mcp):
+        assert mcp._resource_manager.http.client is client
+    assert not client.is_closed
+    await client.aclose()
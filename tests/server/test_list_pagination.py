@@ -0,0 +1,215 @@
+import contextlib
+from typing import Any
+
+import anyio
+import pytest
+from mcp import ClientSession, McpError
+from mcp.shared.memory import create_client_server_memory_streams
+from mcp.shared.message import SessionMessage
+from mcp.types import (
+    LATEST_PROTOCOL_VERSION,
+    Implementation,
+    InitializeResult,
+    JSONRPCMessage,
+    JSONRPCRequest,
+    JSONRPCResponse,
+    ListToolsResult,
+    Result,
+    ServerCapabilities,
+    Tool,
+    ToolsCapability,
+)
+
+from FlashMCP import Client, FlashMCP
+from FlashMCP.client.transports import ClientTransport
+from FlashMCP.utilities.pagination import encode_cursor
+
+
+@pytest.fixture
+def mcp() -> FlashMCP:
+    mcp = FlashMCP(list_page_size=2)
+    for i in range(5):
+        mcp.add_tool(lambda: i, name=f"tool_{i}")
+        mcp.add_resource_fn(lambda: "data", uri=f"data://item_{i}", name=f"item_{i}")
+        mcp.add_resource_fn(
+            lambda x: x, uri=f"data://template_{i}/{{x}}", name=f"template_{i}"
+        )
+        mcp.add_prompt(lambda: "hi", name=f"prompt_{i}")
+    return mcp
+
+
+class TestListPagination:
+    async def test_pages(self, mcp: FlashMCP):
+        async with Client(mcp) as client:
+            first = await client.list_tools_mcp()
+            assert [tool.name for tool in first.tools] == ["tool_0", "tool_1"]
+            assert first.nextCursor is not None
+
+            second = await client.list_tools_mcp(cursor=first.nextCursor)
+            assert [tool.name for tool in second.tools] == ["tool_2", "tool_3"]
+
+            third = await client.list_tools_mcp(cursor=second.nextCursor)
+            assert [tool.name for tool in third.tools] == ["tool_4"]
+            assert third.nextCursor is None
+
+    async def test_list_requests_every_page(self, mcp: FlashMCP):
+        async with Client(mcp) as client:
+            assert len(await client.list_tools()) == 5
+            assert len(await client.list_resources()) == 5
+            assert len(await client.list_resource_templates()) == 5
+            assert len(await client.list_prompts()) == 5
+
+    async def test_iteration_is_lazy(self, mcp: FlashMCP):
+        pages = []
+        async with Client(mcp) as client:
+            list_tools_mcp = client.list_tools_mcp
+
+            async def count_pages(cursor=None):
+                pages.append(cursor)
+                return await list_tools_mcp(cursor=cursor)
+
+            client.list_tools_mcp = count_pages  # type: ignore[method-assign]
+            async for tool in client.iter_tools():
+                if tool.name == "tool_1":
+                    break
+        assert len(pages) == 1
+
+    async def test_cursor_stays_valid_after_changes(self, mcp: FlashMCP):
+        async with Client(mcp) as client:
+            first = await client.list_prompts_mcp()
+            assert [p.name for p in first.prompts] == ["prompt_0", "prompt_1"]
+
+            mcp.add_prompt(lambda: "hi", name="prompt_00")
+            second = await client.list_prompts_mcp(cursor=first.nextCursor)
+            assert [p.name for p in second.prompts] == ["prompt_2", "prompt_3"]
+
+    async def test_invalid_cursor(self, mcp: FlashMCP):
+        async with Client(mcp) as client:
+            with pytest.raises(McpError, match="Invalid cursor"):
+                await client.list_resources_mcp(cursor="not a cursor!")
+
+    async def test_no_pagination_by_default(self):
+        mcp = FlashMCP()
+        for i in range(5):
+            mcp.add_tool(lambda: i, name=f"tool_{i}")
+        async with Client(mcp) as client:
+            result = await client.list_tools_mcp()
+            assert len(result.tools) == 5
+            assert result.nextCursor is None
+
+
+class SpecServerTransport(ClientTransport):
+    """Connects to a bare server that pages tools/list two tools at a time,
+    reading the cursor only from the request's params, as the spec has it."""
+
+    def __init__(self, read_cursor: bool = True):
+        self.read_cursor = read_cursor
+        self.cursors: list[Any] = []
+
+    def result(self, request: JSONRPCRequest) -> Result:
+        if request.method == "initialize":
+            return InitializeResult(
+                protocolVersion=LATEST_PROTOCOL_VERSION,
+                capabilities=ServerCapabilities(tools=ToolsCapability()),
+                serverInfo=Implementation(name="spec", version="1.0"),
+            )
+        cursor = (request.params or {}).get("cursor")
+        self.cursors.append(cursor)
+        start = int(cursor) if cursor and self.read_cursor else 0
+        return ListToolsResult(
+            tools=[
+                Tool(name=f"tool_{i}", description="", inputSchema={"type": "object"})
+                for i in range(start, min(start + 2, 5))
+            ],
+            nextCursor=str(start + 2) if start + 2 < 5 else None,
+        )
+
+    async def serve(self, read_stream, write_stream):
+        async for message in read_stream:
+            request = message.message.root
+            if not isinstance(request, JSONRPCRequest):
+                continue
+            response = JSONRPCResponse(
+                jsonrpc="2.0",
+                id=request.id,
+                result=self.result(request).model_dump(
+                    by_alias=True, mode="json", exclude_none=True
+                ),
+            )
+            await write_stream.send(SessionMessage(message=JSONRPCMessage(response)))
+
+    @contextlib.asynccontextmanager
+    async def connect_session(self, **session_kwargs):
+        async with (
+            create_client_server_memory_streams() as (client, server),
+            anyio.create_task_group() as tg,
+        ):
+            tg.start_soon(self.serve, *server)
+            async with ClientSession(*client, **session_kwargs) as session:
+                yield session
+            tg.cancel_scope.cancel()
+
+
+class TestSpecCursor:
+    async def test_cursor_is_sent_in_params(self):
+        transport = SpecServerTransport()
+        async with Client(transport) as client:
+            tools = await client.list_tools()
+        assert [tool.name for tool in tools] == [f"tool_{i}" for i in range(5)]
+        assert transport.cursors == [None, "2", "4"]
+
+    async def test_repeated_cursor_stops_iteration(self):
+        transport = SpecServerTransport(read_cursor=False)
+        async with Client(transport) as client:
+            with pytest.raises(RuntimeError, match="cursor '2' twice"):
+                await client.list_tools()
+        assert transport.cursors == [None, "2"]
+
+    async def test_proxy_lists_every_page(self):
+        proxy = FlashMCP.as_proxy(Client(SpecServerTransport()))
+        tools = await proxy.get_tools()
+        assert sorted(tools) == [f"tool_{i}" for i in range(5)]
+
+
+class TestListPageCache:
+    async def test_repeated_list_reuses_page(self, mcp: FlashMCP):
+        first = await mcp._mcp_list_tools_page(None)
+        assert await mcp._mcp_list_tools_page(None) is first
+        assert first.model_dump(
+            by_alias=True, mode="json", exclude_none=True
+        ) is first.model_dump(by_alias=True, mode="json", exclude_none=True)
+
+    async def test_adding_component_rebuilds_page(self, mcp: FlashMCP):
+        first = await mcp._mcp_list_tools_page(None)
+        mcp.add_tool(lambda: 0, name="a_tool")
+
+        second = await mcp._mcp_list_tools_page(None)
+        assert second is not first
+        assert [tool.name for tool in second.root.tools] == ["a_tool", "tool_0"]
+
+    async def test_changing_component_rebuilds_page(self, mcp: FlashMCP):
+        first = await mcp._mcp_list_prompts_page(None)
+        mcp._prompt_manager.get_prompts()["prompt_0"].description = "changed"
+
+        second = await mcp._mcp_list_prompts_page(None)
+        assert second is not first
+        assert second.root.prompts[0].description == "changed"
+
+    async def test_mounting_rebuilds_page(self, mcp: FlashMCP):
+        first = await mcp._mcp_list_tools_page(None)
+        sub = FlashMCP()
+        sub.add_tool(lambda: 0, name="sub_tool")
+        mcp.mount("a", sub)
+
+        second = await mcp._mcp_list_tools_page(None)
+        assert second is not first
+        assert second.root.tools[0].name == "a_sub_tool"
+
+    async def test_made_up_cursors_are_not_cached(self, mcp: FlashMCP):
+        first = await mcp._mcp_list_tools_page(None)
+        await mcp._mcp_list_tools_page(first.root.nextCursor)
+        cursor = encode_cursor("tool_0")
+        await mcp._mcp_list_tools_page(cursor)
+
+        pages = mcp._page_caches["tools"]._pages
+        assert set(pages) == {None, first.root.nextCursor}
@@ -1,11 +1,13 @@
 import json
+import time
 from contextlib import asynccontextmanager
 
+import anyio
 import pytest
 from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.types import TextContent, TextResourceContents
 
-from FlashMCP import FlashMCP
+from FlashMCP import Context, FlashMCP
 from FlashMCP.client import Client
 from FlashMCP.client.transports import FlashMCPTransport
 from FlashMCP.exceptions import NotFoundError
@@ -182,6 +184,81 @@ class TestMultipleServerMount:
         # Second app's tool should be accessible
         assert "api_second_tool" in tools
 
+    async def test_longest_prefix_wins(self):
+        main_app = FlashMCP("MainApp")
+        short_app = FlashMCP("ShortApp")
+        long_app = FlashMCP("LongApp")
+        long_app.add_tool(lambda: "long", name="tool")
+        long_app.add_prompt(lambda: "long", name="prompt")
+        long_app.add_resource_fn(lambda: "long", uri="data://resource")
+        main_app.mount("api", short_app)
+        main_app.mount("api_v2", long_app)
+
+        result = await main_app._mcp_call_tool("api_v2_tool", {})
+        assert isinstance(result[0], TextContent)
+        assert result[0].text == "long"
+        prompt = await main_app._mcp_get_prompt("api_v2_prompt")
+        assert prompt.messages[0].content.text == "long"  # type: ignore[attr-defined]
+        contents = await main_app._mcp_read_resource("data://api_v2/resource")
+        assert contents[0].content == "long"
+
+    async def test_nested_dispatch(self):
+        main_app = FlashMCP("MainApp")
+        middle_app = FlashMCP("MiddleApp")
+        leaf_app = FlashMCP("LeafApp")
+        leaf_app.add_tool(lambda: "leaf", name="tool")
+        leaf_app.add_resource_fn(lambda: "leaf", uri="data://resource")
+        middle_app.mount("leaf", leaf_app)
+        main_app.mount("middle", middle_app)
+
+        result = await main_app._mcp_call_tool("middle_leaf_tool", {})
+        assert isinstance(result[0], TextContent)
+        assert result[0].text == "leaf"
+        contents = await main_app._mcp_read_resource("data://middle/leaf/resource")
+        assert contents[0].content == "leaf"
+
+    async def test_nested_context_reports_owning_server(self, monkeypatch):
+        main_app = FlashMCP("MainApp")
+        middle_app = FlashMCP("MiddleApp")
+        leaf_app = FlashMCP("LeafApp")
+
+        @leaf_app.tool()
+        def owner(context: Context) -> str:
+            return context.FlashMCP.name
+
+        middle_app.mount("leaf", leaf_app)
+        main_app.mount("middle", middle_app)
+
+        contexts = []
+        init = Context.__init__
+
+        def record_context(self, *args, **kwargs):
+            contexts.append(self)
+            init(self, *args, **kwargs)
+
+        monkeypatch.setattr(Context, "__init__", record_context)
+
+        result = await main_app._mcp_call_tool("middle_leaf_owner", {})
+        assert isinstance(result[0], TextContent)
+        assert result[0].text == "LeafApp"
+        assert len(contexts) == 1
+
+    async def test_nested_unknown_tool(self):
+        main_app = FlashMCP("MainApp")
+        middle_app = FlashMCP("MiddleApp")
+        middle_app.mount("leaf", FlashMCP("LeafApp"))
+        main_app.mount("middle", middle_app)
+
+        with pytest.raises(NotFoundError, match="Unknown tool: missing"):
+            await main_app._mcp_call_tool("middle_leaf_missing", {})
+
+    async def test_unknown_uri_with_mounts(self):
+        main_app = FlashMCP("MainApp")
+        main_app.mount("sub", FlashMCP("SubApp"))
+
+        with pytest.raises(NotFoundError, match="Unknown resource"):
+            await main_app._mcp_read_resource("no-protocol")
+
 
 class TestDynamicChanges:
     """Test that changes to mounted servers are reflected dynamically."""
@@ -229,14 +306,156 @@ class TestDynamicChanges:
         assert "sub_temp_tool" in tools
 
         # Remove the tool from sub_app
-        sub_app._tool_manager._tools.pop("temp_tool")
+        sub_app.remove_tool("temp_tool")
 
         # The tool should no longer be accessible
-        # Refresh the cache by clearing it
-        main_app._cache.cache.clear()
         tools = await main_app.get_tools()
         assert "sub_temp_tool" not in tools
 
+    async def test_unchanged_catalogue_is_reused(self):
+        main_app = FlashMCP("MainApp")
+        sub_app = FlashMCP("SubApp")
+        sub_app.add_tool(lambda: "a", name="a")
+        main_app.mount("sub", sub_app)
+
+        await main_app.get_tools()
+        catalogue = main_app._catalogue["tools"]
+        await main_app.get_tools()
+        assert main_app._catalogue["tools"] is catalogue
+
+    async def test_changing_the_result_doesnt_change_the_catalogue(self):
+        main_app = FlashMCP("MainApp")
+        sub_app = FlashMCP("SubApp")
+        sub_app.add_tool(lambda: "a", name="a")
+        main_app.mount("sub", sub_app)
+
+        (await main_app.get_tools()).pop("sub_a")
+
+        assert list(await main_app.get_tools()) == ["sub_a"]
+        assert [tool.name for tool in await main_app._mcp_list_tools()] == ["sub_a"]
+
+    async def test_nested_changes_are_reflected(self):
+        main_app = FlashMCP("MainApp")
+        middle_app = FlashMCP("MiddleApp")
+        leaf_app = FlashMCP("LeafApp")
+        middle_app.mount("leaf", leaf_app)
+        main_app.mount("middle", middle_app)
+        assert await main_app.get_prompts() == {}
+
+        leaf_app.add_prompt(lambda: "hi", name="hi")
+
+        prompts = await main_app.get_prompts()
+        assert list(prompts) == ["middle_leaf_hi"]
+
+    async def test_unchanged_mounted_server_is_not_prefixed_again(self):
+        main_app = FlashMCP("MainApp")
+        a_app = FlashMCP("A")
+        b_app = FlashMCP("B")
+        a_app.add_tool(lambda: "a", name="a")
+        main_app.mount("a", a_app)
+        main_app.mount("b", b_app)
+        a_tools = await main_app._mounted_servers["a"].get_tools()
+
+        b_app.add_tool(lambda: "b", name="b")
+
+        assert set(await main_app.get_tools()) == {"a_a", "b_b"}
+        assert await main_app._mounted_servers["a"].get_tools() is a_tools
+
+    async def test_unmounted_server_changes_are_not_propagated(self):
+        main_app = FlashMCP("MainApp")
+        sub_app = FlashMCP("SubApp")
+        main_app.mount("sub", sub_app)
+        main_app.unmount("sub")
+        await main_app.get_tools()
+        catalogue = main_app._catalogue["tools"]
+
+        sub_app.add_tool(lambda: "a", name="a")
+
+        await main_app.get_tools()
+        assert main_app._catalogue["tools"] is catalogue
+
+    async def test_replaced_server_changes_are_not_propagated(self):
+        main_app = FlashMCP("MainApp")
+        old_app = FlashMCP("OldApp")
+        new_app = FlashMCP("NewApp")
+        main_app.mount("sub", old_app)
+        main_app.mount("sub", new_app)
+        assert old_app._mounted_on == []
+        assert new_app._mounted_on == [(main_app, "sub")]
+        await main_app.get_tools()
+        catalogue = main_app._catalogue["tools"]
+
+        old_app.add_tool(lambda: "a", name="a")
+
+        await main_app.get_tools()
+        assert main_app._catalogue["tools"] is catalogue
+
+    def test_cache_expiration_seconds_is_deprecated(self):
+        with pytest.warns(DeprecationWarning, match="cache_expiration_seconds"):
+            FlashMCP(cache_expiration_seconds=10)
+
+
+class SlowServer(FlashMCP):
+    def __init__(self, name: str, delay: float, fail: bool = False):
+        super().__init__(name)
+        self.delay = delay
+        self.fail = fail
+        self.add_tool(lambda: name, name="tool")
+
+    async def get_tools(self):
+        await anyio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("backend unavailable")
+        return await super().get_tools()
+
+
+class TestConcurrentListing:
+    """Test that mounted servers are listed concurrently and independently."""
+
+    async def test_mounted_servers_are_listed_concurrently(self):
+        main_app = FlashMCP("MainApp")
+        for i in range(5):
+            main_app.mount(f"slow{i}", SlowServer(f"Slow{i}", delay=0.2))
+
+        start = time.perf_counter()
+        tools = await main_app.get_tools()
+        elapsed = time.perf_counter() - start
+
+        assert len(tools) == 5
+        assert elapsed < 0.6
+
+    async def test_mount_order_is_kept(self):
+        main_app = FlashMCP("MainApp")
+        main_app.mount("b", SlowServer("B", delay=0.1))
+        main_app.mount("a", SlowServer("A", delay=0))
+
+        assert list(await main_app.get_tools()) == ["b_tool", "a_tool"]
+
+    async def test_failing_server_is_left_out(self, caplog):
+        main_app = FlashMCP("MainApp")
+        failing = SlowServer("Failing", delay=0, fail=True)
+        main_app.mount("ok", SlowServer("Ok", delay=0))
+        main_app.mount("failing", failing)
+
+        assert list(await main_app.get_tools()) == ["ok_tool"]
+        assert "Error listing tools of mounted server 'failing'" in caplog.text
+
+        # incomplete lists are not reused
+        failing.fail = False
+        assert list(await main_app.get_tools()) == ["ok_tool", "failing_tool"]
+
+    async def test_slow_server_times_out(self, caplog):
+        main_app = FlashMCP("MainApp", mount_list_timeout=0.05)
+        main_app.mount("ok", SlowServer("Ok", delay=0))
+        main_app.mount("slow", SlowServer("Slow", delay=5))
+
+        start = time.perf_counter()
+        tools = await main_app.get_tools()
+
+        assert list(tools) == ["ok_tool"]
+        assert time.perf_counter() - start < 1
+        assert "Timed out listing tools of mounted server 'slow'" in caplog.text
+
 
 class TestResourcesAndTemplates:
     """Test mounting with resources and resource templates."""
@@ -287,6 +506,26 @@ class TestResourcesAndTemplates:
             assert profile["id"] == "123"
             assert profile["name"] == "User 123"
 
+    async def test_mounted_template_function_called_once_per_read(self):
+        """Test that reading through a mount resolves the template only once."""
+        main_app = FlashMCP("MainApp")
+        user_app = FlashMCP("UserApp")
+        calls = []
+
+        @user_app.resource(uri="users://{user_id}/profile")
+        def get_user_profile(user_id: str) -> dict:
+            calls.append(user_id)
+            return {"id": user_id}
+
+        main_app.mount("api", user_app)
+
+        async with Client(main_app) as client:
+            result = await client.read_resource("users://api/123/profile")
+            assert isinstance(result[0], TextResourceContents)
+            assert json.loads(result[0].text) == {"id": "123"}
+
+        assert calls == ["123"]
+
     async def test_adding_resource_after_mounting(self):
         """Test adding a resource after mounting."""
         main_app = FlashMCP("MainApp")
@@ -6,7 +6,7 @@ import pytest
 from dirty_equals import Contains
 from mcp import McpError
 
-from FlashMCP import FlashMCP
+from FlashMCP import Context, FlashMCP
 from FlashMCP.client import Client
 from FlashMCP.client.transports import FlashMCPTransport
 from FlashMCP.exceptions import ToolError
@@ -233,3 +233,88 @@ class TestPrompts:
         assert result.messages[0].role == "user"
         assert isinstance(result.messages[0].content, mcp.types.TextContent)
         assert result.messages[0].content.text == "Welcome to FlashMCP, Alice!"
+
+
+class TestRemoteCatalogue:
+    async def test_remote_lists_are_fetched_each_time_when_disconnected(
+        self, FlashMCP_server, proxy_server: FlashMCPProxy
+    ):
+        assert "greet" in await proxy_server.get_tools()
+        FlashMCP_server.remove_tool("greet")
+        assert "greet" not in await proxy_server.get_tools()
+
+    async def test_remote_lists_are_kept_while_connected(
+        self, FlashMCP_server, proxy_server: FlashMCPProxy
+    ):
+        async with proxy_server.client:
+            await proxy_server.get_tools()
+            catalogue = proxy_server._catalogue["tools"]
+            # without a list_changed notification, the remote list is reused
+            FlashMCP_server.remove_tool("greet")
+            assert "greet" in await proxy_server.get_tools()
+            assert proxy_server._catalogue["tools"] is catalogue
+
+        # disconnecting forgets the remote lists
+        assert "greet" not in await proxy_server.get_tools()
+
+    async def test_list_changed_notification_refreshes_remote_list(
+        self, FlashMCP_server, proxy_server: FlashMCPProxy
+    ):
+        @FlashMCP_server.tool()
+        async def grow(context: Context) -> None:
+            FlashMCP_server.add_tool(lambda: "new", name="new_tool")
+            await context.session.send_tool_list_changed()
+
+        async with proxy_server.client:
+            await proxy_server.get_prompts()
+            prompts = proxy_server._catalogue["prompts"]
+            assert "new_tool" not in await proxy_server.get_tools()
+
+            await proxy_server.client.call_tool("grow", {})
+
+            assert "new_tool" in await proxy_server.get_tools()
+            # other kinds of components are still kept
+            await proxy_server.get_prompts()
+            assert proxy_server._catalogue["prompts"] is prompts
+
+    async def test_list_changed_reaches_parent_server(
+        self, FlashMCP_server, proxy_server: FlashMCPProxy
+    ):
+        @FlashMCP_server.tool()
+        async def grow(context: Context) -> None:
+            FlashMCP_server.add_tool(lambda: "new", name="new_tool")
+            await context.session.send_tool_list_changed()
+
+        main_app = FlashMCP("MainApp")
+        main_app.mount("proxy", proxy_server)
+
+        async with proxy_server.client:
+            assert "proxy_new_tool" not in await main_app.get_tools()
+            await proxy_server.client.call_tool("grow", {})
+            assert "proxy_new_tool" in await main_app.get_tools()
+
+    async def test_unchanged_remote_list_is_not_a_change(
+        self, FlashMCP_server, proxy_server: FlashMCPProxy
+    ):
+        main_app = FlashMCP("MainApp")
+        main_app.mount("proxy", proxy_server)
+
+        page = await main_app._mcp_list_tools_page(None)
+        generations = dict(main_app._generations)
+        # listed again, but the same components are reused
+        assert await main_app._mcp_list_tools_page(None) is page
+        assert main_app._generations == generations
+
+        FlashMCP_server.remove_tool("greet")
+        assert await main_app._mcp_list_tools_page(None) is not page
+        assert main_app._generations == generations | {
+            "tools": generations["tools"] + 1
+        }
+
+    async def test_disconnecting_stops_watching(
+        self, FlashMCP_server, proxy_server: FlashMCPProxy
+    ):
+        async with proxy_server.client:
+            await proxy_server.get_tools()
+            assert proxy_server._watches_catalogue("tools")
+        assert not proxy_server._watches_catalogue("tools")
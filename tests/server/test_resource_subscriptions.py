@@ -0,0 +1,255 @@
+import logging
+from pathlib import Path
+
+import anyio
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import ResourceUpdatedNotification, ServerNotification
+
+from FlashMCP import Client, FlashMCP
+from FlashMCP.resources import DirectoryResource, FileResource
+from FlashMCP.utilities.tests import temporary_settings
+
+
+class UpdateRecorder:
+    """A client message handler recording `resources/updated` notifications."""
+
+    def __init__(self):
+        self.uris: list[str] = []
+
+    async def __call__(self, message) -> None:
+        if isinstance(message, ServerNotification) and isinstance(
+            message.root, ResourceUpdatedNotification
+        ):
+            self.uris.append(str(message.root.params.uri))
+
+    async def wait_for(self, count: int) -> None:
+        with anyio.fail_after(5):
+            while len(self.uris) < count:
+                await anyio.sleep(0.01)
+
+
+async def wait_for_no_subscribers(mcp: FlashMCP, uri: str) -> None:
+    with anyio.fail_after(5):
+        while mcp._resource_subscriptions.subscribers(uri):
+            await anyio.sleep(0.01)
+
+
+@pytest.fixture(autouse=True)
+def fast_notifications():
+    with temporary_settings(
+        resource_notification_debounce=0.01, resource_watch_interval=0.01
+    ):
+        yield
+
+
+@pytest.fixture
+def mcp() -> FlashMCP:
+    mcp = FlashMCP()
+
+    @mcp.resource("data://counter")
+    def counter() -> str:
+        return "0"
+
+    return mcp
+
+
+class TestResourceSubscriptions:
+    async def test_capabilities(self, mcp: FlashMCP):
+        async with Client(mcp) as client:
+            resources = client.initialize_result.capabilities.resources
+            assert resources is not None
+            assert resources.subscribe is True
+
+    async def test_notify_resource_changed(self, mcp: FlashMCP):
+        updates = UpdateRecorder()
+        async with Client(mcp, message_handler=updates) as client:
+            await client.subscribe_resource("data://counter")
+            mcp.notify_resource_changed("data://counter")
+            await updates.wait_for(1)
+        assert updates.uris == ["data://counter"]
+
+    async def test_notifications_are_debounced(self, mcp: FlashMCP):
+        updates = UpdateRecorder()
+        async with Client(mcp, message_handler=updates) as client:
+            await client.subscribe_resource("data://counter")
+            with temporary_settings(resource_notification_debounce=0.1):
+                for _ in range(10):
+                    mcp.notify_resource_changed("data://counter")
+                await updates.wait_for(1)
+                await anyio.sleep(0.2)
+        assert updates.uris == ["data://counter"]
+
+    async def test_unsubscribed_sessions_are_not_notified(self, mcp: FlashMCP):
+        updates = UpdateRecorder()
+        async with Client(mcp, message_handler=updates) as client:
+            mcp.notify_resource_changed("data://counter")
+            await client.subscribe_resource("data://counter")
+            await client.unsubscribe_resource("data://counter")
+            mcp.notify_resource_changed("data://counter")
+            await anyio.sleep(0.1)
+        assert updates.uris == []
+
+    async def test_all_subscribed_sessions_are_notified(self, mcp: FlashMCP):
+        first, second = UpdateRecorder(), UpdateRecorder()
+        async with Client(mcp, message_handler=first) as client_1:
+            async with Client(mcp, message_handler=second) as client_2:
+                await client_1.subscribe_resource("data://counter")
+                await client_2.subscribe_resource("data://counter")
+                mcp.notify_resource_changed("data://counter")
+                await first.wait_for(1)
+                await second.wait_for(1)
+
+    async def test_subscribe_to_unknown_resource(self, mcp: FlashMCP):
+        async with Client(mcp) as client:
+            with pytest.raises(McpError, match="Unknown resource"):
+                await client.subscribe_resource("data://missing")
+
+    async def test_file_changes_are_detected(self, tmp_path: Path):
+        path = tmp_path / "test.txt"
+        path.write_text("hello")
+        mcp = FlashMCP()
+        mcp.add_resource(FileResource(uri="file:///test.txt", path=path))
+
+        updates = UpdateRecorder()
+        async with Client(mcp, message_handler=updates) as client:
+            await client.subscribe_resource("file:///test.txt")
+            await anyio.sleep(0.05)
+            assert updates.uris == []
+
+            path.write_text("hello, world")
+            await updates.wait_for(1)
+        assert updates.uris == ["file:///test.txt"]
+
+    async def test_directory_changes_are_detected(self, tmp_path: Path):
+        (tmp_path / "a.txt").write_text("a")
+        mcp = FlashMCP()
+        mcp.add_resource(DirectoryResource(uri="dir://files", path=tmp_path))
+
+        updates = UpdateRecorder()
+        async with Client(mcp, message_handler=updates) as client:
+            await client.subscribe_resource("dir://files")
+            (tmp_path / "b.txt").write_text("b")
+            await updates.wait_for(1)
+        assert updates.uris == ["dir://files"]
+
+    async def test_mounted_server_changes(self, mcp: FlashMCP):
+        main = FlashMCP()
+        main.mount("sub", mcp)
+
+        updates = UpdateRecorder()
+        async with Client(main, message_handler=updates) as client:
+            await client.subscribe_resource("data://sub/counter")
+            mcp.notify_resource_changed("data://counter")
+            await updates.wait_for(1)
+        assert updates.uris == ["data://sub/counter"]
+
+        main.unmount("sub")
+        assert mcp._mounted_on == []
+
+    async def test_subscriptions_end_with_the_session(self, tmp_path: Path):
+        mcp = FlashMCP()
+        mcp.add_resource(DirectoryResource(uri="dir://files", path=tmp_path))
+
+        async with Client(mcp) as client:
+            await client.subscribe_resource("dir://files")
+            assert mcp._resource_subscriptions.subscribers("dir://files")
+        assert mcp._resource_subscriptions.subscribers("dir://files") == []
+        assert mcp._resource_subscriptions._sessions == set()
+
+    async def test_failing_watch_is_logged(self, mcp: FlashMCP, caplog):
+        class BrokenResource(FileResource):
+            async def get_cache_validator(self):
+                if self.name == "broken":
+                    raise RuntimeError("boom")
+                self.name = "broken"
+
+        mcp.add_resource(
+            BrokenResource(uri="file:///broken.txt", path=Path("/broken.txt"))
+        )
+        updates = UpdateRecorder()
+        with caplog.at_level(logging.ERROR):
+            async with Client(mcp, message_handler=updates) as client:
+                await client.subscribe_resource("file:///broken.txt")
+                with anyio.fail_after(5):
+                    while "Error watching resource" not in caplog.text:
+                        await anyio.sleep(0.01)
+
+                # the subscription is kept, and notified of reported changes
+                mcp.notify_resource_changed("file:///broken.txt")
+                await updates.wait_for(1)
+        assert updates.uris == ["file:///broken.txt"]
+
+
+class TestProxySubscriptions:
+    async def test_subscribe_through_proxy(self, mcp: FlashMCP):
+        proxy = FlashMCP.as_proxy(mcp)
+
+        updates = UpdateRecorder()
+        async with Client(proxy, message_handler=updates) as client:
+            await client.subscribe_resource("data://counter")
+            assert mcp._resource_subscriptions.subscribers("data://counter")
+
+            mcp.notify_resource_changed("data://counter")
+            await updates.wait_for(1)
+        assert updates.uris == ["data://counter"]
+
+    async def test_subscribe_through_mounted_proxy(self, mcp: FlashMCP):
+        main = FlashMCP()
+        main.mount("proxy", FlashMCP.as_proxy(mcp))
+
+        updates = UpdateRecorder()
+        async with Client(main, message_handler=updates) as client:
+            await client.subscribe_resource("data://proxy/counter")
+            mcp.notify_resource_changed("data://counter")
+            await updates.wait_for(1)
+        assert updates.uris == ["data://proxy/counter"]
+
+    async def test_unsubscribe_through_proxy(self, mcp: FlashMCP):
+        proxy = FlashMCP.as_proxy(mcp)
+
+        async with Client(proxy) as client:
+            await client.subscribe_resource("data://counter")
+            await client.unsubscribe_resource("data://counter")
+            await wait_for_no_subscribers(mcp, "data://counter")
+
+    async def test_subscriptions_end_with_the_session(self, mcp: FlashMCP):
+        proxy = FlashMCP.as_proxy(mcp)
+
+        async with Client(proxy) as client:
+            await client.subscribe_resource("data://counter")
+        await wait_for_no_subscribers(mcp, "data://counter")
+
+    async def test_subscriptions_share_a_connected_client(self, mcp: FlashMCP):
+        proxy = FlashMCP.as_proxy(mcp)
+
+        updates = UpdateRecorder()
+        async with proxy.client:
+            async with (
+                Client(proxy, message_handler=updates) as client_1,
+                Client(proxy) as client_2,
+            ):
+                await client_1.subscribe_resource("data://counter")
+                await client_2.subscribe_resource("data://counter")
+                assert proxy._remote_subscriptions == {"data://counter": 2}
+                assert (
+                    len(mcp._resource_subscriptions.subscribers("data://counter")) == 1
+                )
+
+                mcp.notify_resource_changed("data://counter")
+                await updates.wait_for(1)
+
+                await client_1.unsubscribe_resource("data://counter")
+                await client_2.unsubscribe_resource("data://counter")
+                await wait_for_no_subscribers(mcp, "data://counter")
+            assert proxy._remote_subscriptions == {}
+
+    async def test_subscribe_to_unknown_resource(self, mcp: FlashMCP):
+        main = FlashMCP()
+        main.mount("proxy", FlashMCP.as_proxy(mcp))
+
+        async with Client(main) as client:
+            with pytest.raises(McpError, match="Unknown resource"):
+                await client.subscribe_resource("data://proxy/missing")
+            with pytest.raises(McpError, match="Unknown resource"):
+                await client.subscribe_resource("data://missing")
@@ -12,6 +12,7 @@ from FlashMCP import Client, FlashMCP
 from FlashMCP.exceptions import NotFoundError
 from FlashMCP.server.server import (
     MountedServer,
+    MountIndex,
     add_resource_prefix,
     has_resource_prefix,
     remove_resource_prefix,
@@ -1000,6 +1001,51 @@ class TestResourcePrefixMounting:
         # Test stripping
         assert mounted.strip_resource_prefix(uri) == expected_strip
 
+    @pytest.mark.parametrize(
+        "uri,expected",
+        [
+            ("resource://prefix/path/to/resource", "resource://path/to/resource"),
+            ("resource://prefix//absolute/path", "resource:///absolute/path"),
+            ("resource://other/path/to/resource", None),
+            ("http://prefix/example.com", "http://example.com"),
+            ("resource://prefix", None),
+            ("not-a-uri", None),
+        ],
+    )
+    def test_mount_index_resolves_path_prefixes(self, uri, expected):
+        mounted = MountedServer(
+            prefix="prefix", server=FlashMCP(resource_prefix_format="path")
+        )
+        index = MountIndex([mounted])
+
+        resolved = index.resolve_uri(uri)
+
+        if expected is None:
+            assert resolved is None
+        else:
+            assert resolved == (mounted, expected)
+
+    @pytest.mark.parametrize(
+        "uri,expected",
+        [
+            ("prefix+resource://path", "resource://path"),
+            ("other+resource://path", None),
+            ("resource://prefix/path", None),
+        ],
+    )
+    def test_mount_index_resolves_protocol_prefixes(self, uri, expected):
+        mounted = MountedServer(
+            prefix="prefix", server=FlashMCP(resource_prefix_format="protocol")
+        )
+        index = MountIndex([mounted])
+
+        resolved = index.resolve_uri(uri)
+
+        if expected is None:
+            assert resolved is None
+        else:
+            assert resolved == (mounted, expected)
+
     async def test_import_server_with_new_prefix_format(self):
         """Test that import_server correctly uses the new prefix format."""
         # Create a server with resources
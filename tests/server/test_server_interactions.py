@@ -783,6 +783,23 @@ class TestResource:
             assert isinstance(result[0], BlobResourceContents)
             assert result[0].blob == base64.b64encode(b"Binary file data").decode()
 
+    async def test_cached_resource(self):
+        mcp = FlashMCP()
+        calls = []
+
+        @mcp.resource("resource://cached", cache_ttl=60)
+        def get_data() -> str:
+            calls.append(1)
+            return "cached data"
+
+        async with Client(mcp) as client:
+            for _ in range(3):
+                result = await client.read_resource(AnyUrl("resource://cached"))
+                assert isinstance(result[0], TextResourceContents)
+                assert result[0].text == "cached data"
+
+        assert len(calls) == 1
+
 
 class TestResourceContext:
     async def test_resource_with_context_annotation_gets_context(self):
@@ -1081,6 +1098,22 @@ class TestResourceTemplates:
             assert isinstance(result[0], TextResourceContents)
             assert result[0].text == "Template resource 1: a/b"
 
+    async def test_template_function_called_once_per_read(self):
+        mcp = FlashMCP()
+        calls = []
+
+        @mcp.resource("resource://{name}/data")
+        def get_data(name: str) -> str:
+            calls.append(name)
+            return f"Data for {name}"
+
+        async with Client(mcp) as client:
+            result = await client.read_resource(AnyUrl("resource://test/data"))
+            assert isinstance(result[0], TextResourceContents)
+            assert result[0].text == "Data for test"
+
+        assert calls == ["test"]
+
 
 class TestResourceTemplateContext:
     async def test_resource_template_context(self):
@@ -153,6 +153,71 @@ class TestToolFromFunction:
             x: int = 10
 
 
+class TestToolCallPlan:
+    def test_plan_built_at_creation(self):
+        from FlashMCP import Context
+
+        async def fetch(url: str, limit: list[int], flag: bool, ctx: Context) -> str:
+            return url
+
+        tool = Tool.from_function(fetch)
+        plan = tool.call_plan
+
+        assert plan.context_kwarg == "ctx"
+        assert plan.json_parse_params == ("url", "limit")
+        assert plan.is_async
+
+    def test_plan_for_sync_function(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        plan = Tool.from_function(add).call_plan
+
+        assert plan.context_kwarg is None
+        assert plan.json_parse_params == ()
+        assert not plan.is_async
+
+    def test_plan_built_lazily_for_direct_construction(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        tool = Tool(
+            fn=add,
+            name="add",
+            description="",
+            parameters=Tool.from_function(add).parameters,
+        )
+        assert tool._call_plan is None
+        assert tool.call_plan.validate({"a": 1, "b": 2}) == 3
+        assert tool.call_plan is tool.call_plan
+
+    async def test_run_does_not_reflect(self, monkeypatch):
+        import inspect
+
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        tool = Tool.from_function(add)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("inspect.signature called during run")
+
+        monkeypatch.setattr(inspect, "signature", fail)
+        with temporary_settings(tool_attempt_parse_json_args=True):
+            result = await tool.run({"a": 1, "b": 2})
+        assert isinstance(result[0], TextContent)
+        assert result[0].text == "3"
+
+    def test_plan_not_part_of_equality(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        tool = Tool.from_function(add)
+        other = Tool(**tool.model_dump())
+        assert other._call_plan is None
+        assert tool == other
+
+
 class TestLegacyToolJsonParsing:
     """Tests for Tool's JSON pre-parsing functionality."""
 
@@ -1,15 +1,26 @@
 import json
 import logging
+import os
+import threading
+import time
 import uuid
-from typing import Annotated, Any
+from collections.abc import AsyncIterator
+from typing import Annotated, Any, cast
 
+import anyio
+import pydantic
 import pydantic_core
 import pytest
-from mcp.types import ImageContent, TextContent
-from pydantic import BaseModel
-
-from FlashMCP import Context, FlashMCP, Image
-from FlashMCP.exceptions import NotFoundError, ToolError
+from mcp.types import ImageContent, TextContent, ToolAnnotations
+from pydantic import BaseModel, Field
+
+from FlashMCP import Client, Context, FlashMCP, Image
+from FlashMCP.exceptions import (
+    NotFoundError,
+    ToolError,
+    ToolRejectedError,
+    ToolTimeoutError,
+)
 from FlashMCP.tools import ToolManager
 from FlashMCP.tools.tool import Tool
 from FlashMCP.utilities.tests import temporary_settings
@@ -514,6 +525,757 @@ class TestCallTools:
         assert result[0].text == pydantic_core.to_json(uuid_result).decode()
 
 
+def process_id() -> int:
+    return os.getpid()
+
+
+def sum_of_squares(n: int, offset: Annotated[int, Field(ge=0)] = 0) -> int:
+    return sum(i * i for i in range(n)) + offset
+
+
+def make_image() -> Image:
+    return Image(data=b"fake png data")
+
+
+def process_with_context(x: int, ctx: Context) -> str:
+    return str(x)
+
+
+class TestToolExecution:
+    def test_invalid_execution(self):
+        with pytest.raises(ValueError, match="Invalid execution"):
+            ToolManager(execution="fork")  # type: ignore
+
+    async def test_inline_runs_on_event_loop_thread(self):
+        def which_thread() -> int:
+            return threading.get_ident()
+
+        manager = ToolManager()
+        manager.add_tool_from_fn(which_thread)
+        result = await manager.call_tool("which_thread", {})
+        assert isinstance(result[0], TextContent)
+        assert int(result[0].text) == threading.get_ident()
+
+    async def test_thread_runs_in_worker_thread(self):
+        def which_thread() -> int:
+            return threading.get_ident()
+
+        manager = ToolManager(execution="thread")
+        manager.add_tool_from_fn(which_thread)
+        result = await manager.call_tool("which_thread", {})
+        assert isinstance(result[0], TextContent)
+        assert int(result[0].text) != threading.get_ident()
+        assert manager.executor.stats.calls == 1
+
+    async def test_per_tool_override(self):
+        def which_thread() -> int:
+            return threading.get_ident()
+
+        manager = ToolManager(execution="thread")
+        manager.add_tool_from_fn(which_thread, execution="inline")
+        result = await manager.call_tool("which_thread", {})
+        assert isinstance(result[0], TextContent)
+        assert int(result[0].text) == threading.get_ident()
+        assert manager.executor.stats.calls == 0
+
+    async def test_async_tools_always_inline(self):
+        async def which_thread() -> int:
+            return threading.get_ident()
+
+        manager = ToolManager(execution="thread")
+        manager.add_tool_from_fn(which_thread, execution="thread")
+        result = await manager.call_tool("which_thread", {})
+        assert isinstance(result[0], TextContent)
+        assert int(result[0].text) == threading.get_ident()
+
+    async def test_thread_tool_does_not_block_event_loop(self):
+        def blocking() -> str:
+            time.sleep(0.2)
+            return "done"
+
+        async def fast() -> str:
+            return "fast"
+
+        manager = ToolManager(execution="thread")
+        manager.add_tool_from_fn(blocking)
+        manager.add_tool_from_fn(fast)
+
+        finished: list[str] = []
+
+        async def call(key: str):
+            await manager.call_tool(key, {})
+            finished.append(key)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(call, "blocking")
+            await anyio.sleep(0.01)
+            tg.start_soon(call, "fast")
+
+        assert finished == ["fast", "blocking"]
+
+    async def test_thread_limit_queues_calls(self):
+        def blocking() -> str:
+            time.sleep(0.05)
+            return "done"
+
+        manager = ToolManager(execution="thread", thread_limit=1)
+        manager.add_tool_from_fn(blocking)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(manager.call_tool, "blocking", {})
+            await anyio.sleep(0.01)
+            assert manager.executor.stats.queue_depth == 2
+            assert manager.executor.stats.running == 1
+
+        stats = manager.executor.stats
+        assert stats.calls == 3
+        assert stats.queue_depth == 0
+        assert stats.max_wait_seconds >= 0.05
+
+    async def test_thread_tool_with_context(self):
+        def tool_with_context(x: int, ctx: Context) -> str:
+            assert isinstance(ctx, Context)
+            return str(x)
+
+        manager = ToolManager(execution="thread")
+        manager.add_tool_from_fn(tool_with_context)
+
+        mcp = FlashMCP()
+        with Context(FlashMCP=mcp):
+            result = await manager.call_tool("tool_with_context", {"x": 42})
+        assert isinstance(result[0], TextContent)
+        assert result[0].text == "42"
+
+    async def test_server_execution_policy(self):
+        mcp = FlashMCP(tool_execution="thread", tool_thread_limit=2)
+
+        @mcp.tool()
+        def which_thread() -> int:
+            return threading.get_ident()
+
+        @mcp.tool(execution="inline")
+        def inline_thread() -> int:
+            return threading.get_ident()
+
+        assert mcp._tool_manager.executor.limiter.total_tokens == 2
+        result = await mcp._mcp_call_tool("which_thread", {})
+        assert isinstance(result[0], TextContent)
+        assert int(result[0].text) != threading.get_ident()
+        result = await mcp._mcp_call_tool("inline_thread", {})
+        assert isinstance(result[0], TextContent)
+        assert int(result[0].text) == threading.get_ident()
+
+
+@pytest.mark.timeout(15)
+class TestProcessExecution:
+    @pytest.fixture(scope="class")
+    def manager(self):
+        manager = ToolManager(execution="process", process_workers=1)
+        manager.add_tool_from_fn(process_id)
+        manager.add_tool_from_fn(sum_of_squares)
+        manager.add_tool_from_fn(make_image)
+        yield manager
+        manager.executor.shutdown()
+
+    async def test_runs_in_persistent_worker_process(self, manager: ToolManager):
+        result = await manager.call_tool("process_id", {})
+        assert isinstance(result[0], TextContent)
+        assert int(result[0].text) != os.getpid()
+
+        second = await manager.call_tool("process_id", {})
+        assert isinstance(second[0], TextContent)
+        assert second[0].text == result[0].text
+
+    async def test_validates_in_parent(self, manager: ToolManager):
+        calls = manager.executor.process_stats.calls
+
+        result = await manager.call_tool("sum_of_squares", {"n": "4"})
+        assert isinstance(result[0], TextContent)
+        assert result[0].text == "14"
+
+        with pytest.raises(ToolError):
+            await manager.call_tool("sum_of_squares", {"n": 4, "offset": -1})
+        # invalid arguments never reach the pool
+        assert manager.executor.process_stats.calls == calls + 1
+
+    async def test_converts_in_parent(self, manager: ToolManager):
+        result = await manager.call_tool("make_image", {})
+        assert isinstance(result[0], ImageContent)
+
+    def test_rejects_unpicklable_functions(self):
+        def local_fn(x: int) -> int:
+            return x
+
+        manager = ToolManager(execution="process")
+        with pytest.raises(ValueError, match="can not be pickled"):
+            manager.add_tool_from_fn(local_fn)
+
+    def test_rejects_context(self):
+        manager = ToolManager()
+        with pytest.raises(ValueError, match="requests a Context"):
+            manager.add_tool_from_fn(process_with_context, execution="process")
+
+    def test_ignored_duplicate_is_not_registered(self):
+        def local_fn(x: int) -> int:
+            return x
+
+        manager = ToolManager(execution="process", duplicate_behavior="ignore")
+        manager.add_tool_from_fn(sum_of_squares, name="tool")
+        # an unpicklable duplicate is dropped rather than rejected
+        manager.add_tool_from_fn(local_fn, name="tool")
+        assert manager.executor._process_modules == {sum_of_squares.__module__}
+
+    def test_rejected_replacement_keeps_existing_tool(self):
+        def local_fn(x: int) -> int:
+            return x
+
+        manager = ToolManager(execution="process", duplicate_behavior="replace")
+        manager.add_tool_from_fn(sum_of_squares, name="tool")
+        with pytest.raises(ValueError, match="can not be pickled"):
+            manager.add_tool_from_fn(local_fn, name="tool")
+        assert manager.get_tool("tool").fn is sum_of_squares
+
+
+class TestToolResultCache:
+    def make_counter(self):
+        calls = []
+
+        def lookup(x: int, label: str = "a") -> str:
+            calls.append((x, label))
+            return f"{label}{x}"
+
+        return lookup, calls
+
+    async def test_not_cached_by_default(self):
+        lookup, calls = self.make_counter()
+        manager = ToolManager()
+        manager.add_tool_from_fn(lookup)
+        await manager.call_tool("lookup", {"x": 1})
+        await manager.call_tool("lookup", {"x": 1})
+        assert len(calls) == 2
+        assert manager.cache_stats("lookup") is None
+
+    async def test_idempotent_tools_cached_by_default(self):
+        lookup, calls = self.make_counter()
+        manager = ToolManager()
+        manager.add_tool_from_fn(
+            lookup, annotations=ToolAnnotations(idempotentHint=True)
+        )
+        first = await manager.call_tool("lookup", {"x": 1})
+        second = await manager.call_tool("lookup", {"x": 1})
+        assert first == second
+        assert len(calls) == 1
+        stats = manager.cache_stats("lookup")
+        assert stats is not None
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.entries == 1
+        assert stats.size_bytes == len(pydantic_core.to_json(first))
+
+    async def test_cache_ttl_zero_disables_idempotent_cache(self):
+        lookup, calls = self.make_counter()
+        manager = ToolManager()
+        manager.add_tool_from_fn(
+            lookup, annotations=ToolAnnotations(idempotentHint=True), cache_ttl=0
+        )
+        await manager.call_tool("lookup", {"x": 1})
+        await manager.call_tool("lookup", {"x": 1})
+        assert len(calls) == 2
+
+    async def test_key_uses_validated_arguments(self):
+        lookup, calls = self.make_counter()
+        manager = ToolManager()
+        manager.add_tool_from_fn(lookup, cache_ttl=60)
+        await manager.call_tool("lookup", {"x": 1})
+        await manager.call_tool("lookup", {"x": "1"})
+        await manager.call_tool("lookup", {"label": "a", "x": 1})
+        await manager.call_tool("lookup", {"x": 2})
+        assert calls == [(1, "a"), (2, "a")]
+
+    async def test_cache_expires(self):
+        lookup, calls = self.make_counter()
+        manager = ToolManager()
+        manager.add_tool_from_fn(lookup, cache_ttl=0.01)
+        await manager.call_tool("lookup", {"x": 1})
+        await anyio.sleep(0.02)
+        await manager.call_tool("lookup", {"x": 1})
+        assert len(calls) == 2
+
+    async def test_cache_max_entries(self):
+        lookup, calls = self.make_counter()
+        manager = ToolManager()
+        manager.add_tool_from_fn(lookup, cache_ttl=60, cache_max_entries=1)
+        await manager.call_tool("lookup", {"x": 1})
+        await manager.call_tool("lookup", {"x": 2})
+        await manager.call_tool("lookup", {"x": 1})
+        assert len(calls) == 3
+        stats = manager.cache_stats("lookup")
+        assert stats is not None
+        assert stats.evictions == 2
+
+    async def test_errors_are_not_cached(self):
+        calls = []
+
+        def flaky() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                raise ToolError("try again")
+            return "ok"
+
+        manager = ToolManager()
+        manager.add_tool_from_fn(flaky, cache_ttl=60)
+        with pytest.raises(ToolError):
+            await manager.call_tool("flaky", {})
+        assert await manager.call_tool("flaky", {}) == [
+            TextContent(type="text", text="ok")
+        ]
+        await manager.call_tool("flaky", {})
+        assert len(calls) == 2
+
+    async def test_invalidate_cache(self):
+        lookup, calls = self.make_counter()
+        manager = ToolManager()
+        manager.add_tool_from_fn(lookup, cache_ttl=60)
+        await manager.call_tool("lookup", {"x": 1})
+        await manager.call_tool("lookup", {"x": 2})
+
+        manager.invalidate_cache("lookup", {"x": "1"})
+        await manager.call_tool("lookup", {"x": 1})
+        await manager.call_tool("lookup", {"x": 2})
+        assert calls == [(1, "a"), (2, "a"), (1, "a")]
+
+        manager.invalidate_cache()
+        await manager.call_tool("lookup", {"x": 2})
+        assert calls[-1] == (2, "a")
+
+    async def test_replacing_tool_drops_cache(self):
+        manager = ToolManager(duplicate_behavior="replace")
+        manager.add_tool_from_fn(lambda: "old", name="value", cache_ttl=60)
+        await manager.call_tool("value", {})
+        manager.add_tool_from_fn(lambda: "new", name="value", cache_ttl=60)
+        assert await manager.call_tool("value", {}) == [
+            TextContent(type="text", text="new")
+        ]
+
+    def test_explicit_cache_rejects_context(self):
+        def tool_with_context(x: int, ctx: Context) -> str:
+            return str(x)
+
+        manager = ToolManager()
+        with pytest.raises(ValueError, match="requests a Context"):
+            manager.add_tool_from_fn(tool_with_context, cache_ttl=60)
+
+
+class TestCallCoalescing:
+    async def test_concurrent_identical_calls_share_execution(self):
+        calls = []
+
+        async def slow_lookup(x: int) -> int:
+            calls.append(x)
+            await anyio.sleep(0.05)
+            return x * 2
+
+        manager = ToolManager()
+        manager.add_tool_from_fn(slow_lookup, coalesce=True)
+
+        results = []
+
+        async def call(arguments: dict[str, Any]):
+            results.append(await manager.call_tool("slow_lookup", arguments))
+
+        async with anyio.create_task_group() as tg:
+            for arguments in [{"x": 1}, {"x": "1"}, {"x": 1}, {"x": 2}]:
+                tg.start_soon(call, arguments)
+
+        assert sorted(calls) == [1, 2]
+        assert len(results) == 4
+        stats = manager.coalesce_stats("slow_lookup")
+        assert stats is not None
+        assert stats.executions == 2
+        assert stats.coalesced == 2
+        assert stats.in_flight == 0
+
+    async def test_sequential_calls_are_not_coalesced(self):
+        calls = []
+
+        def lookup(x: int) -> int:
+            calls.append(x)
+            return x
+
+        manager = ToolManager()
+        manager.add_tool_from_fn(lookup, coalesce=True)
+        await manager.call_tool("lookup", {"x": 1})
+        await manager.call_tool("lookup", {"x": 1})
+        assert calls == [1, 1]
+
+    async def test_coalesced_calls_share_errors(self):
+        calls = []
+
+        async def failing() -> None:
+            calls.append(1)
+            await anyio.sleep(0.05)
+            raise ValueError("backend unavailable")
+
+        manager = ToolManager()
+        manager.add_tool_from_fn(failing, coalesce=True)
+
+        errors = []
+
+        async def call():
+            try:
+                await manager.call_tool("failing", {})
+            except ToolError as e:
+                errors.append(e)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(call)
+
+        assert len(calls) == 1
+        assert len(errors) == 3
+
+    async def test_cancelled_call_is_rerun_by_waiters(self):
+        calls = []
+        started = anyio.Event()
+
+        async def slow() -> int:
+            calls.append(1)
+            started.set()
+            await anyio.sleep(0.05)
+            return len(calls)
+
+        manager = ToolManager()
+        manager.add_tool_from_fn(slow, coalesce=True)
+
+        results = []
+
+        async def waiter():
+            results.append(await manager.call_tool("slow", {}))
+
+        async with anyio.create_task_group() as tg:
+            async with anyio.create_task_group() as leader_tg:
+                leader_tg.start_soon(manager.call_tool, "slow", {})
+                await started.wait()
+                tg.start_soon(waiter)
+                await anyio.sleep(0.01)
+                leader_tg.cancel_scope.cancel()
+
+        assert len(calls) == 2
+        assert results == [[TextContent(type="text", text="2")]]
+
+    def test_coalesce_rejects_context(self):
+        def tool_with_context(x: int, ctx: Context) -> str:
+            return str(x)
+
+        manager = ToolManager()
+        with pytest.raises(ValueError, match="requests a Context"):
+            manager.add_tool_from_fn(tool_with_context, coalesce=True)
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+class TestConcurrencyLimits:
+    def make_blocking_tool(self):
+        release = anyio.Event()
+        running = []
+        peak = []
+
+        async def backend(x: int) -> int:
+            running.append(x)
+            peak.append(len(running))
+            await release.wait()
+            running.remove(x)
+            return x
+
+        return backend, release, peak
+
+    async def test_max_concurrency(self):
+        backend, release, peak = self.make_blocking_tool()
+        manager = ToolManager()
+        manager.add_tool_from_fn(backend, max_concurrency=2)
+
+        async with anyio.create_task_group() as tg:
+            for i in range(5):
+                tg.start_soon(manager.call_tool, "backend", {"x": i})
+            await anyio.sleep(0.05)
+
+            stats = manager.concurrency_stats("backend")
+            assert stats is not None
+            assert stats.running == 2
+            assert stats.queue_depth == 3
+            release.set()
+
+        assert max(peak) == 2
+        stats = manager.concurrency_stats("backend")
+        assert stats is not None
+        assert stats.admitted == 5
+        assert stats.running == 0
+        assert stats.queue_depth == 0
+
+    async def test_full_queue_rejects_immediately(self):
+        backend, release, _ = self.make_blocking_tool()
+        manager = ToolManager()
+        manager.add_tool_from_fn(backend, max_concurrency=1, max_queue=1)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(manager.call_tool, "backend", {"x": 1})
+            tg.start_soon(manager.call_tool, "backend", {"x": 2})
+            await anyio.sleep(0.05)
+
+            with anyio.fail_after(1):
+                with pytest.raises(ToolRejectedError, match="at capacity"):
+                    await manager.call_tool("backend", {"x": 3})
+            release.set()
+
+        stats = manager.concurrency_stats("backend")
+        assert stats is not None
+        assert stats.admitted == 2
+        assert stats.rejected == 1
+
+    async def test_queue_timeout(self):
+        backend, release, _ = self.make_blocking_tool()
+        manager = ToolManager()
+        manager.add_tool_from_fn(backend, max_concurrency=1, queue_timeout=0.05)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(manager.call_tool, "backend", {"x": 1})
+            await anyio.sleep(0.01)
+
+            with pytest.raises(ToolRejectedError):
+                await manager.call_tool("backend", {"x": 2})
+            release.set()
+
+        stats = manager.concurrency_stats("backend")
+        assert stats is not None
+        assert stats.timed_out == 1
+        assert stats.queue_depth == 0
+
+    def test_unlimited_tools_have_no_stats(self):
+        manager = ToolManager()
+        manager.add_tool_from_fn(add)
+        assert manager.concurrency_stats("add") is None
+
+    def test_queue_options_require_max_concurrency(self):
+        manager = ToolManager()
+        with pytest.raises(ValueError, match="without max_concurrency"):
+            manager.add_tool_from_fn(add, max_queue=10)
+
+    def test_max_concurrency_must_be_positive(self):
+        manager = ToolManager()
+        with pytest.raises(pydantic.ValidationError):
+            manager.add_tool_from_fn(add, max_concurrency=0)
+
+    async def test_rejection_is_returned_as_error(self):
+        mcp = FlashMCP()
+        release = anyio.Event()
+
+        @mcp.tool(max_concurrency=1, max_queue=0)
+        async def backend() -> str:
+            await release.wait()
+            return "done"
+
+        async with Client(mcp) as client:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(client.call_tool, "backend", {})
+                await anyio.sleep(0.05)
+                result = await client.call_tool_mcp("backend", {})
+                release.set()
+
+        assert result.isError
+        assert "at capacity" in cast(TextContent, result.content[0]).text
+
+
+class TestToolTimeouts:
+    async def test_async_tool_is_cancelled(self):
+        cancelled = []
+
+        async def hang() -> None:
+            try:
+                await anyio.sleep(10)
+            except anyio.get_cancelled_exc_class():
+                cancelled.append(True)
+                raise
+
+        manager = ToolManager()
+        manager.add_tool_from_fn(hang, timeout=0.05)
+        with anyio.fail_after(1):
+            with pytest.raises(ToolTimeoutError, match="timed out after 0.05"):
+                await manager.call_tool("hang", {})
+        assert cancelled == [True]
+        assert manager.timeout_count("hang") == 1
+
+    async def test_server_default_timeout(self):
+        async def hang() -> None:
+            await anyio.sleep(10)
+
+        manager = ToolManager(timeout=0.05)
+        manager.add_tool_from_fn(hang)
+        with pytest.raises(ToolTimeoutError):
+            await manager.call_tool("hang", {})
+
+    async def test_tool_timeout_overrides_default(self):
+        async def slowish() -> str:
+            await anyio.sleep(0.1)
+            return "done"
+
+        manager = ToolManager(timeout=0.01)
+        manager.add_tool_from_fn(slowish, timeout=1)
+        assert await manager.call_tool("slowish", {}) == [
+            TextContent(type="text", text="done")
+        ]
+        assert manager.timeout_count("slowish") == 0
+
+    async def test_threaded_tool_is_abandoned(self):
+        finished = threading.Event()
+
+        def blocking() -> None:
+            time.sleep(0.2)
+            finished.set()
+
+        manager = ToolManager()
+        manager.add_tool_from_fn(blocking, execution="thread", timeout=0.05)
+        start = time.perf_counter()
+        with pytest.raises(ToolTimeoutError):
+            await manager.call_tool("blocking", {})
+        assert time.perf_counter() - start < 0.15
+        assert not finished.is_set()
+        assert finished.wait(1)
+
+    async def test_tool_raising_timeout_error_is_not_a_timeout(self):
+        def fails() -> None:
+            raise TimeoutError("upstream timed out")
+
+        manager = ToolManager()
+        manager.add_tool_from_fn(fails, timeout=1)
+        with pytest.raises(ToolError) as exc_info:
+            await manager.call_tool("fails", {})
+        assert not isinstance(exc_info.value, ToolTimeoutError)
+        assert manager.timeout_count("fails") == 0
+
+    async def test_timeout_count_is_dropped_with_tool(self):
+        async def hang() -> None:
+            await anyio.sleep(10)
+
+        manager = ToolManager(duplicate_behavior="replace")
+        manager.add_tool_from_fn(hang, timeout=0.01)
+        with pytest.raises(ToolTimeoutError):
+            await manager.call_tool("hang", {})
+        assert manager.timeout_count("hang") == 1
+
+        manager.add_tool_from_fn(hang, timeout=0.01)
+        assert manager.timeout_count("hang") == 0
+
+        with pytest.raises(ToolTimeoutError):
+            await manager.call_tool("hang", {})
+        manager.remove_tool("hang")
+        assert manager.timeout_count("hang") == 0
+
+    async def test_timeout_is_returned_as_error(self):
+        mcp = FlashMCP(tool_timeout=0.05)
+
+        @mcp.tool()
+        async def hang() -> None:
+            await anyio.sleep(10)
+
+        async with Client(mcp) as client:
+            result = await client.call_tool_mcp("hang", {})
+
+        assert result.isError
+        assert "timed out" in cast(TextContent, result.content[0]).text
+
+
+class TestStreamingTools:
+    async def test_async_generator_tool(self):
+        async def rows(n: int) -> AsyncIterator[str]:
+            for i in range(n):
+                yield f"row {i}"
+
+        manager = ToolManager()
+        manager.add_tool_from_fn(rows)
+        assert manager.get_tool("rows").parameters["properties"] == {
+            "n": {"title": "N", "type": "integer"}
+        }
+        result = await manager.call_tool("rows", {"n": 3})
+        assert result == [
+            TextContent(type="text", text="row 0"),
+            TextContent(type="text", text="row 1"),
+            TextContent(type="text", text="row 2"),
+        ]
+
+    async def test_chunks_are_converted(self):
+        async def mixed() -> AsyncIterator[Any]:
+            yield {"a": 1}
+            yield Image(data=b"abc", format="png")
+
+        manager = ToolManager()
+        manager.add_tool_from_fn(mixed)
+        result = await manager.call_tool("mixed", {})
+        assert isinstance(result[0], TextContent)
+        assert json.loads(result[0].text) == {"a": 1}
+        assert isinstance(result[1], ImageContent)
+
+    async def test_final_result_is_bounded(self):
+        async def big() -> AsyncIterator[str]:
+            for _ in range(10):
+                yield "x" * 10
+
+        manager = ToolManager()
+        manager.add_tool_from_fn(big)
+        with temporary_settings(tool_stream_max_bytes=35):
+            result = await manager.call_tool("big", {})
+        assert len(result) == 4
+        assert all(item.text == "x" * 10 for item in result[:3])  # type: ignore[attr-defined]
+        assert isinstance(result[3], TextContent)
+        assert "7 of 10 chunks were omitted" in result[3].text
+
+    async def test_chunks_are_sent_as_progress(self):
+        mcp = FlashMCP()
+        first_chunk_received = anyio.Event()
+
+        @mcp.tool()
+        async def report() -> AsyncIterator[str]:
+            yield "header"
+            # the first chunk reaches the client before the tool finishes
+            await first_chunk_received.wait()
+            yield "body"
+
+        progress = []
+
+        async def progress_handler(
+            progress_value: float, total: float | None, message: str | None
+        ) -> None:
+            progress.append((progress_value, message))
+            first_chunk_received.set()
+
+        async with Client(mcp) as client:
+            with anyio.fail_after(5):
+                result = await client.call_tool(
+                    "report", {}, progress_handler=progress_handler
+                )
+
+        assert progress == [(1, "header"), (2, "body")]
+        assert [cast(TextContent, item).text for item in result] == [
+            "header",
+            "body",
+        ]
+
+    async def test_streaming_tool_timeout(self):
+        async def endless() -> AsyncIterator[int]:
+            i = 0
+            while True:
+                yield i
+                i += 1
+                await anyio.sleep(0.01)
+
+        manager = ToolManager()
+        manager.add_tool_from_fn(endless, timeout=0.05)
+        with pytest.raises(ToolTimeoutError):
+            await manager.call_tool("endless", {})
+
+
 class TestToolSchema:
     async def test_context_arg_excluded_from_schema(self):
         def something(a: int, ctx: Context) -> int:
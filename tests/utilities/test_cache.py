@@ -4,7 +4,7 @@ import datetime
 import time
 from unittest.mock import patch
 
-from FlashMCP.utilities.cache import TimedCache
+from FlashMCP.utilities.cache import LRUCache, TimedCache
 
 
 class TestTimedCache:
@@ -231,3 +231,92 @@ class TestTimedCache:
         # Check some random items
         for i in [0, 123, 456, 789, 999]:
             assert cache.get(f"key{i}") == f"value{i}"
+
+
+class TestLRUCache:
+    """Tests for the LRUCache class."""
+
+    def test_get_and_set(self):
+        cache = LRUCache()
+        cache.set("key", "value", size=5)
+        assert cache.get("key") == "value"
+        assert cache.get("missing") is LRUCache.NOT_FOUND
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.entries == 1
+        assert cache.stats.size_bytes == 5
+
+    def test_expiration(self):
+        cache = LRUCache(ttl=10)
+        with patch("time.monotonic", return_value=100.0):
+            cache.set("key", "value", size=5)
+        with patch("time.monotonic", return_value=109.0):
+            assert cache.get("key") == "value"
+        with patch("time.monotonic", return_value=111.0):
+            assert cache.get("key") is LRUCache.NOT_FOUND
+        assert len(cache) == 0
+        assert cache.stats.size_bytes == 0
+
+    def test_expiration_per_entry(self):
+        cache = LRUCache(ttl=10)
+        with patch("time.monotonic", return_value=100.0):
+            cache.set("short", "value", ttl=1)
+            cache.set("default", "value")
+        with patch("time.monotonic", return_value=105.0):
+            assert cache.get("short") is LRUCache.NOT_FOUND
+            assert cache.get("default") == "value"
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is LRUCache.NOT_FOUND
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_evicts_by_size(self):
+        cache = LRUCache(max_bytes=10)
+        cache.set("a", 1, size=4)
+        cache.set("b", 2, size=4)
+        cache.set("c", 3, size=4)
+        assert cache.get("a") is LRUCache.NOT_FOUND
+        assert cache.stats.size_bytes == 8
+
+    def test_entry_larger_than_max_bytes_is_not_cached(self):
+        cache = LRUCache(max_bytes=10)
+        cache.set("a", 1, size=4)
+        cache.set("b", 2, size=11)
+        assert cache.get("b") is LRUCache.NOT_FOUND
+        assert cache.get("a") == 1
+
+    def test_replace_updates_size(self):
+        cache = LRUCache()
+        cache.set("a", 1, size=4)
+        cache.set("a", 2, size=6)
+        assert cache.get("a") == 2
+        assert cache.stats.size_bytes == 6
+
+    def test_delete_and_clear(self):
+        cache = LRUCache()
+        cache.set("a", 1, size=4)
+        cache.set("b", 2, size=4)
+        assert cache.delete("a")
+        assert not cache.delete("a")
+        assert cache.stats.size_bytes == 4
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats.size_bytes == 0
+
+    def test_invalid_entry_is_dropped(self):
+        cache = LRUCache()
+        cache.set("a", ("v1", "contents"), size=4)
+        assert cache.get("a", valid=lambda entry: entry[0] == "v1") is not None
+        assert cache.get("a", valid=lambda entry: entry[0] == "v2") is (
+            LRUCache.NOT_FOUND
+        )
+        assert len(cache) == 0
+        assert cache.stats.size_bytes == 0
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
@@ -0,0 +1,37 @@
+from FlashMCP.prompts import Prompt
+from FlashMCP.resources import FunctionResource
+from FlashMCP.tools import Tool
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+class TestMCPObjectMemoization:
+    def test_conversion_is_reused(self):
+        tool = Tool.from_function(add)
+        assert tool.to_mcp_tool() is tool.to_mcp_tool()
+
+    def test_overrides_are_memoized_separately(self):
+        tool = Tool.from_function(add)
+        renamed = tool.to_mcp_tool(name="prefix_add")
+        assert renamed.name == "prefix_add"
+        assert tool.to_mcp_tool().name == "add"
+        assert tool.to_mcp_tool(name="prefix_add") is renamed
+
+    def test_assigning_field_rebuilds(self):
+        prompt = Prompt.from_function(lambda: "hi", name="hi")
+        first = prompt.to_mcp_prompt()
+        prompt.description = "Says hi"
+
+        second = prompt.to_mcp_prompt()
+        assert second is not first
+        assert second.description == "Says hi"
+
+    def test_copy_with_update_rebuilds(self):
+        resource = FunctionResource(uri="data://a", name="a", fn=lambda: "a")
+        resource.to_mcp_resource()
+
+        copied = resource.model_copy(update={"name": "b"})
+        assert copied.to_mcp_resource().name == "b"
+        assert resource.to_mcp_resource().name == "a"
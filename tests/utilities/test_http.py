@@ -0,0 +1,40 @@
+import httpx
+
+from FlashMCP.utilities.http import HttpPool, current_http_pool, use_http_pool
+from FlashMCP.utilities.tests import temporary_settings
+
+
+class TestHttpPool:
+    async def test_client_is_shared(self):
+        pool = HttpPool()
+        assert pool.client is pool.client
+        await pool.aclose()
+
+    async def test_closed_client_is_replaced(self):
+        pool = HttpPool()
+        client = pool.client
+        await pool.aclose()
+        assert client.is_closed
+        assert pool.client is not client
+        await pool.aclose()
+
+    async def test_client_uses_settings(self):
+        pool = HttpPool()
+        with temporary_settings(http_timeout=5.0):
+            assert pool.client.timeout == httpx.Timeout(5.0)
+        await pool.aclose()
+
+    async def test_given_client_is_not_closed(self):
+        client = httpx.AsyncClient()
+        pool = HttpPool(client)
+        assert pool.client is client
+        await pool.aclose()
+        assert not client.is_closed
+        await client.aclose()
+
+    def test_use_http_pool(self):
+        pool = HttpPool()
+        assert current_http_pool() is None
+        with use_http_pool(pool):
+            assert current_http_pool() is pool
+        assert current_http_pool() is None
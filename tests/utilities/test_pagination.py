@@ -0,0 +1,49 @@
+import pytest
+from mcp import McpError
+
+from FlashMCP.utilities.pagination import decode_cursor, encode_cursor, paginate
+
+
+class TestPaginate:
+    @pytest.fixture
+    def items(self) -> dict[str, int]:
+        return {"c": 3, "a": 1, "b": 2, "e": 5, "d": 4}
+
+    def test_no_pagination(self, items: dict[str, int]):
+        page, next_cursor = paginate(items, None, None)
+        assert page == list(items.items())
+        assert next_cursor is None
+
+    def test_pages_are_ordered_by_key(self, items: dict[str, int]):
+        page, next_cursor = paginate(items, None, 2)
+        assert page == [("a", 1), ("b", 2)]
+        page, next_cursor = paginate(items, next_cursor, 2)
+        assert page == [("c", 3), ("d", 4)]
+        page, next_cursor = paginate(items, next_cursor, 2)
+        assert page == [("e", 5)]
+        assert next_cursor is None
+
+    def test_exact_last_page_has_no_cursor(self, items: dict[str, int]):
+        page, next_cursor = paginate(items, None, 5)
+        assert len(page) == 5
+        assert next_cursor is None
+
+    def test_cursor_survives_changes(self, items: dict[str, int]):
+        _, next_cursor = paginate(items, None, 2)
+        del items["b"]
+        items["aa"] = 0
+        items["bb"] = 0
+        page, _ = paginate(items, next_cursor, 2)
+        assert page == [("bb", 0), ("c", 3)]
+
+    def test_cursor_without_page_size(self, items: dict[str, int]):
+        page, next_cursor = paginate(items, encode_cursor("c"), None)
+        assert page == [("d", 4), ("e", 5)]
+        assert next_cursor is None
+
+    def test_cursor_round_trip(self):
+        assert decode_cursor(encode_cursor("resource://a/ü")) == "resource://a/ü"
+
+    def test_invalid_cursor(self, items: dict[str, int]):
+        with pytest.raises(McpError, match="Invalid cursor"):
+            paginate(items, "not a cursor!", 2)
@@ -0,0 +1,149 @@
+"""Tests for the serialization.py module."""
+
+import json
+from typing import Any
+
+import pytest
+from mcp.types import TextContent, TextResourceContents
+from pydantic import AnyUrl, BaseModel
+
+from FlashMCP import Client, FlashMCP
+from FlashMCP.utilities.serialization import (
+    RawJSON,
+    compact_serializer,
+    get_serializer,
+    pretty_serializer,
+)
+from FlashMCP.utilities.tests import temporary_settings
+
+DATA = {"name": "widget", "tags": ["a", "b"], "size": 3}
+
+
+class Point(BaseModel):
+    x: int
+    y: int
+
+
+class TestGetSerializer:
+    def test_profiles(self):
+        assert get_serializer("pretty") is pretty_serializer
+        assert get_serializer("compact") is compact_serializer
+        assert compact_serializer(DATA) == json.dumps(DATA, separators=(",", ":"))
+        assert pretty_serializer(DATA) == json.dumps(DATA, indent=2)
+
+    def test_defaults_to_setting(self):
+        assert get_serializer() is pretty_serializer
+        with temporary_settings(serialization="compact"):
+            assert get_serializer() is compact_serializer
+
+    def test_pydantic_models(self):
+        assert compact_serializer(Point(x=1, y=2)) == '{"x":1,"y":2}'
+
+    def test_invalid_profile(self):
+        with pytest.raises(ValueError, match="Invalid serialization"):
+            get_serializer("tiny")  # type: ignore[arg-type]
+
+    def test_custom_encoder_returning_bytes(self):
+        def encoder(data: Any) -> bytes:
+            return json.dumps(data, sort_keys=True).encode()
+
+        serializer = get_serializer(encoder)
+        assert serializer({"b": 1, "a": 2}) == '{"a": 2, "b": 1}'
+
+
+class TestRawJSON:
+    def test_text(self):
+        assert RawJSON('{"a": 1}').text == '{"a": 1}'
+        assert RawJSON(b'{"a": 1}').text == '{"a": 1}'
+
+
+class TestServerSerialization:
+    @pytest.fixture
+    def server(self):
+        def build(**kwargs: Any) -> FlashMCP:
+            mcp = FlashMCP(**kwargs)
+
+            @mcp.tool()
+            def data_tool() -> dict:
+                return DATA
+
+            @mcp.tool()
+            def raw_tool() -> RawJSON:
+                return RawJSON(b'{"already":  "encoded"}')
+
+            @mcp.prompt()
+            def data_prompt() -> list:
+                return [DATA]
+
+            @mcp.resource("data://static")
+            def data_resource() -> dict:
+                return DATA
+
+            @mcp.resource("data://{name}")
+            def data_template(name: str) -> dict:
+                return {"name": name}
+
+            @mcp.resource("data://raw")
+            def raw_resource() -> RawJSON:
+                return RawJSON('{"already":  "encoded"}')
+
+            return mcp
+
+        return build
+
+    async def test_pretty_by_default(self, server):
+        async with Client(server()) as client:
+            result = await client.call_tool("data_tool", {})
+        assert isinstance(result[0], TextContent)
+        assert result[0].text == json.dumps(DATA, indent=2)
+
+    async def test_compact_profile(self, server):
+        compact = json.dumps(DATA, separators=(",", ":"))
+        async with Client(server(serialization="compact")) as client:
+            tool_result = await client.call_tool("data_tool", {})
+            prompt_result = await client.get_prompt("data_prompt")
+            resource_result = await client.read_resource(AnyUrl("data://static"))
+            template_result = await client.read_resource(AnyUrl("data://thing"))
+
+        assert isinstance(tool_result[0], TextContent)
+        assert tool_result[0].text == compact
+        content = prompt_result.messages[0].content
+        assert isinstance(content, TextContent)
+        assert content.text == compact
+        assert isinstance(resource_result[0], TextResourceContents)
+        assert resource_result[0].text == compact
+        assert isinstance(template_result[0], TextResourceContents)
+        assert template_result[0].text == '{"name":"thing"}'
+
+    async def test_compact_setting(self, server):
+        with temporary_settings(serialization="compact"):
+            async with Client(server()) as client:
+                result = await client.call_tool("data_tool", {})
+        assert isinstance(result[0], TextContent)
+        assert result[0].text == json.dumps(DATA, separators=(",", ":"))
+
+    async def test_custom_encoder(self, server):
+        def encoder(data: Any) -> bytes:
+            return json.dumps(data, sort_keys=True).encode()
+
+        async with Client(server(serialization=encoder)) as client:
+            result = await client.call_tool("data_tool", {})
+        assert isinstance(result[0], TextContent)
+        assert result[0].text == json.dumps(DATA, sort_keys=True)
+
+    async def test_tool_serializer_takes_precedence(self, server):
+        mcp = server(serialization="compact", tool_serializer=lambda data: "custom")
+        async with Client(mcp) as client:
+            result = await client.call_tool("data_tool", {})
+        assert isinstance(result[0], TextContent)
+        assert result[0].text == "custom"
+
+    async def test_raw_json_passthrough(self, server):
+        async with Client(server(serialization="compact")) as client:
+            tool_result = await client.call_tool("raw_tool", {})
+            resource_result = await client.read_resource(AnyUrl("data://raw"))
+
+        assert isinstance(tool_result[0], TextContent)
+        assert tool_result[0].text == '{"already":  "encoded"}'
+        assert isinstance(resource_result[0], TextResourceContents)
+        assert resource_result[0].text == '{"already":  "encoded"}'
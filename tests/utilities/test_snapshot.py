@@ -0,0 +1,165 @@
+import importlib
+import json
+import logging
+import sys
+import textwrap
+
+import pytest
+
+from FlashMCP import Context, FlashMCP
+from FlashMCP.exceptions import ToolError
+from FlashMCP.utilities.snapshot import CatalogueSnapshot, fingerprint
+
+
+def add(a: int, b: int = 2) -> int:
+    return a + b
+
+
+def greet(name: str, ctx: Context) -> str:
+    return f"Hello, {name}!"
+
+
+def build_server(path) -> FlashMCP:
+    mcp = FlashMCP(catalogue_snapshot=path)
+    mcp.tool()(add)
+    mcp.resource("greeting://{name}")(greet)
+    mcp.prompt()(greet)
+    return mcp
+
+
+class TestCatalogueSnapshot:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "catalogue.json"
+        schema = {"type": "object", "properties": {"a": {"type": "integer"}}}
+        CatalogueSnapshot.save(path, [("tools", "add", add, schema)])
+
+        snapshot = CatalogueSnapshot(path)
+        assert snapshot.parameters("tools", "add", add) == schema
+        assert snapshot.parameters("tools", "other", add) is None
+        assert snapshot.parameters("prompts", "add", add) is None
+
+    def test_entry_for_other_function_is_ignored(self, tmp_path):
+        path = tmp_path / "catalogue.json"
+        CatalogueSnapshot.save(path, [("tools", "add", add, {"type": "object"})])
+
+        def other_add(a: int, b: int) -> int:
+            return a + b
+
+        snapshot = CatalogueSnapshot(path)
+        assert snapshot.parameters("tools", "add", other_add) is None
+
+    def test_file_is_read_on_first_lookup(self, tmp_path):
+        path = tmp_path / "catalogue.json"
+        snapshot = CatalogueSnapshot(path)
+        CatalogueSnapshot.save(path, [("tools", "add", add, {"type": "object"})])
+
+        assert snapshot.parameters("tools", "add", add) == {"type": "object"}
+
+    def test_missing_file(self, tmp_path):
+        snapshot = CatalogueSnapshot(tmp_path / "missing.json")
+        assert snapshot.parameters("tools", "add", add) is None
+
+    def test_corrupt_file_is_ignored(self, tmp_path, caplog):
+        path = tmp_path / "catalogue.json"
+        path.write_text("{not json")
+
+        with caplog.at_level(logging.WARNING):
+            assert CatalogueSnapshot(path).parameters("tools", "add", add) is None
+        assert "unreadable catalogue snapshot" in caplog.text
+
+    def test_other_version_is_ignored(self, tmp_path):
+        path = tmp_path / "catalogue.json"
+        CatalogueSnapshot.save(path, [("tools", "add", add, {"type": "object"})])
+        data = json.loads(path.read_text())
+        data["version"] = 0
+        path.write_text(json.dumps(data))
+
+        assert CatalogueSnapshot(path).parameters("tools", "add", add) is None
+
+    def test_changed_source_is_stale(self, tmp_path, monkeypatch, caplog):
+        module = tmp_path / "snapshot_tools.py"
+        module.write_text("def double(x: int) -> int:\n    return 2 * x\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "snapshot_tools", raising=False)
+        fn = importlib.import_module("snapshot_tools").double
+
+        path = tmp_path / "catalogue.json"
+        CatalogueSnapshot.save(path, [("tools", "double", fn, {"type": "object"})])
+        assert CatalogueSnapshot(path).parameters("tools", "double", fn) is not None
+
+        module.write_text(
+            textwrap.dedent(
+                """
+                def double(x: int) -> int:
+                    '''Double a number.'''
+                    return 2 * x
+                """
+            )
+        )
+        with caplog.at_level(logging.WARNING):
+            assert CatalogueSnapshot(path).parameters("tools", "double", fn) is None
+        assert "stale catalogue snapshot" in caplog.text
+
+    def test_fingerprint_includes_signature(self):
+        def add(a: int, b: str = "2") -> int:
+            return a
+
+        assert fingerprint(add) != fingerprint(globals()["add"])
+        assert "add(a: int, b: str = '2') -> int" in fingerprint(add)
+
+
+class TestServerSnapshot:
+    async def test_save_and_load(self, tmp_path):
+        path = tmp_path / "catalogue.json"
+        original = build_server(path)
+        original.save_catalogue_snapshot()
+
+        mcp = build_server(path)
+        assert (await mcp.get_tools())["add"].parameters == (
+            await original.get_tools()
+        )["add"].parameters
+        assert (await mcp.get_resource_templates())["greeting://{name}"].parameters == (
+            await original.get_resource_templates()
+        )["greeting://{name}"].parameters
+        assert await mcp._mcp_list_prompts() == await original._mcp_list_prompts()
+
+    async def test_tool_call_plan_is_built_on_first_call(self, tmp_path):
+        path = tmp_path / "catalogue.json"
+        build_server(path).save_catalogue_snapshot()
+
+        mcp = build_server(path)
+        tool = (await mcp.get_tools())["add"]
+        assert tool._call_plan is None
+
+        result = await mcp._mcp_call_tool("add", {"a": "1"})
+        assert result[0].text == "3"  # type: ignore[attr-defined]
+        assert tool._call_plan is not None
+
+    async def test_loaded_components_are_still_validated(self, tmp_path):
+        path = tmp_path / "catalogue.json"
+        build_server(path).save_catalogue_snapshot()
+
+        mcp = build_server(path)
+        with pytest.raises(ToolError):
+            await mcp._mcp_call_tool("add", {"a": "one"})
+
+    async def test_components_missing_from_snapshot(self, tmp_path):
+        path = tmp_path / "catalogue.json"
+        FlashMCP().save_catalogue_snapshot(path)
+
+        mcp = build_server(path)
+        tool = (await mcp.get_tools())["add"]
+        assert tool.parameters["required"] == ["a"]
+
+    async def test_save_to_path(self, tmp_path):
+        mcp = build_server(None)
+        mcp.save_catalogue_snapshot(tmp_path / "catalogue.json")
+
+        snapshot = CatalogueSnapshot(tmp_path / "catalogue.json")
+        assert snapshot.parameters("tools", "add", add) is not None
+        assert snapshot.parameters("resource_templates", "greeting://{name}", greet)
+        assert snapshot.parameters("prompts", "greet", greet) is not None
+
+    def test_save_without_path(self):
+        with pytest.raises(ValueError, match="path is required"):
+            FlashMCP().save_catalogue_snapshot()
@@ -1,10 +1,13 @@
 import base64
 from typing import Annotated, Any
+from unittest.mock import Mock
 
 import pytest
 
+from FlashMCP.utilities.tests import temporary_settings
 from FlashMCP.utilities.types import (
     Image,
+    _base64_encode_file,
     find_kwarg_by_type,
     is_class_member_of_type,
     issubclass_safe,
@@ -200,6 +203,50 @@ class TestImage:
         with pytest.raises(ValueError, match="No image data available"):
             img.to_image_content()
 
+    def test_large_file_is_encoded_correctly(self, tmp_path):
+        data = bytes(range(256)) * 50_000 + b"tail"
+        img_path = tmp_path / "large.png"
+        img_path.write_bytes(data)
+
+        content = Image(path=img_path).to_image_content()
+        assert content.data == base64.b64encode(data).decode()
+
+    def test_empty_file(self, tmp_path):
+        img_path = tmp_path / "empty.png"
+        img_path.write_bytes(b"")
+        assert Image(path=img_path).to_image_content().data == ""
+
+    def test_file_encoding_is_cached(self, tmp_path, monkeypatch):
+        img_path = tmp_path / "cached.png"
+        img_path.write_bytes(b"first")
+
+        encode = Mock(wraps=_base64_encode_file)
+        monkeypatch.setattr("FlashMCP.utilities.types._base64_encode_file", encode)
+
+        Image(path=img_path).to_image_content()
+        Image(path=img_path).to_image_content()
+        assert encode.call_count == 1
+
+        # a change to the file invalidates the cached encoding
+        img_path.write_bytes(b"second!")
+        content = Image(path=img_path).to_image_content()
+        assert encode.call_count == 2
+        assert content.data == base64.b64encode(b"second!").decode()
+
+    def test_max_size(self, tmp_path, monkeypatch):
+        img_path = tmp_path / "big.png"
+        img_path.write_bytes(b"x" * 100)
+
+        encode = Mock(wraps=_base64_encode_file)
+        monkeypatch.setattr("FlashMCP.utilities.types._base64_encode_file", encode)
+
+        with temporary_settings(image_max_bytes=99):
+            with pytest.raises(ValueError, match="Image is too large"):
+                Image(path=img_path).to_image_content()
+            with pytest.raises(ValueError, match="Image is too large"):
+                Image(data=b"x" * 100).to_image_content()
+        assert encode.call_count == 0
+
 
 class TestFindKwargByType:
     def test_exact_type_match(self):